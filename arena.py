@@ -0,0 +1,365 @@
+"""
+Flat AST arena: the nodes of a whole source live in parallel `array` columns instead of Python objects.
+Entry i of the arena is a node with a kind, the index of its first child node and of its next sibling (-1 when
+missing), the offset of its field record in Arena.fields (Arena.records) and the offset of its first token (-1 when unknown).
+Entries are laid out in pre-order, so a scan over a column visits the whole tree front to back.
+The field record holds one code per field of the node in the order of __slots__: the index of a token value,
+MISSING for None, CHILD for the next child node, or LIST_CODE - n for a list followed by the codes of its n items.
+Only nodes take an entry, token values, missing fields and lists cost one int in the record of their parent
+"""
+import array
+
+import ast_nodes
+import fast_lexer
+import lexer
+import yacc
+
+LIST = len(ast_nodes.NODE_CLASSES)  # Kind of a list of nodes, e.g. the statements of a block
+NONE = LIST + 1  # Kind of a missing field
+VALUE = LIST + 2  # Kind of a token value, stored in Arena.values
+KIND_NAMES = ast_nodes.KIND_NAMES + ('List', 'None', 'Value')
+
+MISSING = -1  # Field code of None
+CHILD = -2  # Field code of a node, the next entry in the chain of children
+LIST_CODE = -3  # Field code of an empty list, a list of n items is LIST_CODE - n
+
+
+class Arena:
+    """
+    AST stored in parallel columns, entry 0 is the list of top-level statements
+    """
+
+    def __init__(self):
+        self.kinds = array.array('B')
+        self.first_child = array.array('i')
+        self.next_sibling = array.array('i')
+        self.records = array.array('i')  # Offsets of the field records in fields
+        self.starts = array.array('i')
+        self.fields = array.array('i')  # Field records of the entries
+        self.values = []  # Distinct token values
+        self.value_ids = {}  # (type, value) -> index in values
+        self.statements = array.array('i')  # Codes of the top-level statements until finish()
+        self.last_statement = -1
+        self._add(LIST, 0)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _add(self, kind, start):
+        self.kinds.append(kind)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.records.append(-1)
+        self.starts.append(start)
+        return len(self.kinds) - 1
+
+    def _token(self, value):
+        key = (type(value), value)
+        token = self.value_ids.get(key)
+        if token is None:
+            token = self.value_ids[key] = len(self.values)
+            self.values.append(value)
+        return token
+
+    def add(self, node):
+        """
+        Method stores an AST subtree in the arena
+        :param node: AST node
+        :return: index of the subtree root
+        """
+        index = self._add(node.kind, node.pos)
+        codes = []
+        self._encode([getattr(node, name) for name in node.__slots__], codes, index, -1)
+        self.records[index] = len(self.fields)
+        self.fields.extend(codes)
+        return index
+
+    def _encode(self, values, codes, parent, previous):
+        for value in values:
+            if isinstance(value, ast_nodes.Node):
+                child = self.add(value)
+                if previous < 0:
+                    self.first_child[parent] = child
+                else:
+                    self.next_sibling[previous] = child
+                previous = child
+                codes.append(CHILD)
+            elif isinstance(value, list):
+                codes.append(LIST_CODE - len(value))
+                previous = self._encode(value, codes, parent, previous)
+            else:
+                codes.append(MISSING if value is None else self._token(value))
+        return previous
+
+    def add_statement(self, value):
+        """
+        Method appends a top-level statement to the root list
+        :param value: AST of the statement
+        :return: index of the statement, -1 for a token value
+        """
+        if not isinstance(value, ast_nodes.Node):
+            self.statements.append(MISSING if value is None else self._token(value))
+            return -1
+        index = self.add(value)
+        if self.last_statement < 0:
+            self.first_child[0] = index
+            self.starts[0] = self.starts[index]
+        else:
+            self.next_sibling[self.last_statement] = index
+        self.last_statement = index
+        self.statements.append(CHILD)
+        return index
+
+    def finish(self):
+        """
+        Method writes the field record of the root list once all the top-level statements are added
+        :return: arena
+        """
+        self.records[0] = len(self.fields)
+        self.fields.append(LIST_CODE - len(self.statements))
+        self.fields.extend(self.statements)
+        self.statements = None
+        return self
+
+    def _skip(self, offset, child):
+        """
+        Method moves past the codes of one field
+        :param offset: offset of the field code
+        :param child: index of the next child node
+        :return: (offset of the next field code, index of the next child node)
+        """
+        code = self.fields[offset]
+        offset += 1
+        if code == CHILD:
+            child = self.next_sibling[child]
+        elif code <= LIST_CODE:
+            for _ in range(LIST_CODE - code):
+                offset, child = self._skip(offset, child)
+        return offset, child
+
+    @property
+    def root(self):
+        return Cursor(self, 0)
+
+    def find(self, kind):
+        """
+        Method finds all the nodes of a kind in pre-order
+        :param kind: kind code or class from ast_nodes
+        :return: iterator over cursors
+        """
+        if isinstance(kind, type):
+            kind = kind.kind
+        kinds = self.kinds
+        index = -1
+        try:
+            while True:
+                index = kinds.index(kind, index + 1)
+                yield Cursor(self, index)
+        except ValueError:
+            return
+
+    def to_ast(self, index=0):
+        """
+        Method materializes a subtree as ast_nodes objects
+        :param index: index of the subtree root
+        :return: AST
+        """
+        kind = self.kinds[index]
+        count = 1 if kind == LIST else len(ast_nodes.NODE_CLASSES[kind].__slots__)
+        values, _, _ = self._decode(self.records[index], count, self.first_child[index])
+        if kind == LIST:
+            return values[0]
+        return ast_nodes.NODE_CLASSES[kind](self.starts[index], *values)
+
+    def _decode(self, offset, count, child):
+        """
+        Method materializes the values of consecutive field codes
+        :param offset: offset of the first field code
+        :param count: number of fields
+        :param child: index of the next child node
+        :return: (list of values, offset of the next field code, index of the next child node)
+        """
+        values = []
+        for _ in range(count):
+            code = self.fields[offset]
+            offset += 1
+            if code >= 0:
+                values.append(self.values[code])
+            elif code == MISSING:
+                values.append(None)
+            elif code == CHILD:
+                values.append(self.to_ast(child))
+                child = self.next_sibling[child]
+            else:
+                items, offset, child = self._decode(offset, LIST_CODE - code, child)
+                values.append(items)
+        return values, offset, child
+
+    def nbytes(self):
+        """
+        Method counts the bytes taken by the columns and the field records, the table of values is not counted
+        :return: number of bytes
+        """
+        columns = (self.kinds, self.first_child, self.next_sibling, self.records, self.starts, self.fields)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def numpy_columns(self):
+        """
+        Method exposes the columns as NumPy arrays sharing memory with the arena, NumPy must be installed
+        :return: dict column name -> numpy.ndarray
+        """
+        import numpy
+        return {name: numpy.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode)
+                for name in ('kinds', 'first_child', 'next_sibling', 'records', 'starts', 'fields')}
+
+
+class Cursor:
+    """
+    Position in an Arena, cheap to create and to move: a node entry, or the field code at offset code when it is not -1,
+    then index is the next child node at that position
+    """
+    __slots__ = ('arena', 'index', 'code')
+
+    def __init__(self, arena, index, code=-1):
+        self.arena = arena
+        self.index = index
+        self.code = code
+
+    def __repr__(self):
+        return 'Cursor(%d, %s)' % (self.index, self.kind_name)
+
+    @property
+    def kind(self):
+        if self.code < 0:
+            return self.arena.kinds[self.index]
+        code = self.arena.fields[self.code]
+        return VALUE if code >= 0 else NONE if code == MISSING else LIST
+
+    @property
+    def kind_name(self):
+        return KIND_NAMES[self.kind]
+
+    @property
+    def pos(self):
+        """Offset of the first token, of the first item for a list"""
+        arena = self.arena
+        if self.code < 0:
+            return arena.starts[self.index]
+        offset = self.code
+        while arena.fields[offset] < LIST_CODE:  # Down to the first item of non-empty lists
+            offset += 1
+        return arena.starts[self.index] if arena.fields[offset] == CHILD else -1
+
+    @property
+    def value(self):
+        """Token value of a VALUE field, None otherwise"""
+        code = self.arena.fields[self.code] if self.code >= 0 else -1
+        return None if code < 0 else self.arena.values[code]
+
+    def _codes(self):
+        """
+        Method finds the field codes of the children
+        :return: (offset of the first code, number of children, index of the first child node)
+        """
+        arena = self.arena
+        if self.code >= 0:
+            return self.code + 1, max(LIST_CODE - arena.fields[self.code], 0), self.index
+        kind = arena.kinds[self.index]
+        offset = arena.records[self.index]
+        if kind == LIST:
+            return offset + 1, LIST_CODE - arena.fields[offset], arena.first_child[self.index]
+        return offset, len(ast_nodes.NODE_CLASSES[kind].__slots__), arena.first_child[self.index]
+
+    def children(self):
+        """
+        Method iterates over the children: the fields of a node or the items of a list
+        :return: iterator over cursors
+        """
+        arena = self.arena
+        offset, count, child = self._codes()
+        for _ in range(count):
+            yield Cursor(arena, child) if arena.fields[offset] == CHILD else Cursor(arena, child, offset)
+            offset, child = arena._skip(offset, child)
+
+    def field(self, name):
+        """
+        Method moves to a field of a node
+        :param name: name of the field in the node class
+        :return: cursor
+        """
+        arena = self.arena
+        offset, _, child = self._codes()
+        for _ in range(ast_nodes.NODE_CLASSES[self.kind].__slots__.index(name)):
+            offset, child = arena._skip(offset, child)
+        return Cursor(arena, child) if arena.fields[offset] == CHILD else Cursor(arena, child, offset)
+
+    def walk(self):
+        """
+        Method iterates over the subtree in pre-order
+        :return: iterator over cursors
+        """
+        stack = [self]
+        while stack:
+            cursor = stack.pop()
+            yield cursor
+            stack.extend(reversed(list(cursor.children())))
+
+    def to_ast(self):
+        if self.code < 0:
+            return self.arena.to_ast(self.index)
+        return self.arena._decode(self.code, 1, self.index)[0][0]
+
+
+def _move_statement(p):
+    p.parser.arena.add_statement(p[0].pop())
+
+
+def build_arena_parser():
+    """
+    Method creates a parser that moves every top-level statement into parser.arena as soon as it is reduced,
+    so only the objects of one statement are alive at a time
+    :return: parser
+    """
+    return yacc.on_top_level_statement(yacc.build_offset_parser(), _move_statement)
+
+
+def parse_string(data, parser=None):
+    """
+    Method parses source code into an arena
+    :param data: source code
+    :param parser: parser made by build_arena_parser, a new one by default
+    :return: Arena
+    """
+    lex = lexer.build_lexer()
+    lex.input(data)
+    return _parse(lex, parser)
+
+
+def parse_file(path, encoding='utf8', parser=None):
+    """
+    Method parses a memory-mapped source file into an arena, neither the source nor the whole tree of node objects
+    is ever held in memory; offsets are byte offsets
+    :param path: path to the source file
+    :param encoding: encoding of the file
+    :param parser: parser made by build_arena_parser, a new one by default
+    :return: Arena
+    """
+    if not fast_lexer.supported():  # MmapLexer does not know every rule of lexer.py, offsets are in characters
+        with open(path, 'r', encoding=encoding, newline='') as file:
+            return parse_string(file.read(), parser)
+    source = fast_lexer.open_source(path)
+    lex = fast_lexer.MmapLexer(encoding=encoding)
+    lex.input(source)
+    try:
+        return _parse(lex, parser)
+    finally:
+        if hasattr(source, 'close'):
+            source.close()
+
+
+def _parse(lex, parser):
+    parser = parser or build_arena_parser()
+    parser.arena = Arena()
+    parser.parse(lexer=lex, tracking=True)
+    arena, parser.arena = parser.arena.finish(), None
+    return arena
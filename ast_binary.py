@@ -0,0 +1,326 @@
+"""
+Versioned binary AST format.
+Run `python ast_binary.py <source> <target>` to convert between out.txt JSON and the binary format,
+the direction is chosen by the extension of the target (.sast is binary).
+
+File layout, all numbers little-endian:
+    header   b'SAST', u16 version, u16 number of kinds, u32 offset of the string table, u32 offset of the root
+    kinds    u16 length + UTF-8 name of every node class, in the order of the kind codes
+    records  the AST, one record per value
+    strings  u32 count, then u32 length + UTF-8 bytes of every distinct string
+
+A record starts with a tag byte. Tags below LIST are node kinds: u32 payload length, i32 offset of the first token,
+then the records of the fields. LIST has u32 payload length, u32 item count and the item records.
+Strings are u32 indices into the string table, so identifiers are stored once.
+Lengths let a reader skip a subtree without decoding it, which is what Record does over an mmap
+"""
+import json
+import mmap
+import struct
+import sys
+
+import ast_json
+import ast_nodes
+
+MAGIC = b'SAST'
+VERSION = 1
+
+LIST = 255
+NONE = 254
+STRING = 253
+INT = 252
+FLOAT = 251
+TRUE = 250
+FALSE = 249
+BIG_INT = 248  # Integer outside of i64, stored as a decimal string
+
+_HEADER = struct.Struct('<4sHHII')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_NODE = struct.Struct('<Ii')  # Payload length, offset of the first token
+_LIST = struct.Struct('<II')  # Payload length, item count
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_FIXED_SIZES = {NONE: 1, STRING: 5, INT: 9, FLOAT: 9, TRUE: 1, FALSE: 1, BIG_INT: 5}
+
+
+def dumps(ast):
+    """
+    Method encodes an AST in the binary format
+    :param ast: AST
+    :return: bytes
+    """
+    out = bytearray(_HEADER.size)
+    for name in ast_nodes.KIND_NAMES:
+        name = name.encode('utf8')
+        out += _U16.pack(len(name)) + name
+    strings = []
+    string_ids = {}
+
+    def string(value):
+        index = string_ids.get(value)
+        if index is None:
+            index = string_ids[value] = len(strings)
+            strings.append(value)
+        return _U32.pack(index)
+
+    def write(value):
+        if isinstance(value, ast_nodes.Node):
+            start = len(out)
+            out.append(value.kind)
+            out.extend(_NODE.pack(0, value.pos))
+            for name in value.__slots__:
+                write(getattr(value, name))
+            _NODE.pack_into(out, start + 1, len(out) - start - 1 - _NODE.size, value.pos)
+        elif isinstance(value, list):
+            start = len(out)
+            out.append(LIST)
+            out.extend(_LIST.pack(0, len(value)))
+            for item in value:
+                write(item)
+            _U32.pack_into(out, start + 1, len(out) - start - 1 - _LIST.size)
+        elif isinstance(value, str):
+            out.append(STRING)
+            out.extend(string(value))
+        elif value is None:
+            out.append(NONE)
+        elif value is True:
+            out.append(TRUE)
+        elif value is False:
+            out.append(FALSE)
+        elif isinstance(value, int):
+            if -2 ** 63 <= value < 2 ** 63:
+                out.append(INT)
+                out.extend(_I64.pack(value))
+            else:
+                out.append(BIG_INT)
+                out.extend(string(str(value)))
+        elif isinstance(value, float):
+            out.append(FLOAT)
+            out.extend(_F64.pack(value))
+        else:
+            raise TypeError('Cannot encode %s in the binary AST' % type(value).__name__)
+
+    root = len(out)
+    write(ast)
+    table = len(out)
+    out += _U32.pack(len(strings))
+    for value in strings:
+        value = value.encode('utf8', 'surrogatepass')
+        out += _U32.pack(len(value)) + value
+    _HEADER.pack_into(out, 0, MAGIC, VERSION, len(ast_nodes.KIND_NAMES), table, root)
+    return bytes(out)
+
+
+def dump(ast, path):
+    """
+    Method writes an AST to a binary file
+    :param ast: AST
+    :param path: path to the file
+    """
+    with open(path, 'wb') as file:
+        file.write(dumps(ast))
+
+
+class BinaryAST:
+    """
+    Binary AST over bytes or a memory-mapped file, records are decoded only when they are visited
+    """
+
+    def __init__(self, data):
+        magic, version, kind_count, table, root = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a binary AST')
+        if version != VERSION:
+            raise ValueError('Binary AST version %d is not supported, expected %d' % (version, VERSION))
+        self.data = data
+        self.root_offset = root
+        self.classes = []  # Kind code in the file -> node class, kinds are matched by name
+        offset = _HEADER.size
+        for _ in range(kind_count):
+            length, = _U16.unpack_from(data, offset)
+            name = bytes(data[offset + 2:offset + 2 + length]).decode('utf8')
+            self.classes.append(ast_nodes.CLASSES_BY_NAME[name])
+            offset += 2 + length
+        self.string_offsets = []
+        count, = _U32.unpack_from(data, table)
+        offset = table + 4
+        for _ in range(count):
+            self.string_offsets.append(offset + 4)
+            offset += 4 + _U32.unpack_from(data, offset)[0]
+        self.strings = {}  # Decoded strings by index
+
+    @classmethod
+    def open(cls, path):
+        """
+        Method maps a binary AST file into memory
+        :param path: path to the file
+        :return: BinaryAST
+        """
+        with open(path, 'rb') as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def string(self, index):
+        value = self.strings.get(index)
+        if value is None:
+            offset = self.string_offsets[index]
+            length, = _U32.unpack_from(self.data, offset - 4)
+            value = self.strings[index] = bytes(self.data[offset:offset + length]).decode('utf8', 'surrogatepass')
+        return value
+
+    @property
+    def root(self):
+        return Record(self, self.root_offset)
+
+    def load(self, offset=None):
+        """
+        Method materializes a subtree as ast_nodes objects
+        :param offset: offset of the record, the root by default
+        :return: AST
+        """
+        return self._load(self.root_offset if offset is None else offset)[0]
+
+    def _load(self, offset):
+        data = self.data
+        tag = data[offset]
+        if tag == LIST:
+            _, count = _LIST.unpack_from(data, offset + 1)
+            offset += 1 + _LIST.size
+            items = []
+            for _ in range(count):
+                item, offset = self._load(offset)
+                items.append(item)
+            return items, offset
+        if tag < BIG_INT:
+            cls = self.classes[tag]
+            _, pos = _NODE.unpack_from(data, offset + 1)
+            offset += 1 + _NODE.size
+            fields = []
+            for _ in cls.__slots__:
+                field, offset = self._load(offset)
+                fields.append(field)
+            return cls(pos, *fields), offset
+        if tag == STRING:
+            return self.string(_U32.unpack_from(data, offset + 1)[0]), offset + 5
+        if tag == NONE:
+            return None, offset + 1
+        if tag == INT:
+            return _I64.unpack_from(data, offset + 1)[0], offset + 9
+        if tag == FLOAT:
+            return _F64.unpack_from(data, offset + 1)[0], offset + 9
+        if tag == TRUE:
+            return True, offset + 1
+        if tag == FALSE:
+            return False, offset + 1
+        return int(self.string(_U32.unpack_from(data, offset + 1)[0])), offset + 5
+
+
+def record_size(data, offset):
+    """
+    Method finds the size of a record without decoding it
+    :param data: binary AST
+    :param offset: offset of the record
+    :return: size in bytes
+    """
+    tag = data[offset]
+    if tag == LIST:
+        return 1 + _LIST.size + _U32.unpack_from(data, offset + 1)[0]
+    if tag < BIG_INT:
+        return 1 + _NODE.size + _U32.unpack_from(data, offset + 1)[0]
+    return _FIXED_SIZES[tag]
+
+
+class Record:
+    """
+    View of one record of a BinaryAST, nothing below it is decoded until asked for
+    """
+    __slots__ = ('ast', 'offset')
+
+    def __init__(self, ast, offset):
+        self.ast = ast
+        self.offset = offset
+
+    def __repr__(self):
+        return 'Record(%d, %s)' % (self.offset, self.kind_name)
+
+    @property
+    def tag(self):
+        return self.ast.data[self.offset]
+
+    @property
+    def kind_name(self):
+        tag = self.tag
+        if tag < BIG_INT:
+            return self.ast.classes[tag].__name__
+        return {LIST: 'List', NONE: 'None'}.get(tag, 'Value')
+
+    @property
+    def pos(self):
+        """Offset of the first token of a node, None for other records"""
+        if self.tag >= BIG_INT:
+            return None
+        return _NODE.unpack_from(self.ast.data, self.offset + 1)[1]
+
+    def __len__(self):
+        tag = self.tag
+        if tag == LIST:
+            return _LIST.unpack_from(self.ast.data, self.offset + 1)[1]
+        if tag < BIG_INT:
+            return len(self.ast.classes[tag].__slots__)
+        return 0
+
+    def children(self):
+        """
+        Method iterates over the fields of a node or the items of a list
+        :return: iterator over records
+        """
+        data = self.ast.data
+        offset = self.offset + 1 + (_LIST.size if self.tag == LIST else _NODE.size)
+        for _ in range(len(self)):
+            yield Record(self.ast, offset)
+            offset += record_size(data, offset)
+
+    def field(self, name):
+        """
+        Method moves to a field of a node
+        :param name: name of the field in the node class
+        :return: record
+        """
+        index = self.ast.classes[self.tag].__slots__.index(name)
+        for number, child in enumerate(self.children()):
+            if number == index:
+                return child
+
+    def load(self):
+        """
+        Method materializes the record
+        :return: AST
+        """
+        return self.ast.load(self.offset)
+
+
+def load(path):
+    """
+    Method reads an AST from a binary file
+    :param path: path to the file
+    :return: AST
+    """
+    with open(path, 'rb') as file:
+        return BinaryAST(file.read()).load()
+
+
+def convert(source, target):
+    """
+    Method converts between the JSON AST written by yacc.parse() and the binary format
+    :param source: path to the JSON or binary file
+    :param target: path to the written file, binary when it ends with .sast, JSON otherwise
+    """
+    if target.endswith('.sast'):
+        with ast_json.open_input(source) as file:
+            dump(ast_nodes.from_data(json.load(file)), target)
+    else:
+        ast_json.dump(load(source), target, indent=4)
+
+
+if __name__ == '__main__':
+    convert(sys.argv[1], sys.argv[2])
@@ -0,0 +1,116 @@
+"""
+Streaming JSON serialization of the AST.
+Nodes are written one piece at a time to any object with a write() method, so no JSON string of the whole tree
+is ever built. The output has the same shape as json.dumps(ast_nodes.to_data(ast))
+"""
+import gzip
+import json.encoder
+
+import ast_nodes
+
+_encode_string = json.encoder.encode_basestring_ascii
+
+
+def _encode_float(value):
+    if value != value:
+        return 'NaN'
+    if value == float('inf'):
+        return 'Infinity'
+    if value == -float('inf'):
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+def _encode_scalar(value):
+    if isinstance(value, str):
+        return _encode_string(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    raise TypeError('Object of type %s is not JSON serializable' % type(value).__name__)
+
+
+def write_json(ast, file, indent=None):
+    """
+    Method writes an AST as JSON piece by piece
+    :param ast: AST
+    :param file: text file, socket file (socket.makefile('w')) or any object with write()
+    :param indent: number of spaces per level, compact output without whitespace by default
+    """
+    write = file.write
+    if indent is None:
+        item_separator, key_separator = ',', ':'
+    else:
+        item_separator, key_separator = ',', ': '
+
+    def newline(level):
+        return '' if indent is None else '\n' + ' ' * (indent * level)
+
+    def write_value(value, level):
+        if isinstance(value, ast_nodes.Node):
+            inner = newline(level + 1)
+            write('{' + inner + '"kind"' + key_separator + _encode_string(ast_nodes.KIND_NAMES[value.kind]))
+            write(item_separator + inner + '"pos"' + key_separator + _encode_scalar(value.pos))
+            for name in value.__slots__:
+                write(item_separator + inner + '"' + name + '"' + key_separator)
+                write_value(getattr(value, name), level + 1)
+            write(newline(level) + '}')
+        elif isinstance(value, list):
+            if not value:
+                write('[]')
+                return
+            inner = newline(level + 1)
+            separator = '['
+            for item in value:
+                write(separator + inner)
+                write_value(item, level + 1)
+                separator = item_separator
+            write(newline(level) + ']')
+        else:
+            write(_encode_scalar(value))
+
+    write_value(ast, 0)
+
+
+def open_output(path, compress=None):
+    """
+    Method opens a text file for JSON output
+    :param path: path to the file
+    :param compress: gzip the output, by default only when the path ends with .gz
+    :return: file object
+    """
+    if compress is None:
+        compress = path.endswith('.gz')
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf8')
+    return open(path, 'w', encoding='utf8')
+
+
+def open_input(path):
+    """
+    Method opens a JSON file written by dump, gzipped when the path ends with .gz
+    :param path: path to the file
+    :return: file object
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf8')
+    return open(path, encoding='utf8')
+
+
+def dump(ast, path, indent=None, compress=None):
+    """
+    Method writes an AST as JSON to a file
+    :param ast: AST
+    :param path: path to the file
+    :param indent: number of spaces per level, compact output by default
+    :param compress: gzip the output, by default only when the path ends with .gz
+    """
+    with open_output(path, compress) as file:
+        write_json(ast, file, indent)
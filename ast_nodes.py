@@ -0,0 +1,579 @@
+"""
+AST node classes built by the parser actions in yacc.py.
+Every node stores the offset of its first token in `pos`, its kind is a small integer shared by the class.
+Lines and columns are not stored, line_index.LineIndex finds them from the offset when they are needed.
+Tokens are stored as plain values (str, int, float), repetitions as lists and missing parts as None
+"""
+
+
+class Node:
+    __slots__ = ('pos',)
+    kind = None  # Index in NODE_CLASSES, set below
+
+    def __eq__(self, other):
+        # Compares the structure, positions are ignored
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ', '.join('%s=%r' % (name, getattr(self, name)) for name in self.__slots__)
+        return '%s(%s)' % (type(self).__name__, values)
+
+
+class GlobalConstant(Node):
+    """Global const declaration"""
+    __slots__ = ('decl',)
+
+    def __init__(self, pos, decl):
+        self.pos = pos
+        self.decl = decl
+
+
+class Import(Node):
+    """Import of a module or a file"""
+    __slots__ = ('path',)
+
+    def __init__(self, pos, path):
+        self.pos = pos
+        self.path = path
+
+
+class ModulePath(Node):
+    """Dotted module path"""
+    __slots__ = ('name',)
+
+    def __init__(self, pos, name):
+        self.pos = pos
+        self.name = name
+
+
+class Pragma(Node):
+    """Pragma statement"""
+    __slots__ = ('name', 'value')
+
+    def __init__(self, pos, name, value):
+        self.pos = pos
+        self.name = name
+        self.value = value
+
+
+class FuncHeader(Node):
+    """Func name(args) (extra_args)"""
+    __slots__ = ('name', 'args', 'extra_args')
+
+    def __init__(self, pos, name, args, extra_args):
+        self.pos = pos
+        self.name = name
+        self.args = args
+        self.extra_args = extra_args
+
+
+class TypeParams(Node):
+    """<T, U> type parameters"""
+    __slots__ = ('names',)
+
+    def __init__(self, pos, names):
+        self.pos = pos
+        self.names = names
+
+
+class FormalArgs(Node):
+    """Parenthesized list of formal arguments"""
+    __slots__ = ('args',)
+
+    def __init__(self, pos, args):
+        self.pos = pos
+        self.args = args
+
+
+class FormalArg(Node):
+    """Name: Type, variadic is '...' or None"""
+    __slots__ = ('name', 'type', 'variadic')
+
+    def __init__(self, pos, name, type, variadic):
+        self.pos = pos
+        self.name = name
+        self.type = type
+        self.variadic = variadic
+
+
+class FuncDefn(Node):
+    """Func header -> { body }"""
+    __slots__ = ('header', 'body')
+
+    def __init__(self, pos, header, body):
+        self.pos = pos
+        self.header = header
+        self.body = body
+
+
+class AppFuncDefn(Node):
+    """App func header { body }"""
+    __slots__ = ('header', 'body')
+
+    def __init__(self, pos, header, body):
+        self.pos = pos
+        self.header = header
+        self.body = body
+
+
+class AppBody(Node):
+    """Arguments and @stdin/@stdout/@stderr redirections of an app function"""
+    __slots__ = ('args', 'outputs')
+
+    def __init__(self, pos, args, outputs):
+        self.pos = pos
+        self.args = args
+        self.outputs = outputs
+
+
+class AppOutput(Node):
+    """@stream = value"""
+    __slots__ = ('stream', 'value')
+
+    def __init__(self, pos, stream, value):
+        self.pos = pos
+        self.stream = stream
+        self.value = value
+
+
+class AppArg(Node):
+    """Argument of an app function, at is '@' or None"""
+    __slots__ = ('value', 'at')
+
+    def __init__(self, pos, value, at):
+        self.pos = pos
+        self.value = value
+        self.at = at
+
+
+class ForeignFuncDefn(Node):
+    """Function implemented in another language"""
+    __slots__ = ('header', 'body')
+
+    def __init__(self, pos, header, body):
+        self.pos = pos
+        self.header = header
+        self.body = body
+
+
+class ForeignFuncBody(Node):
+    """String literals of a foreign function"""
+    __slots__ = ('strings', 'literal')
+
+    def __init__(self, pos, strings, literal):
+        self.pos = pos
+        self.strings = strings
+        self.literal = literal
+
+
+class VarDecl(Node):
+    """Type name ... declaration"""
+    __slots__ = ('type', 'rest')
+
+    def __init__(self, pos, type, rest):
+        self.pos = pos
+        self.type = type
+        self.rest = rest
+
+
+class VarDeclRest(Node):
+    """Declared variable with its type suffix, mapping and initial value"""
+    __slots__ = ('name', 'suffix', 'mapping', 'value')
+
+    def __init__(self, pos, name, suffix, mapping, value):
+        self.pos = pos
+        self.name = name
+        self.suffix = suffix
+        self.mapping = mapping
+        self.value = value
+
+
+class ParamType(Node):
+    """Type<param>"""
+    __slots__ = ('name', 'param')
+
+    def __init__(self, pos, name, param):
+        self.pos = pos
+        self.name = name
+        self.param = param
+
+
+class StandaloneType(Node):
+    """Type with array suffixes"""
+    __slots__ = ('prefix', 'suffix')
+
+    def __init__(self, pos, prefix, suffix):
+        self.pos = pos
+        self.prefix = prefix
+        self.suffix = suffix
+
+
+class VarMapping(Node):
+    """<value> mapping of a variable"""
+    __slots__ = ('value',)
+
+    def __init__(self, pos, value):
+        self.pos = pos
+        self.value = value
+
+
+class Initializer(Node):
+    """= value in a declaration"""
+    __slots__ = ('value',)
+
+    def __init__(self, pos, value):
+        self.pos = pos
+        self.value = value
+
+
+class Block(Node):
+    """{ statements }"""
+    __slots__ = ('statements',)
+
+    def __init__(self, pos, statements):
+        self.pos = pos
+        self.statements = statements
+
+
+class StmtChain(Node):
+    """Statements joined with ; or ->"""
+    __slots__ = ('first', 'separator', 'next')
+
+    def __init__(self, pos, first, separator, next):
+        self.pos = pos
+        self.first = first
+        self.separator = separator
+        self.next = next
+
+
+class ChainableStmt(Node):
+    """First statement of a chain"""
+    __slots__ = ('stmt',)
+
+    def __init__(self, pos, stmt):
+        self.pos = pos
+        self.stmt = stmt
+
+
+class Assignment(Node):
+    """Targets = value or targets += value"""
+    __slots__ = ('targets', 'op', 'value')
+
+    def __init__(self, pos, targets, op, value):
+        self.pos = pos
+        self.targets = targets
+        self.op = op
+        self.value = value
+
+
+class Update(Node):
+    """Name<key> := value"""
+    __slots__ = ('name', 'key', 'value')
+
+    def __init__(self, pos, name, key, value):
+        self.pos = pos
+        self.name = name
+        self.key = key
+        self.value = value
+
+
+class If(Node):
+    """If (condition) { body } else { orelse }"""
+    __slots__ = ('condition', 'body', 'orelse')
+
+    def __init__(self, pos, condition, body, orelse):
+        self.pos = pos
+        self.condition = condition
+        self.body = body
+        self.orelse = orelse
+
+
+class Else(Node):
+    """Else { body }"""
+    __slots__ = ('body',)
+
+    def __init__(self, pos, body):
+        self.pos = pos
+        self.body = body
+
+
+class Switch(Node):
+    """Switch (value) { cases default }"""
+    __slots__ = ('value', 'cases', 'default')
+
+    def __init__(self, pos, value, cases, default):
+        self.pos = pos
+        self.value = value
+        self.cases = cases
+        self.default = default
+
+
+class Case(Node):
+    """Case value: body"""
+    __slots__ = ('value', 'body')
+
+    def __init__(self, pos, value, body):
+        self.pos = pos
+        self.value = value
+        self.body = body
+
+
+class Default(Node):
+    """Default: body"""
+    __slots__ = ('body',)
+
+    def __init__(self, pos, body):
+        self.pos = pos
+        self.body = body
+
+
+class Wait(Node):
+    """Wait deep (values) { body }"""
+    __slots__ = ('deep', 'values', 'body')
+
+    def __init__(self, pos, deep, values, body):
+        self.pos = pos
+        self.deep = deep
+        self.values = values
+        self.body = body
+
+
+class Foreach(Node):
+    """Foreach name, index in iterable { body }"""
+    __slots__ = ('name', 'index', 'iterable', 'body')
+
+    def __init__(self, pos, name, index, iterable, body):
+        self.pos = pos
+        self.name = name
+        self.index = index
+        self.iterable = iterable
+        self.body = body
+
+
+class For(Node):
+    """For (init; condition; update) { body }"""
+    __slots__ = ('init', 'condition', 'update', 'body')
+
+    def __init__(self, pos, init, condition, update, body):
+        self.pos = pos
+        self.init = init
+        self.condition = condition
+        self.update = update
+        self.body = body
+
+
+class While(Node):
+    """While (condition) { body }"""
+    __slots__ = ('condition', 'body')
+
+    def __init__(self, pos, condition, body):
+        self.pos = pos
+        self.condition = condition
+        self.body = body
+
+
+class ForInit(Node):
+    """Type name = value in a for loop"""
+    __slots__ = ('type', 'name', 'suffix', 'value')
+
+    def __init__(self, pos, type, name, suffix, value):
+        self.pos = pos
+        self.type = type
+        self.name = name
+        self.suffix = suffix
+        self.value = value
+
+
+class ForAssignment(Node):
+    """Name = value in a for loop"""
+    __slots__ = ('name', 'value')
+
+    def __init__(self, pos, name, value):
+        self.pos = pos
+        self.name = name
+        self.value = value
+
+
+class Iterate(Node):
+    """Iterate name { body } until (condition)"""
+    __slots__ = ('name', 'body', 'condition')
+
+    def __init__(self, pos, name, body, condition):
+        self.pos = pos
+        self.name = name
+        self.body = body
+        self.condition = condition
+
+
+class BinaryOp(Node):
+    """Left op right"""
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, pos, op, left, right):
+        self.pos = pos
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+class UnaryOp(Node):
+    """Op operand"""
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, pos, op, operand):
+        self.pos = pos
+        self.op = op
+        self.operand = operand
+
+
+class Postfix(Node):
+    """Value[index] or value.member"""
+    __slots__ = ('value', 'accessor')
+
+    def __init__(self, pos, value, accessor):
+        self.pos = pos
+        self.value = value
+        self.accessor = accessor
+
+
+class Index(Node):
+    """[value] subscript"""
+    __slots__ = ('value',)
+
+    def __init__(self, pos, value):
+        self.pos = pos
+        self.value = value
+
+
+class Member(Node):
+    """.name subscript"""
+    __slots__ = ('name',)
+
+    def __init__(self, pos, name):
+        self.pos = pos
+        self.name = name
+
+
+class FuncCall(Node):
+    """Name(args)"""
+    __slots__ = ('name', 'args')
+
+    def __init__(self, pos, name, args):
+        self.pos = pos
+        self.name = name
+        self.args = args
+
+
+class Tuple(Node):
+    """(item, item, ...)"""
+    __slots__ = ('items',)
+
+    def __init__(self, pos, items):
+        self.pos = pos
+        self.items = items
+
+
+class ArrayList(Node):
+    """[items]"""
+    __slots__ = ('items',)
+
+    def __init__(self, pos, items):
+        self.pos = pos
+        self.items = items
+
+
+class ArrayRange(Node):
+    """[start:stop:step]"""
+    __slots__ = ('start', 'stop', 'step')
+
+    def __init__(self, pos, start, stop, step):
+        self.pos = pos
+        self.start = start
+        self.stop = stop
+        self.step = step
+
+
+class ArrayKV(Node):
+    """{key: value, ...}"""
+    __slots__ = ('items',)
+
+    def __init__(self, pos, items):
+        self.pos = pos
+        self.items = items
+
+
+class KeyValue(Node):
+    """Key: value"""
+    __slots__ = ('key', 'value')
+
+    def __init__(self, pos, key, value):
+        self.pos = pos
+        self.key = key
+        self.value = value
+
+
+class KeywordArg(Node):
+    """Name = value argument"""
+    __slots__ = ('name', 'value')
+
+    def __init__(self, pos, name, value):
+        self.pos = pos
+        self.name = name
+        self.value = value
+
+
+class Lval(Node):
+    """Assignment target with subscripts"""
+    __slots__ = ('name', 'subscripts')
+
+    def __init__(self, pos, name, subscripts):
+        self.pos = pos
+        self.name = name
+        self.subscripts = subscripts
+
+
+NODE_CLASSES = (
+    GlobalConstant, Import, ModulePath, Pragma, FuncHeader, TypeParams, FormalArgs, FormalArg, FuncDefn,
+    AppFuncDefn, AppBody, AppOutput, AppArg, ForeignFuncDefn, ForeignFuncBody, VarDecl, VarDeclRest, ParamType,
+    StandaloneType, VarMapping, Initializer, Block, StmtChain, ChainableStmt, Assignment, Update, If, Else, Switch,
+    Case, Default, Wait, Foreach, For, While, ForInit, ForAssignment, Iterate, BinaryOp, UnaryOp, Postfix, Index,
+    Member, FuncCall, Tuple, ArrayList, ArrayRange, ArrayKV, KeyValue, KeywordArg, Lval,
+)
+KIND_NAMES = tuple(cls.__name__ for cls in NODE_CLASSES)
+CLASSES_BY_NAME = dict(zip(KIND_NAMES, NODE_CLASSES))
+for _kind, _cls in enumerate(NODE_CLASSES):
+    _cls.kind = _kind
+
+
+def to_data(value):
+    """
+    Method converts an AST into JSON compatible data, nodes become dicts with 'kind' and 'pos' keys
+    :param value: AST
+    :return: dicts, lists and plain values
+    """
+    if isinstance(value, Node):
+        data = {'kind': KIND_NAMES[value.kind], 'pos': value.pos}
+        for name in value.__slots__:
+            data[name] = to_data(getattr(value, name))
+        return data
+    if isinstance(value, list):
+        return [to_data(item) for item in value]
+    return value
+
+
+def from_data(data):
+    """
+    Method converts data made by to_data back into an AST
+    :param data: dicts, lists and plain values
+    :return: AST
+    """
+    if isinstance(data, dict):
+        cls = CLASSES_BY_NAME[data['kind']]
+        return cls(data['pos'], *[from_data(data[name]) for name in cls.__slots__])
+    if isinstance(data, list):
+        return [from_data(item) for item in data]
+    return data
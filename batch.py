@@ -0,0 +1,183 @@
+"""
+Parsing of many source files in worker processes.
+Run `python batch.py [--workers N] [--out DIR] [--cache DIR] <file or directory> ...`,
+or `python batch.py --validate <file or directory> ...` to only check the syntax, e.g. in a pre-commit hook
+"""
+import argparse
+import multiprocessing
+import os
+import pickle
+import sys
+
+import ast_json
+import parse_cache
+import swift_parser
+
+_parser = None  # Parser of the worker process
+
+
+def _init_worker(cache=None):
+    global _parser
+    _parser = parse_cache.ParseCache(cache) if cache else swift_parser.SwiftParser()
+
+
+def _parse_chunk(paths):
+    """
+    Method parses a chunk of files in a worker process
+    :param paths: paths to the source files
+    :return: list of (path, pickled AST, None) or (path, None, list of SyntaxError or error message)
+    """
+    results = []
+    for path in paths:
+        try:
+            syntax_errors = []
+            ast = _parser.parse_file(path, errors=syntax_errors)
+            if syntax_errors:
+                results.append((path, None, syntax_errors))
+            else:
+                results.append((path, pickle.dumps(ast, pickle.HIGHEST_PROTOCOL), None))
+        except Exception as error:  # One broken file must not abort the batch
+            results.append((path, None, '%s: %s' % (type(error).__name__, error)))
+    return results
+
+
+def _validate_chunk(paths):
+    """
+    Method checks the syntax of a chunk of files in a worker process
+    :param paths: paths to the source files
+    :return: list of (path, list of SyntaxError, error message)
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append((path, _parser.validate_file(path), None))
+        except Exception as error:  # Unreadable file
+            results.append((path, None, '%s: %s' % (type(error).__name__, error)))
+    return results
+
+
+def _chunks(paths, size):
+    for start in range(0, len(paths), size):
+        yield paths[start:start + size]
+
+
+def _collect(chunks, asts, errors):
+    for results in chunks:
+        for path, data, error in results:
+            if error is None:
+                asts[path] = pickle.loads(data)
+            else:
+                errors[path] = error
+
+
+def parse_many(paths, workers=None, chunk_size=64, cache=None):
+    """
+    Method parses many source files in worker processes, every worker loads the LALR tables once
+    :param paths: paths to the source files
+    :param workers: number of worker processes, os.cpu_count() by default
+    :param chunk_size: maximal number of files sent to a worker at once
+    :param cache: directory of the parse cache shared by the workers, no caching by default
+    :return: (dict path -> AST, dict path -> list of SyntaxError or error message for the files that do not parse)
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    # Smaller chunks keep all the workers busy when there are few files
+    chunk_size = max(1, min(chunk_size, len(paths) // (workers * 4)))
+    asts = {}
+    errors = {}
+    if workers == 1:
+        _init_worker(cache)
+        chunks = map(_parse_chunk, _chunks(paths, chunk_size))
+        _collect(chunks, asts, errors)
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(cache,)) as pool:
+            _collect(pool.imap_unordered(_parse_chunk, _chunks(paths, chunk_size)), asts, errors)
+    return asts, errors
+
+
+def validate_many(paths, workers=None, chunk_size=64):
+    """
+    Method checks the syntax of many source files in worker processes without building ASTs
+    :param paths: paths to the source files
+    :param workers: number of worker processes, os.cpu_count() by default
+    :param chunk_size: maximal number of files sent to a worker at once
+    :return: dict path -> list of SyntaxError or error message, only for the files that do not parse
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, min(chunk_size, len(paths) // (workers * 4)))
+    failures = {}
+    if workers == 1:
+        _init_worker()
+        chunks = map(_validate_chunk, _chunks(paths, chunk_size))
+        failures.update(_failures(chunks))
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            failures.update(_failures(pool.imap_unordered(_validate_chunk, _chunks(paths, chunk_size))))
+    return failures
+
+
+def _failures(chunks):
+    for results in chunks:
+        for path, syntax_errors, error in results:
+            if error is not None:
+                yield path, error
+            elif syntax_errors:
+                yield path, syntax_errors
+
+
+def find_sources(paths, extension='.swift'):
+    """
+    Method expands directories into the source files they contain
+    :param paths: paths to files and directories
+    :param extension: extension of the source files searched in directories
+    :return: list of paths to the source files
+    """
+    sources = []
+    for path in paths:
+        if not os.path.isdir(path):
+            sources.append(path)
+            continue
+        for root, _, files in os.walk(path):
+            sources.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(extension))
+    return sources
+
+
+def _print_errors(failures):
+    for path, errors in sorted(failures.items()):
+        if isinstance(errors, str):
+            print('%s: %s' % (path, errors), file=sys.stderr)
+            continue
+        for error in errors:
+            print('%s:%d:%d: %s' % (path, error.lineno, error.offset, error.msg), file=sys.stderr)
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description='Parse many Swift files in parallel')
+    arguments.add_argument('paths', nargs='+', help='source files or directories with .swift files')
+    arguments.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    arguments.add_argument('--cache', help='directory of the parse cache, unchanged files are not parsed again')
+    arguments.add_argument('--out', help='directory for JSON ASTs, nothing is written by default')
+    arguments.add_argument('--validate', action='store_true',
+                           help='only check the syntax, print path:line:column of every error')
+    args = arguments.parse_args(argv)
+
+    sources = find_sources(args.paths)
+    if args.validate:
+        failures = validate_many(sources, workers=args.workers)
+        _print_errors(failures)
+        print('Checked %d files, %d with errors' % (len(sources), len(failures)))
+        return 1 if failures else 0
+    asts, errors = parse_many(sources, workers=args.workers, cache=args.cache)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for path, ast in asts.items():
+            name = os.path.splitdrive(os.path.abspath(path))[1].lstrip(os.sep).replace(os.sep, '_') + '.json'
+            ast_json.dump(ast, os.path.join(args.out, name))
+    _print_errors(errors)
+    print('Parsed %d files, %d with errors' % (len(asts) + len(errors), len(errors)))
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
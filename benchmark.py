@@ -0,0 +1,1028 @@
+"""
+Benchmarks of the parsing pipeline.
+Run `python benchmark.py <name> [<name> ...]`, names are the keys of BENCHMARKS.
+"""
+import copy
+import functools
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import arena
+import ast_binary
+import ast_json
+import ast_nodes
+import batch
+import fast_lexer
+import incremental
+import lexer
+import line_index
+import parse_cache
+import pratt
+import swift_parser
+import table_parser
+import token_stream
+import yacc
+from ply import yacc as ply_yacc
+from preprocess_comments import strip_comments
+
+COMMENTED_SOURCE = '''// Generated code
+/* Header comment
+   /* nested */ still a comment */
+Int a = 8 * 6 + 4 - 12; // trailing comment
+print("not // a comment", "nor /* this */");
+'''
+
+
+def best_time(func, *args, repeat=3):
+    """
+    Method measures the fastest of several runs
+    :param func: function to run
+    :param args: arguments of the function
+    :param repeat: number of runs
+    :return: time of the fastest run in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_comments(max_mb=100):
+    """
+    Method shows that comment stripping scales linearly with the input size
+    :param max_mb: size of the largest input in megabytes
+    """
+    size = 1
+    while size <= max_mb:
+        content = COMMENTED_SOURCE * (size * 2 ** 20 // len(COMMENTED_SOURCE))
+        elapsed = best_time(strip_comments, content, repeat=1 if size > 16 else 3)
+        print('strip_comments %4d MB: %7.3f s, %6.1f MB/s' % (size, elapsed, size / elapsed))
+        size *= 2
+
+
+def count_tokens(data, lex=None):
+    """
+    Method runs the lexer over the whole input
+    :param data: source code
+    :param lex: lexer, the module lexer by default
+    :return: number of tokens
+    """
+    lex = lex or lexer.lexer
+    lex.lineno = 1
+    lex.input(data)
+    count = 0
+    for _ in lex:
+        count += 1
+    return count
+
+
+def bench_lexer(size_kb=1024):
+    """
+    Method measures lexing speed of commented source, comments are skipped by the lexer itself
+    :param size_kb: size of the input in kilobytes
+    """
+    data = COMMENTED_SOURCE * (size_kb * 2 ** 10 // len(COMMENTED_SOURCE))
+    count = count_tokens(data)
+    elapsed = best_time(count_tokens, data)
+    print('lexer %d KB: %d tokens in %.3f s, %.0f tokens/s' % (size_kb, count, elapsed, count / elapsed))
+
+
+COLD_START = {
+    'yacc.yacc() defaults': 'parser = yacc.yacc.yacc(module=yacc)',
+    'build_parser()': 'parser = yacc.build_parser()',
+}
+
+
+def bench_cold_start(repeat=5):
+    """
+    Method measures the time from interpreter start to the first parsed statement
+    :param repeat: number of processes started for every way of building the parser
+    """
+    for name, build in COLD_START.items():
+        code = 'import lexer, yacc; %s; lexer.lexer.input("Int a = 1;"); parser.parse(lexer=lexer.lexer)' % build
+        run = functools.partial(subprocess.run, cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        elapsed = best_time(run, [sys.executable, '-c', code], repeat=repeat)
+        print('cold start, %s: %.3f s' % (name, elapsed))
+
+
+def bench_reuse(count=5000):
+    """
+    Method measures how many small inputs one SwiftParser parses per second
+    :param count: number of parsed inputs
+    """
+    parser = swift_parser.SwiftParser()
+    data = 'Int a = 8 * 6 + 4 - 12; print(a);'
+
+    def parse_all():
+        for _ in range(count):
+            parser.parse_string(data)
+
+    elapsed = best_time(parse_all)
+    print('SwiftParser.parse_string: %.0f parses/s' % (count / elapsed))
+
+
+def bench_threads(count=2000, workers=8):
+    """
+    Method parses different inputs from a thread pool with one shared SwiftParser and checks the results
+    :param count: number of parsed inputs
+    :param workers: number of threads
+    """
+    parser = swift_parser.SwiftParser()
+    inputs = ['Int a%d = %d * 6 + 4; print(a%d);' % (i, i, i) for i in range(count)]
+    expected = [parser.parse_string(data) for data in inputs]
+    with ThreadPoolExecutor(workers) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(parser.parse_string, inputs))
+        elapsed = time.perf_counter() - start
+    assert results == expected, 'threads corrupted each other\'s token streams'
+    print('SwiftParser from %d threads: %.0f parses/s, %d lexer/parser pairs'
+          % (workers, count / elapsed, len(parser.pool.idle)))
+
+
+def bench_batch(files=400, max_workers=None):
+    """
+    Method measures throughput of parse_many on a generated corpus with different numbers of workers
+    :param files: number of files in the corpus
+    :param max_workers: largest number of workers, os.cpu_count() by default
+    """
+    source = COMMENTED_SOURCE * 50
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(files):
+            paths.append(os.path.join(directory, 'file%d.swift' % i))
+            with open(paths[-1], 'w') as file:
+                file.write(source)
+        workers = 1
+        while workers <= (max_workers or os.cpu_count() or 1):
+            start = time.perf_counter()
+            asts, errors = batch.parse_many(paths, workers=workers)
+            elapsed = time.perf_counter() - start
+            print('parse_many, %d workers: %.0f files/s, %d errors' % (workers, len(asts) / elapsed, len(errors)))
+            workers *= 2
+
+
+def bench_incremental(lines=10000, edits=200):
+    """
+    Method measures edit-to-AST latency of IncrementalParser against parsing the whole file again
+    :param lines: number of lines in the edited file
+    :param edits: number of edits
+    """
+    data = ''.join('Int a%d = %d * 6 + 4;\nfoo(a%d)\n' % (i, i, i) for i in range(lines // 2))
+    parser = incremental.IncrementalParser(data)
+    full = best_time(swift_parser.SwiftParser().parse_string, data, repeat=1)
+    start = time.perf_counter()
+    for i in range(edits):
+        offset = parser.text.index(' 6 ', len(parser.text) * i // edits) + 1
+        parser.edit(offset, offset + 1, str(i % 10))
+    elapsed = (time.perf_counter() - start) / edits
+    print('%d lines: full parse %.1f ms, incremental edit %.2f ms, %d of %d statements reused'
+          % (lines, full * 1000, elapsed * 1000, parser.reused, len(parser.statements)))
+    parser.edit(0, 0, 'Int b = 1;\n')  # Moves every reused statement
+    fresh = swift_parser.SwiftParser().parse_string(parser.text)
+    index = line_index.LineIndex(parser.text)
+    assert [parser.locate(node, i) for i, node in enumerate(parser.ast) if isinstance(node, ast_nodes.Node)] == \
+        [index.locate(node) for node in fresh if isinstance(node, ast_nodes.Node)], 'positions after an edit differ'
+
+
+def bench_deep(statements=100000):
+    """
+    Method parses a file with many statements, reports the deepest parser stack and serializes the AST
+    :param statements: number of statements in the file
+    """
+    data = 'x = 1;\n' * statements
+    lex = lexer.build_lexer()
+    lex.input(data)
+    parser = copy.copy(yacc.build_parser())
+    depth = [0]
+
+    def token():
+        depth[0] = max(depth[0], len(parser.symstack))
+        return lex.token()
+
+    start = time.perf_counter()
+    ast = parser.parse(lexer=lex, tokenfunc=token, tracking=True)
+    size = len(json.dumps(ast_nodes.to_data(ast)))
+    elapsed = time.perf_counter() - start
+    print('%d statements: deepest parser stack %d, %d top-level items, %d bytes of JSON in %.2f s'
+          % (statements, depth[0], len(ast), size, elapsed))
+
+
+def to_tuples(value):
+    """
+    Method converts an AST into the tuple form the parser used to build, (KIND, field, ...)
+    :param value: AST
+    :return: AST made of tuples
+    """
+    if isinstance(value, ast_nodes.Node):
+        return (ast_nodes.KIND_NAMES[value.kind],) + tuple(to_tuples(getattr(value, name)) for name in value.__slots__)
+    if isinstance(value, list):
+        return [to_tuples(item) for item in value]
+    return value
+
+
+def copy_nodes(value):
+    """
+    Method rebuilds an AST from node classes, the counterpart of to_tuples
+    :param value: AST
+    :return: copy of the AST
+    """
+    if isinstance(value, ast_nodes.Node):
+        return type(value)(value.pos, *[copy_nodes(getattr(value, name)) for name in value.__slots__])
+    if isinstance(value, list):
+        return [copy_nodes(item) for item in value]
+    return value
+
+
+def node_sizes(value, node_type):
+    """
+    Method counts the nodes of an AST and the bytes they take, leaves and lists are not counted
+    :param value: AST
+    :param node_type: ast_nodes.Node or tuple
+    :return: (number of nodes, bytes)
+    """
+    count = size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, node_type):
+            count += 1
+            size += sys.getsizeof(value)
+            stack.extend(value if node_type is tuple else [getattr(value, name) for name in value.__slots__])
+        elif isinstance(value, list):
+            stack.extend(value)
+    return count, size
+
+
+def bench_nodes(repeat=200):
+    """
+    Method compares __slots__ nodes with the tuple form: bytes per node and nodes built per second
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        data = file.read() * repeat
+    parser = swift_parser.SwiftParser()
+    elapsed = best_time(parser.parse_string, data)
+    ast = parser.parse_string(data)
+    count, size = node_sizes(ast, ast_nodes.Node)
+    print('parser: %.0f nodes/s' % (count / elapsed))
+    for name, build, node_type in (('nodes', copy_nodes, ast_nodes.Node), ('tuples', to_tuples, tuple)):
+        elapsed = best_time(build, ast)
+        count, size = node_sizes(build(ast), node_type)
+        print('%s: %.1f bytes/node, %.0f nodes/s built' % (name, size / count, count / elapsed))
+
+
+def retained_memory(func, *args):
+    """
+    Method measures the memory kept by the result of a function, temporaries freed on the way are not counted
+    :param func: function to run
+    :param args: arguments of the function
+    :return: (result, bytes)
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def count_kind(value, kind):
+    """
+    Method counts the nodes of a kind by walking an AST of node objects
+    :param value: AST
+    :param kind: kind code
+    :return: number of nodes
+    """
+    count = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ast_nodes.Node):
+            count += value.kind == kind
+            stack.extend([getattr(value, name) for name in value.__slots__])
+        elif isinstance(value, list):
+            stack.extend(value)
+    return count
+
+
+def bench_arena(repeat=2000):
+    """
+    Method compares the flat arena with node objects: memory per node and speed of a whole-tree scan
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        data = file.read() * repeat
+    ast, tree_bytes = retained_memory(swift_parser.SwiftParser().parse_string, data)
+    flat, arena_bytes = retained_memory(arena.parse_string, data)
+    assert flat.to_ast() == ast, 'arena differs from the node objects'
+    count, _ = node_sizes(ast, ast_nodes.Node)
+    print('node objects: %.1f bytes/node, arena: %.1f bytes/node (columns %.1f bytes/node), %d entries for %d nodes'
+          % (tree_bytes / count, arena_bytes / count, flat.nbytes() / count, len(flat), count))
+    kind = ast_nodes.BinaryOp.kind
+    tree_scan = best_time(count_kind, ast, kind)
+    arena_scan = best_time(flat.kinds.count, kind)
+    print('scan for BinaryOp: node objects %.2f ms, arena %.2f ms' % (tree_scan * 1000, arena_scan * 1000))
+
+
+def dump_twice(ast, path):
+    """
+    Method writes out.txt the way yacc.parse() used to: the JSON string is built once for the file and once for print
+    """
+    with open(path, 'w') as file:
+        file.write(json.dumps(ast_nodes.to_data(ast), indent=4))
+    return len(json.dumps(ast_nodes.to_data(ast), indent=4))
+
+
+def peak_memory(func, *args):
+    """
+    Method measures the peak memory allocated while a function runs
+    :param func: function to run
+    :param args: arguments of the function
+    :return: bytes
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_json(repeat=2000):
+    """
+    Method compares writing out.txt with json.dumps twice against the streaming writer in ast_json
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        ast = swift_parser.SwiftParser().parse_string(file.read() * repeat)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'out.txt')
+        ways = (
+            ('json.dumps(indent=4) twice', dump_twice, (ast, path)),
+            ('ast_json indent=4', ast_json.dump, (ast, path, 4)),
+            ('ast_json compact', ast_json.dump, (ast, path)),
+            ('ast_json compact gzip', ast_json.dump, (ast, path + '.gz')),
+        )
+        for name, func, args in ways:
+            elapsed = best_time(func, *args)
+            peak = peak_memory(func, *args)
+            print('%s: %.3f s, peak %.1f MB' % (name, elapsed, peak / 2 ** 20))
+
+
+def load_json(path):
+    """
+    Method reads the AST back from out.txt the way downstream tools do
+    """
+    with open(path, encoding='utf8') as file:
+        return ast_nodes.from_data(json.load(file))
+
+
+def top_level_kinds(path):
+    """
+    Method maps a binary AST file and reads the kinds of the top-level statements only
+    """
+    return [record.kind_name for record in ast_binary.BinaryAST.open(path).root.children()]
+
+
+def bench_binary(repeat=2000):
+    """
+    Method compares read and write throughput of the JSON and the binary AST files
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        ast = swift_parser.SwiftParser().parse_string(file.read() * repeat)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'out.txt')
+        binary_path = os.path.join(directory, 'out.sast')
+        for name, path, write, read in (('JSON', json_path, ast_json.dump, load_json),
+                                        ('binary', binary_path, ast_binary.dump, ast_binary.load)):
+            write_time = best_time(write, ast, path)
+            read_time = best_time(read, path)
+            assert read(path) == ast, '%s file differs from the AST' % name
+            size = os.path.getsize(path) / 2 ** 20
+            print('%s: %.1f MB, write %.3f s (%.0f MB/s), read %.3f s (%.0f MB/s)'
+                  % (name, size, write_time, size / write_time, read_time, size / read_time))
+        elapsed = best_time(top_level_kinds, binary_path)
+        print('binary, mmap without materializing: kinds of %d top-level statements in %.3f s'
+              % (len(ast), elapsed))
+
+
+def bench_cache(files=200):
+    """
+    Method compares parsing a corpus with a cold and a warm ParseCache, then shares the cache between processes
+    and shrinks it to check eviction
+    :param files: number of files in the corpus
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        sources = [COMMENTED_SOURCE.replace('12', str(i)) * 50 for i in range(files)]
+        expected = [swift_parser.SwiftParser().parse_string(source) for source in sources]
+        cache = parse_cache.ParseCache(os.path.join(directory, 'cache'))
+        for name in ('cold', 'warm'):
+            start = time.perf_counter()
+            results = [cache.parse_string(source) for source in sources]
+            elapsed = time.perf_counter() - start
+            assert results == expected, 'cached AST differs from the parsed one'
+            print('%s cache: %.0f files/s, %s' % (name, files / elapsed, cache.stats()))
+        paths = []
+        for i, source in enumerate(sources):
+            paths.append(os.path.join(directory, 'file%d.swift' % i))
+            with open(paths[-1], 'w') as file:
+                file.write(source)
+        shared = os.path.join(directory, 'shared')
+        for run in ('cold', 'warm'):
+            start = time.perf_counter()
+            asts, errors = batch.parse_many(paths + paths, workers=4, chunk_size=8, cache=shared)
+            elapsed = time.perf_counter() - start
+            assert not errors and [asts[path] for path in paths] == expected, 'processes corrupted the cache'
+            print('parse_many, 4 workers, %s shared cache: %.0f files/s' % (run, 2 * files / elapsed))
+        size = sum(size for _, size, _ in cache.entries())
+        small = parse_cache.ParseCache(cache.directory, max_bytes=size // 2)
+        small.parse_string('Int evict = 1;')
+        print('eviction: %d of %d entries left after limiting the cache to half its size'
+              % (len(small.entries()), files + 1))
+
+
+def bench_tokens(size_kb=1024):
+    """
+    Method compares token-only lexing into arrays with LexToken objects from the PLY lexer
+    :param size_kb: size of the inputs in kilobytes
+    """
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    for name, source in (('commented', COMMENTED_SOURCE), ('in.txt', code)):
+        data = source * (size_kb * 2 ** 10 // len(source))
+        count = count_tokens(data)
+        assert len(token_stream.tokenize_string(data)) == count, 'token counts differ'
+        ply_time = best_time(count_tokens, data)
+        arrays_time = best_time(token_stream.tokenize_string, data)
+        print('%s %d KB, %d tokens: LexToken %.0f tokens/s, TokenArrays %.0f tokens/s (%.1fx)'
+              % (name, size_kb, count, count / ply_time, count / arrays_time, ply_time / arrays_time))
+    cache = token_stream.TokenCache()
+    encoded = data.encode('utf8')
+    cache.tokenize_bytes(encoded)
+    print('TokenCache hit: %.1f ms' % (best_time(cache.tokenize_bytes, encoded) * 1000))
+
+
+def bench_identifiers(names=500, size_kb=1024):
+    """
+    Method lexes and parses identifier-heavy input: keyword classification speed and sharing of identifier strings
+    :param names: number of distinct identifiers
+    :param size_kb: size of the input in kilobytes
+    """
+    line = ''.join('value%d = counter%d + inf * item%d;\n' % (i, i % 7, i % 13) for i in range(names))
+    data = line * (size_kb * 2 ** 10 // len(line))
+    count = count_tokens(data)
+    elapsed = best_time(count_tokens, data)
+    lexer.lexer.input(data)
+    values = [token.value for token in lexer.lexer if token.type == 'ID']
+    print('%d KB: %.0f tokens/s, %d identifiers, %d distinct names, %d distinct string objects'
+          % (size_kb, count / elapsed, len(values), len(set(values)), len({id(value) for value in values})))
+    ast, size = retained_memory(swift_parser.SwiftParser().parse_string, data)
+    print('AST of the input: %.1f MB' % (size / 2 ** 20))
+
+
+# Pieces of random lexer inputs: partial and complete tokens, comment and string delimiters, illegal characters
+LEXER_PIECES = tuple('abcxyz_#019.eE+-*/%=<>!&|^~()[]{},;:@?`"\\ \t\r\n$\u00e9') + (
+    'inf', 'nan', '//', '/*', '*/', '"""', 'if', 'Int', '#if', '1.5e3', '..<', '...', '->', ':=', '%/', '%%')
+
+
+def lex_with_errors(lex, data):
+    """
+    Method lexes source code and records the illegal characters instead of reporting them
+    :param lex: lexer
+    :param data: source code
+    :return: (list of (type, value, lineno, lexpos), list of (character, lineno, lexpos))
+    """
+    illegal = []
+    lex.errorfunc = lambda *error: illegal.append(error)
+    lex.input(data)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lex], illegal
+
+
+def check_fast_lexer(count=5000, seed=16):
+    """
+    Method checks that FastLexer and MmapLexer, with and without comments and lazy values, give the same tokens
+    and illegal characters as the PLY lexer on random inputs; offsets of MmapLexer are compared as byte offsets
+    :param count: number of random inputs
+    :param seed: seed of the inputs
+    """
+    rng = random.Random(seed)
+    illegal = 0
+    for _ in range(count):
+        data = ''.join(rng.choice(LEXER_PIECES) for _ in range(rng.randint(1, 30)))
+        offsets = list(itertools.accumulate((len(char.encode('utf8')) for char in data), initial=0))
+        for keep_comments in (False, True):
+            tokens, errors = lex_with_errors(lexer.build_lexer(keep_comments), data)
+            in_bytes = ([(kind, value, line, offsets[pos]) for kind, value, line, pos in tokens],
+                        [(char, line, offsets[pos]) for char, line, pos in errors])
+            illegal += len(errors)
+            for lazy_values in (False, True):
+                assert (lex_with_errors(fast_lexer.build_lexer(keep_comments, lazy_values), data)
+                        == (tokens, errors)), 'FastLexer differs on %r' % data
+                assert (lex_with_errors(fast_lexer.MmapLexer(keep_comments, lazy_values=lazy_values),
+                                        data.encode('utf8')) == in_bytes), 'MmapLexer differs on %r' % data
+    print('%d random inputs, %d illegal characters: FastLexer and MmapLexer give the same tokens and errors'
+          % (count, illegal))
+
+
+def bench_fast_lexer(size_kb=1024):
+    """
+    Method compares FastLexer with the PLY lexer: token streams must be equal, on random inputs too,
+    then lexing and parsing speed
+    :param size_kb: size of the inputs in kilobytes
+    """
+    check_fast_lexer()
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    for name, source in (('commented', COMMENTED_SOURCE), ('in.txt', code)):
+        data = source * (size_kb * 2 ** 10 // len(source))
+        tokens = []
+        for lex in (lexer.build_lexer(), fast_lexer.build_lexer()):
+            lex.input(data)
+            tokens.append([(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lex])
+        assert tokens[0] == tokens[1], 'FastLexer differs from the PLY lexer'
+        ply_time = best_time(count_tokens, data, lexer.build_lexer())
+        fast_time = best_time(count_tokens, data, fast_lexer.build_lexer())
+        print('%s %d KB, %d tokens: PLY %.0f tokens/s, FastLexer %.0f tokens/s (%.1fx)'
+              % (name, size_kb, len(tokens[0]), len(tokens[0]) / ply_time, len(tokens[0]) / fast_time,
+                 ply_time / fast_time))
+    data = code * 1000
+    ply_parser, fast_parser = swift_parser.SwiftParser(), swift_parser.SwiftParser(fast_lexer=True)
+    assert ply_parser.parse_string(data) == fast_parser.parse_string(data), 'ASTs differ'
+    ply_time = best_time(ply_parser.parse_string, data)
+    fast_time = best_time(fast_parser.parse_string, data)
+    print('parse in.txt x1000: PLY lexer %.3f s, FastLexer %.3f s' % (ply_time, fast_time))
+
+
+def bench_mmap(size_mb=1):
+    """
+    Method compares peak heap memory and time of reading and of memory-mapping a large file,
+    into node objects and into an arena
+    :param size_mb: size of the file in megabytes
+    """
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    parser = swift_parser.SwiftParser()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'large.swift')
+        with open(path, 'w', encoding='utf8') as file:
+            file.write(code * (size_mb * 2 ** 20 // len(code)))
+        assert parser.parse_file(path) == parser.parse_mmap(path), 'ASTs differ'
+        for name, parse in (('SwiftParser.parse_file', parser.parse_file), ('SwiftParser.parse_mmap', parser.parse_mmap),
+                            ('arena.parse_file', arena.parse_file)):
+            elapsed = best_time(parse, path, repeat=1)
+            ast, size = retained_memory(parse, path)
+            del ast
+            peak = peak_memory(parse, path)
+            print('%s %d MB: %.2f s, peak heap %.1f MB, AST %.1f MB' % (name, size_mb, elapsed, peak / 2 ** 20,
+                                                                     size / 2 ** 20))
+
+
+def check_only(data, lex):
+    """
+    Method checks the syntax of source code with a given lexer
+    :param data: source code
+    :param lex: lexer
+    """
+    lex.input(data)
+    swift_parser.build_checker().parse(lexer=lex)
+
+
+def bench_check(repeat=1000):
+    """
+    Method compares a full parse with syntax checking, which converts token values eagerly: deferring them
+    with lazy values costs more in LazyToken objects than it saves, even on long strings
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        data = file.read() * repeat
+    parser = swift_parser.SwiftParser(fast_lexer=True)
+    assert parser.check_string(data) and not parser.check_string(data + '}'), 'Wrong syntax check result'
+    parse_time = best_time(parser.parse_string, data)
+    check_time = best_time(parser.check_string, data)
+    lazy_time = best_time(check_only, data, fast_lexer.build_lexer(lazy_values=True))
+    print('in.txt x%d: parse %.3f s, check %.3f s (%.1fx), check with lazy values %.3f s'
+          % (repeat, parse_time, check_time, parse_time / check_time, lazy_time))
+
+
+def parse_and_dump(parser, data, path):
+    """
+    Method parses source code and writes the JSON AST, like main.py
+    :param parser: SwiftParser
+    :param data: source code
+    :param path: path to the JSON file
+    """
+    ast_json.dump(parser.parse_string(data), path)
+
+
+def bench_validate(repeat=1000):
+    """
+    Method compares the throughput of validation with that of a full parse, with and without writing JSON
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        data = file.read() * repeat
+    size = len(data.encode('utf8')) / 2 ** 20
+    parser = swift_parser.SwiftParser(fast_lexer=True)
+    assert parser.validate_string(data) == [], 'in.txt does not validate'
+    illegal = parser.validate_string('x = 1;\n$ y = 2;\n')
+    assert [(error.lineno, error.offset) for error in illegal] == [(2, 1)], 'An illegal character validates'
+    with tempfile.TemporaryDirectory() as directory:
+        dump_time = best_time(parse_and_dump, parser, data, os.path.join(directory, 'out.txt'))
+    parse_time = best_time(parser.parse_string, data)
+    validate_time = best_time(parser.validate_string, data)
+    for name, elapsed in (('parse + JSON', dump_time), ('parse', parse_time), ('validate', validate_time)):
+        print('%s in.txt x%d: %.3f s, %.2f MB/s, %.1fx of parse + JSON'
+              % (name, repeat, elapsed, size / elapsed, dump_time / elapsed))
+
+
+def bench_recovery(max_kb=512):
+    """
+    Method shows that parsing broken input reports every injected error once and stays linear in the input size
+    :param max_kb: size of the largest input in kilobytes
+    """
+    statement = 'Int a = 8 * 6 + 4 - 12;\nprint("HELLO", a);\n'
+    broken = 'Int b = = 2;\n'
+    parser = swift_parser.SwiftParser(fast_lexer=True)
+    size = 64
+    while size <= max_kb:
+        count = size * 2 ** 10 // (len(statement) * 10)
+        data = (statement * 9 + broken) * count
+        errors = []
+        ast = parser.parse_string(data, errors)
+        assert len(errors) == count and len(ast) >= count * 9 * 4, 'Recovery lost statements or cascaded'
+        elapsed = best_time(parser.parse_string, data, [])
+        print('%4d KB, %d errors: %.3f s, %.0f KB/s' % (size, len(errors), elapsed, size / elapsed))
+        size *= 2
+
+
+def parse_tracking(data, parser, tracking):
+    """
+    Method parses source code with the table-driven lexer
+    :param data: source code
+    :param parser: parser
+    :param tracking: propagate token offsets to the nodes
+    :return: AST
+    """
+    lex = fast_lexer.build_lexer()
+    lex.input(data)
+    return parser.parse(lexer=lex, tracking=tracking)
+
+
+def locate_nodes(data, ast):
+    """
+    Method finds the line and column of every node
+    :param data: source code
+    :param ast: AST of the source
+    :return: number of nodes
+    """
+    index = line_index.LineIndex(data)
+    stack = [ast]
+    count = 0
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, ast_nodes.Node):
+            index.location(value.pos)
+            count += 1
+            stack.extend(getattr(value, name) for name in value.__slots__)
+    return count
+
+
+def bench_positions(repeat=1000):
+    """
+    Method measures the cost of source positions: offsets tracked by PLY and by the offset tracking parser,
+    then line and column of every node from a LineIndex
+    :param repeat: number of copies of in.txt in the input
+    """
+    with open('in.txt', encoding='utf8') as file:
+        data = file.read() * repeat
+    parser = copy.copy(yacc.build_parser())
+    offset_parser = yacc.build_offset_parser()
+    ast = parse_tracking(data, offset_parser, True)
+    assert ast_binary.dumps(ast) == ast_binary.dumps(parse_tracking(data, parser, True)), 'Positions differ'
+    without_time = best_time(parse_tracking, data, parser, False, repeat=5)
+    for name, tracked in (('PLY tracking', parser), ('offset tracking', offset_parser)):
+        elapsed = best_time(parse_tracking, data, tracked, True, repeat=5)
+        print('in.txt x%d: parse without positions %.3f s, with %s %.3f s (+%.1f%%)'
+              % (repeat, without_time, name, elapsed, (elapsed / without_time - 1) * 100))
+    index_time = best_time(line_index.LineIndex, data)
+    locate_time = best_time(locate_nodes, data, ast)
+    print('LineIndex %.4f s, line and column of all %d nodes %.3f s' % (index_time, locate_nodes(data, ast), locate_time))
+
+
+def count_reductions(data, parser=None):
+    """
+    Method parses source code and counts the tokens and the reductions
+    :param data: source code
+    :param parser: parser, yacc.build_offset_parser() by default
+    :return: (number of tokens, number of reductions)
+    """
+    parser = copy.copy(parser or yacc.build_offset_parser())
+    parser.parse = types.MethodType(parser.parse.__func__, parser)  # Offset parsers bind parse to the instance
+    parser.productions = list(parser.productions)
+    reductions = [0]
+
+    def counting(callable):
+        def count(p):
+            reductions[0] += 1
+            callable(p)
+        return count
+
+    for index, production in enumerate(parser.productions):
+        if production.callable is not None:
+            production = copy.copy(production)
+            production.callable = counting(production.callable)
+            parser.productions[index] = production
+    lex = fast_lexer.build_lexer()
+    lex.input(data)
+    parser.parse(lexer=lex, tracking=True)
+    return count_tokens(data, fast_lexer.build_lexer()), reductions[0]
+
+
+EXPRESSIONS = 'Int a = 8 * 6 + 4 - 12 / (b % 3);\nc = !d == e < -f || g && h != i >= j;\nprint(k[1].m + 2.5, "x");\n'
+
+# Expression rules of the grammar before the precedence table of yacc.py: one nonterminal per level
+# and a nonterminal for the operators of every level
+EXPRESSION_CHAIN = (
+    'expr : or-expr',
+    'or-expr : and-expr | or-expr LOG_OR and-expr',
+    'and-expr : eq-expr | and-expr LOG_AND eq-expr',
+    'eq-expr : cmp-expr | eq-expr eq-or-not-eq eq-expr',
+    'eq-or-not-eq : EQUAL | NOT_EQUAL',
+    'cmp-expr : add-expr | cmp-expr cmp-sign add-expr',
+    'cmp-sign : LESS | LESS_EQ | EQUAL | GREATER | GREATER_EQ',
+    'add-expr : mult-expr | add-expr add-sign mult-expr',
+    'add-sign : PLUS | MINUS',
+    'mult-expr : unary-expr | mult-expr mult-sign unary-expr',
+    'mult-sign : MULT | DIV | MULTPER | DOUBLEPER | MOD',
+    'unary-expr : postfix-expr | minus-or-excl postfix-expr',
+    'minus-or-excl : MINUS | EXCLAMATION',
+)
+
+
+def _chain_action(p):
+    if len(p) == 4:
+        p[0] = ast_nodes.BinaryOp(p.lexpos(1), p[2], p[1], p[3])
+    elif len(p) == 3:
+        p[0] = ast_nodes.UnaryOp(p.lexpos(1), p[1], p[2])
+    else:
+        p[0] = p[1]
+
+
+def build_chain_parser():
+    """
+    Method generates the LALR tables of the grammar with EXPRESSION_CHAIN instead of the single expr rule,
+    the rest of the grammar is that of yacc.py. The ASTs are the same, the tables are not written
+    :return: parser with offset tracking
+    """
+    grammar = {name: value for name, value in vars(yacc).items() if name.startswith('p_') and name != 'p_expr'}
+    for index, rule in enumerate(EXPRESSION_CHAIN):
+        action = types.FunctionType(_chain_action.__code__, _chain_action.__globals__, 'p_chain_%d' % index)
+        action.__doc__ = rule.replace(' | ', '\n    | ')  # PLY wants every alternative on its own line
+        grammar[action.__name__] = action
+    grammar.update(tokens=yacc.tokens, start='translation-unit', __file__=yacc.__file__,
+                   precedence=[level for level in yacc.precedence if 'S_ELSE' in level or 'IF_WITHOUT_ELSE' in level])
+    parser = ply_yacc.yacc(module=types.SimpleNamespace(**grammar), write_tables=False, debug=False,
+                           tabmodule='chain_parsetab', errorlog=ply_yacc.NullLogger())
+    offset_parser = copy.copy(parser)
+    offset_parser.parse = types.MethodType(yacc.build_offset_parser().parse.__func__, offset_parser)
+    return offset_parser
+
+
+def bench_grammar(repeat=1000):
+    """
+    Method reports the size of the LALR automaton, the reductions per token and the parse speed
+    of the grammar of yacc.py and of the same grammar with the expression chain it replaced
+    :param repeat: number of copies of the inputs
+    """
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    grammars = (('chain', build_chain_parser()), ('precedence', yacc.build_offset_parser()))
+    for name, parser in grammars:
+        print('%s grammar: %d LALR states, %d productions' % (name, len(parser.action), len(parser.productions)))
+    for name, source in (('in.txt', code), ('expressions', EXPRESSIONS)):
+        data = source * repeat
+        results = []
+        for _, parser in grammars:
+            tokens, reductions = count_reductions(data, parser)
+            results.append((reductions / tokens, best_time(parse_tracking, data, parser, True)))
+        assert ast_binary.dumps(parse_tracking(data, grammars[0][1], True)) == ast_binary.dumps(
+            parse_tracking(data, grammars[1][1], True)), 'ASTs differ'
+        print('%s x%d, %d tokens: reductions per token %.2f -> %.2f, parse %.3f s -> %.3f s'
+              % (name, repeat, tokens, results[0][0], results[1][0], results[0][1], results[1][1]))
+
+
+OPERATORS = ('||', '&&', '==', '!=', '<', '<=', '>', '>=', '+', '-', '*', '/', '%/', '%%', '%')
+OPERANDS = ('a', 'b1', '7', '2.5', '"s"', 'true', 'inf', 'f()', 'g(a, k = 1, )', 'a[1]', 'a.b', 'c[i].d', '[]', '[a]',
+            '[1:n]', '[0:n:2]', '{}', '{a: 1, "b": [2]}', '(a, 2, b)')
+
+
+def random_expression(rng, depth=0):
+    """
+    Method generates a random expression using every operator and kind of operand
+    :param rng: random.Random
+    :param depth: nesting depth of the expression
+    :return: source code
+    """
+    def operand():
+        choice = rng.random()
+        if depth < 3 and choice < 0.15:
+            return '(%s)' % random_expression(rng, depth + 1)
+        if depth < 3 and choice < 0.25:
+            return '%s[%s]' % (rng.choice(('a', 'f(x)', '(b)')), random_expression(rng, depth + 1))
+        if depth < 3 and choice < 0.3:
+            return 'h(%s, k = %s)' % (random_expression(rng, depth + 1), random_expression(rng, depth + 1))
+        if choice < 0.4:
+            return rng.choice('-!') + rng.choice(('a', '1', 'a[2].b', '(c - 1)'))
+        return rng.choice(OPERANDS)
+
+    text = operand()
+    for _ in range(rng.randint(0, 5)):
+        text += ' %s %s' % (rng.choice(OPERATORS), operand())
+    return text
+
+
+def expression_corpus(count=3000, seed=23):
+    """
+    Method generates random programs dense in expressions, every statement kind with an expression is used,
+    a third of the programs get a random token inserted and a sixth are cut short, so error recovery
+    and the end of the input are compared as well
+    :param count: number of programs
+    :param seed: seed of the random generator
+    :return: list of source code
+    """
+    rng = random.Random(seed)
+    templates = ('x = %s;', 'Int v = %s;', 'Int v<%s> = %s;', 'if (%s) { y = %s; } else { y = %s; }',
+                 'print(%s, %s);', 'foreach i in %s { z[i] = %s; }', 'while (%s) { w = %s; }',
+                 'switch (%s) { case 1: q = %s; }', 'a[%s].b = %s;', 'wait (%s) { r = %s; }')
+    noise = ('(', ')', '[', ']', '{', '}', ',', ':', '=', '-', '!', '>', '<', ';', 'a', '1', 'if', '.')
+    corpus = []
+    for index in range(count):
+        statements = []
+        for _ in range(rng.randint(1, 4)):
+            template = rng.choice(templates)
+            statements.append(template % tuple(random_expression(rng) for _ in range(template.count('%s'))))
+        code = '\n'.join(statements)
+        if index % 3 == 0:
+            at = rng.randrange(len(code) + 1)
+            code = code[:at] + ' %s ' % rng.choice(noise) + code[at:]
+        elif index % 6 == 1:
+            code = code[:max(code.rfind(' ', 0, rng.randrange(len(code) + 1)), 0)]  # Not inside a string
+        corpus.append(code)
+    return corpus
+
+
+def parse_with_errors(parser, data):
+    """
+    Method parses source code and collects the syntax errors
+    :param parser: SwiftParser
+    :param data: source code
+    :return: (binary AST with positions, list of (message, line, column))
+    """
+    errors = []
+    ast = parser.parse_string(data, errors)
+    return ast_binary.dumps(ast), [(error.msg, error.lineno, error.offset) for error in errors]
+
+
+def bench_pratt(count=3000, repeat=3000):
+    """
+    Method checks that the Pratt expression sub-parser gives the same ASTs and errors as the LALR tables
+    on a random corpus, then compares their speed
+    :param count: number of programs in the differential corpus
+    :param repeat: number of copies of the expression-dense statement
+    """
+    lalr = swift_parser.SwiftParser(fast_lexer=True)
+    climbing = swift_parser.SwiftParser(fast_lexer=True, pratt=True)
+    corpus = expression_corpus(count)
+    failed = 0
+    for code in corpus:
+        expected = parse_with_errors(lalr, code)
+        assert parse_with_errors(climbing, code) == expected, 'Pratt parser differs on %r' % code
+        failed += bool(expected[1])
+    print('%d programs (%d with syntax errors): same ASTs, positions and errors' % (len(corpus), failed))
+    deep = 'x = ' + '(' * 250 + '1' + ')' * 250 + ';\n'  # Too deep for Python recursion, left to the LALR tables
+    assert parse_with_errors(climbing, deep) == parse_with_errors(lalr, deep), 'Pratt parser fails on deep nesting'
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    dense = 'x = a * (b + 3) - f(c, 2) / d[i + 1].e || !g && h <= 4.5 != k %% 7 + m.n[2] * -p;\n'
+    for name, data in (('in.txt x1000', code * 1000), ('expressions x%d' % repeat, dense * repeat)):
+        lex_time = best_time(count_tokens, data, fast_lexer.build_lexer())
+        times = [best_time(parse_tracking, data, parser, True)
+                 for parser in (yacc.build_offset_parser(), pratt.build_parser())]
+        print('%s: LALR %.3f s, Pratt %.3f s, %.1fx; without the %.3f s of lexing %.1fx'
+              % (name, times[0], times[1], times[0] / times[1], lex_time,
+                 (times[0] - lex_time) / (times[1] - lex_time)))
+
+
+def bench_table_driver(count=3000, repeat=3000):
+    """
+    Method checks that the dense-table driver gives the same ASTs and errors as the PLY driver,
+    on the random expression corpus and on in.txt cut at every statement, then compares their speed
+    :param count: number of programs in the differential corpus
+    :param repeat: number of copies of the expression-dense statement
+    """
+    ply = swift_parser.SwiftParser(fast_lexer=True)
+    dense_tables = swift_parser.SwiftParser(fast_lexer=True, table_driver=True)
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    corpus = expression_corpus(count) + [code[:end] for end in range(len(code)) if code[end] == ';']
+    failed = 0
+    for program in corpus:
+        expected = parse_with_errors(ply, program)
+        assert parse_with_errors(dense_tables, program) == expected, 'Table driver differs on %r' % program
+        failed += bool(expected[1])
+    print('%d programs (%d with syntax errors): same ASTs, positions and errors' % (len(corpus), failed))
+    tables = table_parser.build_parser().tables
+    print('%d of %d rules pass their value through and are never called' % (tables.passed_through, len(tables.rules)))
+    dense = 'x = a * (b + 3) - f(c, 2) / d[i + 1].e || !g && h <= 4.5 != k %% 7 + m.n[2] * -p;\n'
+    for name, data in (('in.txt x1000', code * 1000), ('expressions x%d' % repeat, dense * repeat)):
+        lex_time = best_time(count_tokens, data, fast_lexer.build_lexer())
+        times = [best_time(parse_tracking, data, parser, True)
+                 for parser in (yacc.build_offset_parser(), table_parser.build_parser())]
+        print('%s: PLY %.3f s, tables %.3f s, %.1fx; without the %.3f s of lexing %.1fx'
+              % (name, times[0], times[1], times[0] / times[1], lex_time,
+                 (times[0] - lex_time) / (times[1] - lex_time)))
+
+
+def bench_unit_rules(count=3000, repeat=3000):
+    """
+    Method reports the reductions that eliminating the pass-through unit rules saves on every input,
+    checks that the AST stays the same and compares the speed of the table driver with and without them
+    :param count: number of programs in the corpus
+    :param repeat: number of copies of the expression-dense statement
+    """
+    kept, eliminated = table_parser.build_parser(False), table_parser.build_parser()
+    tables = eliminated.tables
+    print('%d shift and goto entries redirected, %d unit states unreachable'
+          % (tables.redirected, tables.bypassed))
+    with open('in.txt', encoding='utf8') as file:
+        code = file.read()
+    dense = 'x = a * (b + 3) - f(c, 2) / d[i + 1].e || !g && h <= 4.5 != k %% 7 + m.n[2] * -p;\n'
+    inputs = [('in.txt', code), ('expression statement', dense)]
+    inputs += [('corpus %d' % index, program) for index, program in enumerate(expression_corpus(count))]
+    saved = []
+    for name, data in inputs:
+        assert (ast_binary.dumps(parse_tracking(data, kept, True))
+                == ast_binary.dumps(parse_tracking(data, eliminated, True))), 'AST differs on %r' % data
+        before = kept.reductions
+        if before is None:  # Syntax error, both reparsed by PLY
+            continue
+        after = eliminated.reductions
+        saved.append(before - after)
+        if not name.startswith('corpus'):
+            print('%s: %d -> %d reductions, %d saved (%.0f%%)'
+                  % (name, before, after, before - after, 100.0 * (before - after) / before))
+    print('%d valid programs: %d to %d reductions saved, %.1f on average'
+          % (len(saved) - 2, min(saved[2:]), max(saved[2:]), sum(saved[2:]) / (len(saved) - 2)))
+    for name, data in (('in.txt x1000', code * 1000), ('expressions x%d' % repeat, dense * repeat)):
+        times = [best_time(parse_tracking, data, parser, True) for parser in (kept, eliminated)]
+        print('%s: %.3f s -> %.3f s, %.2fx' % (name, times[0], times[1], times[0] / times[1]))
+
+
+BENCHMARKS = {
+    'comments': bench_comments,
+    'lexer': bench_lexer,
+    'tokens': bench_tokens,
+    'identifiers': bench_identifiers,
+    'fast_lexer': bench_fast_lexer,
+    'mmap': bench_mmap,
+    'check': bench_check,
+    'validate': bench_validate,
+    'recovery': bench_recovery,
+    'positions': bench_positions,
+    'grammar': bench_grammar,
+    'pratt': bench_pratt,
+    'table_driver': bench_table_driver,
+    'unit_rules': bench_unit_rules,
+    'cold_start': bench_cold_start,
+    'reuse': bench_reuse,
+    'threads': bench_threads,
+    'batch': bench_batch,
+    'incremental': bench_incremental,
+    'deep': bench_deep,
+    'nodes': bench_nodes,
+    'arena': bench_arena,
+    'json': bench_json,
+    'binary': bench_binary,
+    'cache': bench_cache,
+}
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -0,0 +1,8 @@
+"""
+Regenerates parsetab.py and parser.out, run it after the grammar in yacc.py is changed.
+Run `python build_tables.py`
+"""
+import yacc
+
+if __name__ == '__main__':
+    yacc.build_tables()
@@ -0,0 +1,416 @@
+"""
+Table-driven lexer producing the same LexToken stream as lexer.py.
+PLY tries one regex with every rule as an alternative at each position. Here the first character of a token
+selects a small regex with only the rules that can start with it, generated from the rules and reserved words
+of lexer.py. Characters the table does not know (non-ASCII, illegal characters) are handed to the PLY lexer.
+MmapLexer runs the same table over the bytes of a memory-mapped file, string and comment values are only
+sliced and decoded when they are read. With lazy_values=True both lexers defer literal values the same way,
+numbers are converted by int()/float() only when a parser action reads them.
+The tables are built when the first lexer is created. If lexer.py has a rule they do not know, build_lexer returns
+the PLY lexer and MmapLexer cannot be used, see supported()
+"""
+import mmap
+import re
+import string
+from sys import intern
+
+from ply.lex import LexToken
+
+import lexer
+import token_stream
+from preprocess_comments import skip_multiline_comment
+
+# Characters every function rule of lexer.py can start with
+_FIRST_CHARS = {
+    't_ID': '#_' + string.ascii_letters,
+    't_MUL_STR_LITERAL': '"',
+    't_STR_LITERAL': '"',
+    't_DOUBLE': string.digits,
+    't_INT': string.digits,
+    't_COMMENT': '/',
+    't_MUL_COMMENT': '/',
+    't_newline': '\n',
+}
+
+# What the lexer does with a match, by regex group
+_TOKEN = 0  # Token of a fixed type, value is the text
+_IDENTIFIER = 1
+_INT = 2
+_DOUBLE = 3
+_COMMENT = 4
+_MUL_COMMENT = 5
+_NEWLINE = 6
+_OPERATOR = 7
+_ACTIONS = {
+    't_ID': _IDENTIFIER,
+    't_MUL_STR_LITERAL': _TOKEN,
+    't_STR_LITERAL': _TOKEN,
+    't_DOUBLE': _DOUBLE,
+    't_INT': _INT,
+    't_COMMENT': _COMMENT,
+    't_MUL_COMMENT': _MUL_COMMENT,
+    't_newline': _NEWLINE,
+}
+
+_LAZY_ACTIONS = {_TOKEN: None, _INT: int, _DOUBLE: float}  # Values deferred by lazy_values, by conversion
+
+
+def _build_table(operators, binary=False):
+    """
+    Method builds the dispatch table: for every ASCII character a regex with the rules that can start with it,
+    in the priority order of PLY, and the action of every regex group
+    :param operators: dict operator -> token type
+    :param binary: build bytes regexes keyed by character codes, for MmapLexer
+    :return: dict character -> (match method, list of (action, token type) by group index)
+    """
+    if len(lexer.lexer.lexre) != 1:
+        raise ValueError('Master regex is split into several parts')
+    regex, functions = lexer.lexer.lexre[0]
+    rules = [entry for entry in functions if entry is not None and entry[0] is not None]
+    for function, _ in rules:
+        if function.__name__ not in _FIRST_CHARS:
+            raise ValueError('Lexer rule %s is not supported' % function.__name__)
+    table = {}
+    for code in range(128):
+        char = chr(code)
+        if char in lexer.lexer.lexignore:
+            continue
+        patterns = []
+        actions = [None]
+        for function, name in rules:
+            if char in _FIRST_CHARS[function.__name__]:
+                patterns.append('(%s)' % function.__doc__)
+                actions.append((_ACTIONS[function.__name__], name))
+                actions.extend([None] * re.compile(function.__doc__, regex.flags).groups)
+        first = sorted((text for text in operators if text[0] == char), key=len, reverse=True)
+        if first:
+            patterns.append('(%s)' % '|'.join(re.escape(text) for text in first))
+            actions.append((_OPERATOR, None))
+        if patterns:
+            pattern = '|'.join(patterns)
+            if binary:
+                table[code] = (re.compile(pattern.encode('ascii'), lexer.lexer.lexreflags).match, actions)
+            else:
+                table[char] = (re.compile(pattern, regex.flags).match, actions)
+    return table
+
+
+_tables = None  # Built by _load_tables on first use, () if the rules of lexer.py are not supported
+
+
+def _load_tables():
+    """
+    Method builds the dispatch tables the first time a lexer is created, so a lexer rule they do not support
+    only turns the fast path off
+    :return: (table, bytes table, dict operator -> type, dict bytes operator -> (type, operator)),
+             None if the rules of lexer.py are not supported
+    """
+    global _tables
+    if _tables is None:
+        try:
+            operators = {text: token_stream.TYPE_NAMES[kind] for text, kind in token_stream.operator_ids().items()}
+            _tables = (_build_table(operators), _build_table(operators, binary=True), operators,
+                       {text.encode('ascii'): (kind, text) for text, kind in operators.items()})
+        except ValueError:
+            _tables = ()
+    return _tables or None
+
+
+def supported():
+    """
+    Method checks that the tables support every rule of lexer.py
+    :return: bool, False when build_lexer returns the PLY lexer and MmapLexer cannot be used
+    """
+    return _load_tables() is not None
+
+
+_ignore = lexer.lexer.lexignore
+_blanks = re.compile('[%s]+' % re.escape(_ignore)).match
+
+
+class FastLexer:
+    """
+    Drop-in replacement of the PLY lexer for the parser: input(), token(), iteration, lineno, lexpos
+    and errorfunc, called with every illegal character
+    """
+
+    def __init__(self, keep_comments=False, lazy_values=False):
+        self.keep_comments = keep_comments
+        self.lazy_values = lazy_values
+        self.fallback = lexer.build_lexer(keep_comments)
+        self.errorfunc = lexer.report_error
+        tables = _load_tables()
+        self.table, self.operators = (tables[0], tables[2]) if tables else (None, None)  # No table: PLY reads all
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        self.fallback.input(data)
+
+    def clone(self):
+        return FastLexer(self.keep_comments, self.lazy_values)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+    def token(self):
+        """
+        Method reads the next token
+        :return: LexToken or None at the end of the input
+        """
+        data = self.lexdata
+        pos = self.lexpos
+        size = self.lexlen
+        table = self.table
+        if table is None:
+            return self._fallback(pos)
+        while pos < size:
+            entry = table.get(data[pos])
+            if entry is None:
+                if data[pos] in _ignore:
+                    pos = _blanks(data, pos).end()
+                    continue
+                return self._fallback(pos)
+            match, actions = entry
+            found = match(data, pos)
+            if found is None:
+                return self._fallback(pos)
+            end = found.end()
+            action, kind = actions[found.lastindex]
+            if self.lazy_values and action in _LAZY_ACTIONS:
+                tok = LazyToken(self, end, _LAZY_ACTIONS[action])
+                tok.type, tok.lineno, tok.lexpos = kind, self.lineno, pos
+                self.lexpos = end
+                return tok
+            value = found.group()
+            if action == _OPERATOR:
+                kind = self.operators[value]
+            elif action == _IDENTIFIER:
+                value = intern(value)
+                kind = lexer.reserved.get(value, 'ID')
+            elif action == _INT:
+                value = int(value)
+            elif action == _DOUBLE:
+                value = float(value)
+            elif action == _NEWLINE:
+                self.lineno += end - pos
+                pos = end
+                continue
+            elif action == _COMMENT:
+                if not self.keep_comments:
+                    pos = end
+                    continue
+            elif action == _MUL_COMMENT:
+                end = skip_multiline_comment(data, pos)
+                value = data[pos:end]
+                lineno = self.lineno
+                self.lineno += value.count('\n')
+                if not self.keep_comments:
+                    pos = end
+                    continue
+                tok = LexToken()
+                tok.type, tok.value, tok.lineno, tok.lexpos = kind, value, lineno, pos
+                self.lexpos = end
+                return tok
+            tok = LexToken()
+            tok.type, tok.value, tok.lineno, tok.lexpos = kind, value, self.lineno, pos
+            self.lexpos = end
+            return tok
+        self.lexpos = pos
+        return None
+
+    def _fallback(self, pos):
+        """
+        Method lets the PLY lexer read the next token at a position the table does not handle
+        :param pos: position in the input
+        :return: LexToken or None at the end of the input
+        """
+        fallback = self.fallback
+        fallback.lexpos = pos
+        fallback.lineno = self.lineno
+        fallback.errorfunc = self.errorfunc
+        tok = fallback.token()
+        self.lexpos = fallback.lexpos
+        self.lineno = fallback.lineno
+        return tok
+
+
+class LazyToken(LexToken):
+    """
+    Token whose value is sliced from the source buffer, and decoded or converted, when it is first read
+    """
+
+    def __init__(self, source, end, convert=None):
+        self.source = source
+        self.end = end
+        self.convert = convert  # int or float for numbers, None for text
+
+    @property
+    def value(self):
+        value = self.__dict__.get('_value')
+        if value is None:
+            value = self.source.lexdata[self.lexpos:self.end]
+            if self.convert is not None:
+                value = self.convert(value)  # int() and float() accept bytes as well
+            elif isinstance(value, bytes):
+                value = value.decode(self.source.encoding)
+            self._value = value
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+
+class MmapLexer:
+    """
+    Lexer over bytes, usually a memory-mapped file, with the same tokens as FastLexer.
+    Offsets are byte offsets; identifiers and operators get their values at once, string literals and comments
+    are LazyTokens, and so are numbers with lazy_values=True
+    """
+
+    def __init__(self, keep_comments=False, encoding='utf8', lazy_values=False):
+        self.keep_comments = keep_comments
+        self.encoding = encoding
+        self.lazy_values = lazy_values
+        self.errorfunc = lexer.report_error
+        tables = _load_tables()
+        if tables is None:
+            raise RuntimeError('Rules of lexer.py are not supported by MmapLexer, see fast_lexer.supported()')
+        self.table, self.operators = tables[1], tables[3]
+        self.lexdata = b''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+
+    def input(self, data):
+        """
+        Method sets the input
+        :param data: bytes, memoryview or mmap
+        """
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+    def token(self):
+        """
+        Method reads the next token
+        :return: LexToken or None at the end of the input
+        """
+        data = self.lexdata
+        pos = self.lexpos
+        size = self.lexlen
+        table = self.table
+        while pos < size:
+            entry = table.get(data[pos])
+            if entry is None:
+                if data[pos] in _ignore_codes:
+                    pos = _bytes_blanks(data, pos).end()
+                    continue
+                pos = self._error(pos)
+                continue
+            match, actions = entry
+            found = match(data, pos)
+            if found is None:
+                pos = self._error(pos)
+                continue
+            end = found.end()
+            action, kind = actions[found.lastindex]
+            if action == _TOKEN or action == _COMMENT or action == _MUL_COMMENT:
+                if action == _MUL_COMMENT:
+                    end = skip_multiline_comment(data, pos)
+                    lineno = self.lineno
+                    self.lineno += data[pos:end].count(b'\n')
+                else:
+                    lineno = self.lineno
+                if action != _TOKEN and not self.keep_comments:
+                    pos = end
+                    continue
+                tok = LazyToken(self, end)
+                tok.type, tok.lineno, tok.lexpos = kind, lineno, pos
+                self.lexpos = end
+                return tok
+            if action == _NEWLINE:
+                self.lineno += end - pos
+                pos = end
+                continue
+            if self.lazy_values and action in _LAZY_ACTIONS:
+                tok = LazyToken(self, end, _LAZY_ACTIONS[action])
+                tok.type, tok.lineno, tok.lexpos = kind, self.lineno, pos
+                self.lexpos = end
+                return tok
+            if action == _OPERATOR:
+                kind, value = self.operators[found.group()]
+            elif action == _IDENTIFIER:
+                value = intern(found.group().decode('ascii'))
+                kind = lexer.reserved.get(value, 'ID')
+            elif action == _INT:
+                value = int(found.group())
+            else:
+                value = float(found.group())
+            tok = LexToken()
+            tok.type, tok.value, tok.lineno, tok.lexpos = kind, value, self.lineno, pos
+            self.lexpos = end
+            return tok
+        self.lexpos = pos
+        return None
+
+    def _error(self, pos):
+        """
+        Method reports an illegal character to errorfunc the way t_error does and skips it
+        :param pos: position of the first byte of the character
+        :return: position after the character
+        """
+        end = pos + 1
+        while end < self.lexlen and end - pos < 4 and 0x80 <= self.lexdata[end] < 0xC0:  # UTF-8 continuation
+            end += 1
+        self.errorfunc(self.lexdata[pos:end].decode(self.encoding, 'replace'), self.lineno, pos)
+        return end
+
+
+_ignore_codes = _ignore.encode('ascii')
+_bytes_blanks = re.compile(('[%s]+' % re.escape(_ignore)).encode('ascii')).match
+
+
+def open_source(path):
+    """
+    Method maps a source file into memory read-only
+    :param path: path to the source file
+    :return: mmap, or bytes for an empty file which cannot be mapped
+    """
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return b''
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def build_lexer(keep_comments=False, lazy_values=False):
+    """
+    Method creates a FastLexer, the counterpart of lexer.build_lexer
+    :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+    :param lazy_values: defer slicing string literals and converting numbers until their value is read
+    :return: FastLexer, the PLY lexer of lexer.build_lexer if the rules of lexer.py are not supported
+    """
+    if not supported():
+        return lexer.build_lexer(keep_comments)
+    return FastLexer(keep_comments, lazy_values)
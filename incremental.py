@@ -0,0 +1,188 @@
+import bisect
+import copy
+
+import lexer
+import line_index
+import swift_parser
+import yacc
+
+
+def _record_statement(p):
+    p.parser.statement_spans.append(p.lexspan(2))
+
+
+def _raise_syntax_error(token):
+    raise SyntaxError('Syntax error at %r' % (token,))
+
+
+def _raise_illegal_character(character, lineno, lexpos):
+    raise SyntaxError('Illegal character %r' % character)
+
+
+def build_recording_parser():
+    """
+    Method creates a parser that records the (first, last token) offsets of every top-level statement
+    in parser.statement_spans and raises SyntaxError instead of recovering from errors
+    :return: parser
+    """
+    parser = yacc.on_top_level_statement(copy.copy(yacc.build_parser()), _record_statement)
+    parser.errorfunc = _raise_syntax_error
+    return parser
+
+
+class IncrementalParser:
+    """
+    Parser for editors: after a text edit only the damaged top-level statements are lexed and parsed again,
+    the AST of every other top-level statement is reused.
+    Reused nodes keep the positions of the parse that created them, offset() and locate() add the shift
+    of their top-level statement.
+    A source with syntax errors or illegal characters is parsed as a whole, with error recovery,
+    until it becomes valid again, errors then holds a SyntaxError with line and column for each of them
+    """
+
+    def __init__(self, text):
+        self.lexer = lexer.build_lexer()
+        self.lexer.errorfunc = _raise_illegal_character
+        self.parser = build_recording_parser()
+        self.recovering = None  # SwiftParser for sources with errors, made on the first one
+        self.errors = []
+        self.text = ''
+        self.ast = None
+        self.starts = []  # Offsets of the top-level statements
+        self.ends = []
+        self.statements = []  # AST of every top-level statement
+        self.shifts = []  # Offset change of every top-level statement since it was parsed
+        self.valid = False  # Statement offsets are known
+        self.reused = 0  # Number of statements reused by the last edit
+        self.lines = None  # LineIndex of the text, made when a line is asked for
+        self.edit(0, 0, text)
+
+    def edit(self, start, end, text):
+        """
+        Method replaces text[start:end] with the new text and updates the AST
+        :param start: offset of the first replaced character
+        :param end: offset after the last replaced character
+        :param text: inserted text
+        :return: AST of the whole new source, node.pos of reused statements is relative to the parse that made them,
+                 use offset() or locate()
+        """
+        self.text = self.text[:start] + text + self.text[end:]
+        self.lines = None
+        count = len(self.statements)
+        if not self.valid or count == 0:
+            self._parse_all()
+            return self.ast
+        delta = len(text) - (end - start)
+        first = bisect.bisect_left(self.ends, start)  # First statement ending at or after the edit
+        last = bisect.bisect_right(self.starts, end) - 1  # Last statement starting at or before the edit
+        low, high = max(first - 1, 0), min(last + 1, count - 1)
+        while not self._parse_window(low, high, delta):
+            if low == 0 and high == count - 1:
+                self._parse_all()
+                return self.ast
+            width = high - low + 1
+            low, high = max(low - width, 0), min(high + width, count - 1)
+        self.ast = self.statements
+        return self.ast
+
+    def offset(self, node, statement):
+        """
+        Method finds where a node starts in the current text
+        :param node: AST node
+        :param statement: index of the top-level statement the node belongs to in the AST
+        :return: offset
+        """
+        return node.pos + self.shifts[statement] if self.valid else node.pos
+
+    def locate(self, node, statement):
+        """
+        Method finds where a node starts in the current text, like line_index.LineIndex.locate
+        :param node: AST node
+        :param statement: index of the top-level statement the node belongs to in the AST
+        :return: (offset, line, column)
+        """
+        if self.lines is None:
+            self.lines = line_index.LineIndex(self.text)
+        offset = self.offset(node, statement)
+        line, column = self.lines.location(offset)
+        return offset, line, column
+
+    def _parse(self, window_start, window_end, next_start):
+        """
+        Method parses the new text between two top-level statement boundaries
+        :param window_start: offset where parsing starts
+        :param window_end: offset where parsing stops
+        :param next_start: expected offset of the first token after the window
+        :return: (starts, ends, statements) of the parsed top-level statements or None if the boundary moved
+        """
+        lex = self.lexer
+        lex.lineno = 1 + self.text.count('\n', 0, window_start)
+        lex.input(self.text)
+        lex.lexpos = window_start
+        token_ends = {}
+        moved = []
+
+        def token():
+            tok = lex.token()
+            if tok is None:
+                return None
+            if tok.lexpos >= window_end:
+                if tok.lexpos != next_start:
+                    moved.append(tok)
+                return None
+            token_ends[tok.lexpos] = lex.lexpos
+            if lex.lexpos > window_end:
+                moved.append(tok)
+            return tok
+
+        self.parser.statement_spans = []
+        statements = self.parser.parse(lexer=lex, tokenfunc=token, tracking=True)
+        if moved:
+            return None
+        spans = self.parser.statement_spans
+        starts = [first for first, _ in spans]
+        ends = [token_ends.get(last, last) for _, last in spans]
+        return starts, ends, statements
+
+    def _parse_all(self):
+        self.reused = 0
+        try:
+            self.starts, self.ends, self.statements = self._parse(0, len(self.text), None)
+        except SyntaxError:
+            self.valid = False
+            self.starts, self.ends, self.statements, self.shifts = [], [], [], []
+            if self.recovering is None:
+                self.recovering = swift_parser.SwiftParser()
+            self.errors = []
+            self.ast = self.recovering.parse_string(self.text, self.errors)
+            return
+        self.errors = []
+        self.valid = True
+        self.shifts = [0] * len(self.statements)
+        self.ast = self.statements
+
+    def _parse_window(self, low, high, delta):
+        """
+        Method parses top-level statements low..high again after an edit
+        :return: True if the statements around the window were not affected by the edit
+        """
+        count = len(self.statements)
+        window_start = 0 if low == 0 else self.starts[low]
+        window_end = len(self.text) if high == count - 1 else self.ends[high] + delta
+        next_start = None if high == count - 1 else self.starts[high + 1] + delta
+        try:
+            parsed = self._parse(window_start, window_end, next_start)
+        except SyntaxError:
+            return False
+        if parsed is None:
+            return False
+        starts, ends, statements = parsed
+        # The last old statement of the window must come out unchanged, or the edit spilled over it
+        if high < count - 1 and (not ends or ends[-1] != window_end or starts[-1] != self.starts[high] + delta):
+            return False
+        self.reused = count - (high - low + 1)
+        self.starts = self.starts[:low] + starts + [offset + delta for offset in self.starts[high + 1:]]
+        self.ends = self.ends[:low] + ends + [offset + delta for offset in self.ends[high + 1:]]
+        self.statements = self.statements[:low] + statements + self.statements[high + 1:]
+        self.shifts = self.shifts[:low] + [0] * len(statements) + [shift + delta for shift in self.shifts[high + 1:]]
+        return True
@@ -1,5 +1,8 @@
+import sys
+from sys import intern
+
 import ply.lex as lex
-from preprocess_comments import format_inline_comment, format_multiline_comment
+from preprocess_comments import skip_multiline_comment
 
 reserved = {
     # DECLARATIONS
@@ -127,6 +130,9 @@ reserved = {
     'Set': 'collection_SET',
     'Array': 'collection_ARRAY',
     'Dictionary': 'collection_DICT',
+    # Float literals, t_ID matches them before any string rule could
+    'inf': 'INF',
+    'nan': 'NAN',
 
 }
 
@@ -135,8 +141,8 @@ tokens = [
              'LESS_EQ', 'EQUAL', 'NOT_EQUAL', 'MULT_AS', 'MINUS_AS', 'PLUS_AS', 'DIV_AS', 'MOD_AS', 'LPAREN', 'RPAREN',
              'LBRACE', 'RBRACE', 'RBRACKET', 'LBRACKET', 'DOT', 'COMMA', 'COLON', 'SEMICOLON', 'AT', 'HASH',
              'AMPERSAND', 'BIT_OR', 'BIT_XOR', 'BIT_NOT', 'LSHIFT', 'RSHIFT', 'RANGE', 'HRANGE', 'ARROW', 'BACKTICK',
-             'QUESTION', 'EXCLAMATION', 'LOG_AND', 'LOG_OR', 'INF', 'NAN', 'MULTPER', 'DOUBLEPER', 'UPD', 'STR_LITERAL',
-             'MUL_STR_LITERAL'
+             'QUESTION', 'EXCLAMATION', 'LOG_AND', 'LOG_OR', 'MULTPER', 'DOUBLEPER', 'UPD', 'STR_LITERAL',
+             'MUL_STR_LITERAL', 'COMMENT', 'MUL_COMMENT'
          ] + list(reserved.values())
 t_PLUS = r'\+'
 t_MINUS = r'-'
@@ -183,13 +189,12 @@ t_MINUS_AS = r'-='
 t_PLUS_AS = r'\+='
 t_DIV_AS = r'/='
 t_MOD_AS = r'%='
-t_INF = r'inf'
-t_NAN = r'nan'
 t_UPD = r':='
 
 
 def t_ID(t):
     r'[#]?[a-zA-Z_][a-zA-Z_0-9]*'
+    t.value = intern(t.value)  # Repeated names share one string, keyword lookup compares by identity
     t.type = reserved.get(t.value, 'ID')  # Check for reserved words
     return t
 
@@ -216,6 +221,22 @@ def t_INT(t):
     return t
 
 
+def t_COMMENT(t):
+    r'//[^\n]*'
+    if t.lexer.keep_comments:
+        return t
+
+
+def t_MUL_COMMENT(t):
+    r'/\*'
+    end = skip_multiline_comment(t.lexer.lexdata, t.lexpos)  # Comments can be nested
+    t.value = t.lexer.lexdata[t.lexpos:end]
+    t.lexer.lexpos = end
+    t.lexer.lineno += t.value.count("\n")
+    if t.lexer.keep_comments:
+        return t
+
+
 # Ignored characters
 t_ignore = " \t\r"
 
@@ -226,19 +247,44 @@ def t_newline(t):
 
 
 def t_error(t):
-    print("Illegal character '%s'" % t.value[0])
+    t.lexer.errorfunc(t.value[0], t.lineno, t.lexpos)
     t.lexer.skip(1)
 
 
+def report_error(character, lineno, lexpos):
+    """
+    Method reports an illegal character, the lexer then skips it. Lexers call their errorfunc attribute,
+    which is this function unless a caller collects the errors instead, see swift_parser.SwiftParser
+    :param character: illegal character
+    :param lineno: line of the character
+    :param lexpos: offset of the character
+    """
+    sys.stderr.write("Illegal character '%s' at line %d\n" % (character, lineno))
+
+
 lexer = lex.lex(debug=0)
+lexer.keep_comments = False  # Emit comments as COMMENT/MUL_COMMENT trivia tokens instead of skipping them
+lexer.errorfunc = report_error
+
+
+def build_lexer(keep_comments=False):
+    """
+    Method creates an independent lexer sharing the master regex of the module lexer
+    :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+    :return: lexer
+    """
+    new_lexer = lexer.clone()
+    new_lexer.keep_comments = keep_comments
+    new_lexer.errorfunc = report_error
+    return new_lexer
 
 
-def tokenize():
+def tokenize(keep_comments=False):
     # Give the lexer some input
     file = open('in.txt', 'r', encoding='utf8')
     data = file.read()
-    data = format_multiline_comment(data)
-    data = format_inline_comment(data)
+    lexer.keep_comments = keep_comments
+    lexer.lineno = 1
     lexer.input(data)
     return lexer
 
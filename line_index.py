@@ -0,0 +1,61 @@
+"""
+Line and column of source offsets.
+Every node stores the offset of its first token in `pos`, the parser does not track lines or columns.
+LineIndex keeps the offsets of the line starts of a source, found in one regex pass,
+and turns an offset into a line and a column by binary search only when they are asked for
+"""
+import array
+import bisect
+import re
+
+_NEWLINE = re.compile('\n')
+_BYTES_NEWLINE = re.compile(b'\n')
+
+
+class LineIndex:
+    """
+    Offsets of the line starts of a source, lines and columns are 1-based like token.lineno and SyntaxError.offset.
+    Offsets and columns are in characters for str and in bytes for bytes or mmap sources
+    """
+
+    def __init__(self, data):
+        newline = _NEWLINE if isinstance(data, str) else _BYTES_NEWLINE
+        self.starts = array.array('i', [0])
+        self.starts.extend(match.end() for match in newline.finditer(data))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def line(self, offset):
+        """
+        Method finds the line of an offset
+        :param offset: offset in the source
+        :return: line number
+        """
+        return bisect.bisect_right(self.starts, offset)
+
+    def column(self, offset):
+        """
+        Method finds the column of an offset
+        :param offset: offset in the source
+        :return: column number
+        """
+        return offset - self.starts[bisect.bisect_right(self.starts, offset) - 1] + 1
+
+    def location(self, offset):
+        """
+        Method finds the line and the column of an offset
+        :param offset: offset in the source
+        :return: (line, column)
+        """
+        line = bisect.bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def locate(self, node):
+        """
+        Method finds where a node starts
+        :param node: AST node or arena Cursor
+        :return: (offset, line, column)
+        """
+        line, column = self.location(node.pos)
+        return node.pos, line, column
@@ -1,2 +1,21 @@
+import argparse
+import sys
+
+import swift_parser
 import yacc
-yacc.parse()
+
+arguments = argparse.ArgumentParser(description='Parse in.txt and write the JSON AST')
+arguments.add_argument('--out', default='out.txt', help='output file, gzipped when it ends with .gz')
+arguments.add_argument('--compact', action='store_true', help='write JSON without indentation')
+arguments.add_argument('--gzip', action='store_true', help='gzip the output file')
+arguments.add_argument('--stdout', action='store_true', help='also print the JSON AST')
+arguments.add_argument('--validate', action='store_true',
+                       help='only check the syntax of in.txt, exit with status 1 if it does not parse')
+args = arguments.parse_args()
+
+if args.validate:
+    errors = swift_parser.SwiftParser().validate_file('in.txt')
+    for error in errors:
+        print('%s:%d:%d: %s' % (error.filename, error.lineno, error.offset, error.msg), file=sys.stderr)
+    sys.exit(1 if errors else 0)
+yacc.parse(args.out, None if args.compact else 4, args.gzip or None, args.stdout)
@@ -0,0 +1,222 @@
+"""
+On-disk cache of parsed ASTs.
+Entries are binary AST files named by a hash of the source bytes, its encoding and everything that shapes the AST:
+the LALR table signature, the code of the grammar actions, the lexer rules and the node kinds and fields.
+A hit reads the file and skips lexing and parsing. Sources with syntax errors are never cached, so their errors are reported every time.
+Files are written to a temporary name and renamed, so processes sharing a directory never see half-written entries
+"""
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import types
+
+import ast_binary
+import ast_nodes
+import lexer
+import parsetab
+import swift_parser
+import yacc
+
+_grammar_key = None
+
+
+def _code_key(code):
+    """
+    Method describes what a function does, nested functions included, without memory addresses
+    :param code: code object
+    :return: tuple
+    """
+    consts = tuple(_code_key(const) if isinstance(const, types.CodeType) else const for const in code.co_consts)
+    return code.co_code, code.co_names, consts
+
+
+def grammar_key():
+    """
+    Method hashes the LALR table signature, the grammar actions, the lexer rules and the AST format, once per process
+    :return: bytes
+    """
+    global _grammar_key
+    if _grammar_key is None:
+        digest = hashlib.sha256()
+        digest.update(parsetab._lr_signature.encode('utf8'))
+        for name in sorted(vars(yacc)):
+            if name.startswith('p_') and callable(getattr(yacc, name)):  # A new action changes the AST, not the tables
+                digest.update(repr((name, _code_key(getattr(yacc, name).__code__))).encode('utf8'))
+        digest.update(repr((lexer.tokens, sorted(lexer.reserved.items()))).encode('utf8'))
+        for name in sorted(vars(lexer)):
+            if not name.startswith('t_'):
+                continue
+            rule = getattr(lexer, name)
+            if callable(rule):  # Pattern and the code that converts the value
+                digest.update(repr((name, rule.__doc__, _code_key(rule.__code__))).encode('utf8'))
+            else:
+                digest.update(repr((name, rule)).encode('utf8'))
+        fields = [cls.__slots__ for cls in ast_nodes.NODE_CLASSES]  # Old entries would decode into the wrong fields
+        digest.update(repr((ast_binary.VERSION, ast_nodes.KIND_NAMES, fields)).encode('utf8'))
+        _grammar_key = digest.digest()
+    return _grammar_key
+
+
+def _report(errors, filename):
+    for error in errors:
+        sys.stderr.write('%s:%d:%d: %s\n' % (filename or '<string>', error.lineno, error.offset, error.msg))
+
+
+class ParseCache:
+    """
+    Parser with an on-disk cache in front of it, has the same parse_* methods as SwiftParser.
+    The least recently used entries are removed when the directory grows over max_bytes
+    """
+
+    def __init__(self, directory, max_bytes=256 * 2 ** 20, parser=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.parser = parser or swift_parser.SwiftParser()
+        self.hits = 0
+        self.misses = 0
+        self.size = None  # Estimated size of the directory, scanned on the first write
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, data, encoding='utf8'):
+        """
+        Method finds the cache file of a source
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :return: path to the cache file
+        """
+        key = hashlib.sha256(grammar_key() + encoding.encode('ascii') + b'\0' + data).hexdigest()
+        return os.path.join(self.directory, key[:2], key + '.sast')
+
+    def parse_bytes(self, data, encoding='utf8', errors=None, filename=None):
+        """
+        Method parses encoded source code or reads its AST from the cache
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :param errors: list receiving a SyntaxError for every syntax error and illegal character,
+                       errors are written to stderr by default
+        :param filename: file name stored in the errors
+        :return: AST
+        """
+        path = self.path(data, encoding)
+        ast = self.load(path)
+        if ast is not None:
+            self.hits += 1
+            return ast
+        self.misses += 1
+        found = []
+        ast = self.parser.parse_string(data.decode(encoding), found, filename)
+        if not found:
+            self.store(path, ast_binary.dumps(ast))
+        elif errors is None:
+            _report(found, filename)
+        else:
+            errors.extend(found)
+        return ast
+
+    def parse_string(self, data, errors=None, filename=None):
+        """
+        Method parses source code or reads its AST from the cache
+        :param data: source code
+        :param errors: list receiving a SyntaxError for every syntax error and illegal character
+        :param filename: file name stored in the errors
+        :return: AST
+        """
+        return self.parse_bytes(data.encode('utf8'), errors=errors, filename=filename)
+
+    def parse_file(self, path, encoding='utf8', errors=None):
+        """
+        Method parses a source file or reads its AST from the cache
+        :param path: path to the source file
+        :param encoding: encoding of the source file
+        :param errors: list receiving a SyntaxError for every syntax error and illegal character
+        :return: AST
+        """
+        with open(path, 'rb') as file:
+            return self.parse_bytes(file.read(), encoding, errors, path)
+
+    def load(self, path):
+        """
+        Method reads a cache entry, a damaged entry is removed
+        :param path: path to the cache file
+        :return: AST, None on a miss
+        """
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:  # Missing or being evicted
+            return None
+        try:
+            return ast_binary.BinaryAST(data).load()
+        except (ValueError, KeyError, IndexError, TypeError, struct.error):  # Truncated or damaged
+            try:
+                os.remove(path)
+            except OSError:  # Removed by another process
+                pass
+            return None
+
+    def store(self, path, data):
+        """
+        Method writes a cache entry atomically and evicts old entries when the cache is full
+        :param path: path to the cache file
+        :param data: binary AST
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        else:
+            self.size += len(data)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self):
+        """
+        Method lists the cache files
+        :return: list of (last use time, size, path)
+        """
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.sast'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # Removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """
+        Method removes the least recently used entries until the cache takes at most 3/4 of max_bytes
+        """
+        entries = sorted(self.entries())
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.max_bytes * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:  # Removed by another process
+                pass
+            self.size -= size
+
+    def stats(self):
+        """
+        Method reports the hit and miss counters
+        :return: dict
+        """
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0}
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AMPERSAND ARROW ASSIGN AT BACKTICK BIT_NOT BIT_OR BIT_XOR COLON COMMA C_APP C_ASSOCIATIVITY C_CONST C_CONVENIENCE C_DID_SET C_DYNAMIC C_FINAL C_GET C_GLOBAL C_INDIRECT C_INFIX C_LAZY C_LEFT C_MUTATING C_NONE C_NONMUTATING C_OPTIONAL C_OVERRIDE C_POSTFIX C_PRAGMA C_PRECEDENCE C_PREFIX C_PROTOCOL C_REQUIRED C_RIGHT C_SET C_TYPE C_TYPEDEF C_UNOWNED C_WEAK C_WILLSET DIV DIV_AS DOT DOUBLE DOUBLEPER D_ASSOCIATED_TYPE D_DEINIT D_ENUM D_EXTENSION D_FILE_PRIVATE D_FUNCTION D_IMPORT D_INIT D_INOUT D_LET D_OPERATOR D_PRIVATE D_PROTOCOL D_PUBLIC D_STATIC D_STRUCT D_SUBSCRIPT D_TYPE_ALIAS D_VAR EQUAL EXCLAMATION E_ANY E_AS E_CATCH E_DEEP E_FALSE E_IS E_NIL E_RETHROWS E_SELF E_SELF_CAPITAL E_STDERR E_STDIN E_STDOUT E_SUPER E_THROW E_THROWS E_TRUE E_TRY E_WAIT GREATER GREATER_EQ HASH HRANGE ID INF INT LBRACE LBRACKET LESS LESS_EQ LOG_AND LOG_OR LPAREN LSHIFT MINUS MINUS_AS MOD MOD_AS MULT MULTPER MULT_AS MUL_STR_LITERAL NAN NOT_EQUAL N_AVAILABLE N_COLOR_LITERAL N_COLUMN N_ELSE N_ELSE_IF N_END_IF N_ERROR N_FILE N_FILE_LITERAL N_FUNCTION N_IF N_IMAGE_LITERAL N_LINE N_SELECTOR N_SOURCE_LOCATION N_WARNING PLUS PLUS_AS P_UNDERSCORE QUESTION RANGE RBRACE RBRACKET RPAREN RSHIFT SEMICOLON STR_LITERAL S_BREAK S_CASE S_CONTINUE S_DEFAULT S_DEFER S_DO S_ELSE S_FALLTHROUGH S_FOR S_FOREACH S_GUARD S_IF S_IN S_ITERATE S_REPEAT S_RETURN S_SWITCH S_UNTIL S_WHERE S_WHILE UPD class_BOOL class_CHARACTER class_DOUBLE class_FLOAT class_INT class_String class_UINT class_VOID collection_ARRAY collection_DICT collection_SET\n    translation-unit  :  statement-star\n    \n    statement-star  : statement statement-star\n                    | empty\n    \n    statement  :  SEMICOLON\n               | global-const-defn\n               | import-stmt\n               | pragma-stmt\n               | func-defn\n               | block\n               | if-stmt\n               | switch-stmt\n               | wait-stmt\n               | foreach-loop\n               | for-loop\n               | var-decl\n               | while-loop\n               | iterate-loop\n               | stmt-chain\n               | opt-else-block\n               | var-name\n               | assignment\n               | func-call\n               | update-stmt\n    \n    global-const-defn  :  C_GLOBAL C_CONST var-decl SEMICOLON\n    \n    import-stmt  :  D_IMPORT module-path SEMICOLON\n                | D_IMPORT STR_LITERAL SEMICOLON\n    \n    module-path  :  ID path-star\n    \n    path-star   : DOT ID path-star\n\t|\n    \n    pragma-stmt  :  C_PRAGMA ID expr  SEMICOLON\n    \n    func-defn  :  swift-func-defn\n               | app-func-defn\n               | foreign-func-defn\n    \n    func-hdr  : D_FUNCTION ID formal-arg-list empty-or-arg-list\n    \n    empty-or-arg-list    : formal-arg-list\n\t                     | empty\n    \n    type-params  : LESS var-name comma-name-star GREATER\n\t             | empty\n    \n    comma-name-star : COMMA var-name comma-name-star\n\t| empty\n    \n    formal-arg-list  : LPAREN opt-formal-args RPAREN\n\t| empty\n    \n    opt-formal-args : formal-arg comma-args-star\n\t| empty\n    \n    comma-args-star : COMMA formal-arg comma-args-star\n\t| empty\n    \n    formal-arg  :  empty-or-range var-name COLON type-prefix\n    \n    empty-or-range    : RANGE\n\t                    | empty\n    \n    empty-or-ass-expr    : formal-arg-list ASSIGN expr\n\t| empty\n    \n    swift-func-defn  :   func-hdr ARROW block\n    \n    app-func-defn  :   C_APP func-hdr LBRACE app-body RBRACE\n    \n    app-body  :  app-arg-expr app-arg-expr-star app-out-star empty-or-semicolon\n    \n    empty-or-semicolon    : SEMICOLON\n\t| empty\n    \n    app-out-star    : std-in-out-err ASSIGN expr app-out-star\n\t|\n    \n    std-in-out-err  : E_STDIN\n                   | E_STDOUT\n                   | E_STDERR\n    \n    app-arg-expr-star   : app-arg-expr app-arg-expr-star\n\t|\n    \n    foreign-func-defn  :   func-hdr foreign-func-body\n    \n    foreign-func-body  :  STR_LITERAL STR_LITERAL empty-or-literal empty-or-more-literals\n    \n    empty-or-literal    : STR_LITERAL\n\t| empty\n    \n    empty-or-more-literals  : LBRACKET single-or-multiple-literal  RBRACKET\n\t| empty\n    \n    single-or-multiple-literal  : STR_LITERAL\n                               | MUL_STR_LITERAL\n    \n    var-decl  :  type-prefix var-decl-rest\n    \n    var-decl-rest-star  : COMMA var-decl-rest var-decl-rest-star\n\t|\n    \n    var-decl-rest  :  var-name type-suffix empty-or-var-mapping empty-or-assign-expr\n    \n    empty :\n    \n    empty-or-var-mapping : var-mapping\n                        | empty\n    \n    empty-or-assign-expr    : ASSIGN expr\n\t                        | empty\n    \n    type-prefix  :  type-name\n                | param-type\n    \n    param-type  :  type-name LESS standalone-type GREATER\n    \n    type-suffix  : LBRACKET empty-or-standalone-type RBRACKET type-suffix\n\t| empty\n    \n    empty-or-standalone-type : standalone-type\n\t| empty\n    \n    standalone-type  :  type-prefix type-suffix\n    \n    var-mapping  :  LESS expr GREATER\n    \n    block  :  LBRACE translation-unit RBRACE\n    \n    stmt-chain  :  chainable-stmt semicolon-or-arrow statement\n    \n    semicolon-or-arrow  : SEMICOLON\n                       | ARROW\n    \n    chainable-stmt  :  var-name\n                     | func-call\n                     | var-decl\n                     | assignment\n    \n    assignment  :  lval-or-paren-lval assign-or-plusas expr-list\n    \n    lval-or-lval-list   : lval-list\n                       | LPAREN lval-list RPAREN\n    \n    assign-or-plusas    : ASSIGN\n                       | PLUS_AS\n    \n    lval-or-paren-lval  :   lval-list\n                       | LPAREN lval-list RPAREN\n    \n    update-stmt  :  var-name LESS ID GREATER UPD expr SEMICOLON\n    \n    if-stmt  :  S_IF LPAREN expr RPAREN block opt-else-block\n    \n    opt-else-block   : S_ELSE block\n\t| empty\n    \n    switch-stmt  :  S_SWITCH LPAREN expr RPAREN LBRACE case-star opt-default RBRACE\n    \n    opt-default : S_DEFAULT\n\t| empty\n    \n    case-star   : case case-star\n\t| empty\n    \n    case  :  S_CASE INT COLON translation-unit\n    \n    default  :  S_DEFAULT COLON translation-unit\n    \n    wait-stmt  :  E_WAIT opt-deep LPAREN expr-list RPAREN block\n    \n    opt-deep    : E_DEEP\n\t| empty\n    \n    foreach-loop  :   S_FOREACH var-name opt-comma-var-name S_IN expr block\n    \n    opt-comma-var-name  : COMMA var-name\n\t| empty\n    \n    for-loop  :   S_FOR LPAREN for-init-list SEMICOLON expr SEMICOLON for-update-list RPAREN block\n    \n    while-loop  :    S_WHILE LPAREN expr RPAREN block\n    \n    for-init-list  :  for-init for-init-star\n    \n    for-init-star   : COMMA for-init for-init-star\n\t                | empty\n    \n    for-init  :  for-assignment\n             | type-prefix var-name type-suffix ASSIGN expr\n    \n    for-update-list  :  for-assignment for-assignment-star\n    \n    for-assignment-star : COMMA for-assignment for-assignment-star\n\t| empty\n    \n    for-assignment  :  var-name ASSIGN expr\n    \n    iterate-loop  :  S_ITERATE var-name block S_UNTIL LPAREN expr RPAREN\n    \n    expr  :  or-expr\n    \n    or-expr  :  and-expr\n            | or-expr LOG_OR and-expr\n    \n    and-expr  :  eq-expr\n             | and-expr LOG_AND eq-expr\n    \n    eq-expr  :  cmp-expr\n            | eq-expr eq-or-not-eq eq-expr\n    \n    eq-or-not-eq    : EQUAL\n                   | NOT_EQUAL\n    \n    cmp-expr  :  add-expr\n             | cmp-expr cmp-sign add-expr\n    \n    cmp-sign        : LESS\n                   | LESS_EQ\n                   | EQUAL\n                   | GREATER\n                   | GREATER_EQ\n    \n    add-expr  :  mult-expr\n             | add-expr add-sign mult-expr\n    \n    add-sign    : PLUS\n               | MINUS\n    \n    mult-expr  :  unary-expr\n              | mult-expr mult-sign unary-expr\n    \n    mult-sign   : MULT\n               | DIV\n               | MULTPER\n               | DOUBLEPER\n               | MOD\n    \n    unary-expr  :  postfix-expr\n                 | minus-or-excl postfix-expr\n    \n    minus-or-excl   : MINUS\n                   | EXCLAMATION\n    \n    postfix-expr  :  base-expr\n                 | postfix-expr array-or-struct\n    \n    array-or-struct : array-subscript\n                   | struct-subscript\n    \n    array-subscript  :  LBRACKET expr RBRACKET\n    \n    struct-subscript  :  DOT ID\n    \n    base-expr  :  literal\n                | func-call\n                | var-name\n                | LPAREN expr RPAREN\n                | -constructor\n                | array-constructor\n    \n    func-call  :   ID LPAREN func-call-arg-list RPAREN\n    \n    func-call-arg-list  :  expr-or-kw func-call-arg-star\n    \n    func-call-arg-star  : COMMA expr-or-kw func-call-arg-star\n\t| empty\n    \n    expr-or-kw  :   expr\n               |   kw-expr\n               | empty\n    \n    -constructor  :  LPAREN expr COMMA expr comma-expr-star RPAREN\n    \n    comma-expr-star : COMMA expr comma-expr-star\n\t| empty\n    \n    array-constructor  :  array-list-constructor\n                      | array-range-constructor\n                      | array-kv-constructor\n    \n    array-list-constructor  :  LBRACKET opt-expr-list RBRACKET\n    \n    opt-expr-list    : expr-list\n\t| empty\n    \n    array-range-constructor  :  LBRACKET expr COLON expr opt-coloned-expr RBRACKET\n    \n    opt-coloned-expr    : COLON expr\n\t| empty\n    \n    array-kv-constructor  :  LBRACE opt-array-constructor RBRACE\n    \n    opt-array-constructor   : array-kv-elem comma-array-kv-elem-star\n\t| empty\n    \n    comma-array-kv-elem-star    : COMMA array-kv-elem comma-array-kv-elem-star\n\t| empty\n    \n    array-kv-elem  :  expr COLON expr\n    \n    kw-expr  :  ID ASSIGN expr\n    \n    literal  :  STR_LITERAL\n            | MUL_STR_LITERAL\n            | INT\n            | float-literal\n            | bool-literal\n    \n    float-literal  :   DOUBLE\n                    | INF\n                    | NAN\n    \n    bool-literal  :  E_TRUE\n                 | E_FALSE\n    \n    expr-list  :  expr\n    \n    type-name  :  class_INT\n              | class_DOUBLE\n              | class_FLOAT\n              | class_VOID\n              | class_UINT\n              | class_BOOL\n              | class_CHARACTER\n              | class_String\n              | collection_SET\n              | collection_ARRAY\n              | collection_DICT\n              | ID\n    \n    const-name  :   ID\n    \n    var-name  :     ID\n    \n    lval-list  :  lval-expr lval-expr-star\n    \n    lval-expr-star  : COMMA lval-expr lval-expr-star\n\t|\n    \n    lval-expr  :  var-name subscript-star\n    \n    subscript-star   : array-subscript  subscript-star\n                    | struct-subscript subscript-star\n                    | empty\n    \n    app-arg-expr  :   opt-at var-name\n                   | literal\n                   | array-constructor\n                   | LPAREN expr RPAREN\n    \n    opt-at  : AT\n\t| empty\n    '
+_lr_signature = 'nonassocIF_WITHOUT_ELSEnonassocS_ELSEleftLOG_ORleftLOG_ANDrightNOT_EQUALleftEQUALLESSLESS_EQGREATERGREATER_EQleftPLUSMINUSleftMULTDIVMULTPERDOUBLEPERMODAMPERSAND ARROW ASSIGN AT BACKTICK BIT_NOT BIT_OR BIT_XOR COLON COMMA COMMENT C_APP C_ASSOCIATIVITY C_CONST C_CONVENIENCE C_DID_SET C_DYNAMIC C_FINAL C_GET C_GLOBAL C_INDIRECT C_INFIX C_LAZY C_LEFT C_MUTATING C_NONE C_NONMUTATING C_OPTIONAL C_OVERRIDE C_POSTFIX C_PRAGMA C_PRECEDENCE C_PREFIX C_PROTOCOL C_REQUIRED C_RIGHT C_SET C_TYPE C_TYPEDEF C_UNOWNED C_WEAK C_WILLSET DIV DIV_AS DOT DOUBLE DOUBLEPER D_ASSOCIATED_TYPE D_DEINIT D_ENUM D_EXTENSION D_FILE_PRIVATE D_FUNCTION D_IMPORT D_INIT D_INOUT D_LET D_OPERATOR D_PRIVATE D_PROTOCOL D_PUBLIC D_STATIC D_STRUCT D_SUBSCRIPT D_TYPE_ALIAS D_VAR EQUAL EXCLAMATION E_ANY E_AS E_CATCH E_DEEP E_FALSE E_IS E_NIL E_RETHROWS E_SELF E_SELF_CAPITAL E_STDERR E_STDIN E_STDOUT E_SUPER E_THROW E_THROWS E_TRUE E_TRY E_WAIT GREATER GREATER_EQ HASH HRANGE ID INF INT LBRACE LBRACKET LESS LESS_EQ LOG_AND LOG_OR LPAREN LSHIFT MINUS MINUS_AS MOD MOD_AS MULT MULTPER MULT_AS MUL_COMMENT MUL_STR_LITERAL NAN NOT_EQUAL N_AVAILABLE N_COLOR_LITERAL N_COLUMN N_ELSE N_ELSE_IF N_END_IF N_ERROR N_FILE N_FILE_LITERAL N_FUNCTION N_IF N_IMAGE_LITERAL N_LINE N_SELECTOR N_SOURCE_LOCATION N_WARNING PLUS PLUS_AS P_UNDERSCORE QUESTION RANGE RBRACE RBRACKET RPAREN RSHIFT SEMICOLON STR_LITERAL S_BREAK S_CASE S_CONTINUE S_DEFAULT S_DEFER S_DO S_ELSE S_FALLTHROUGH S_FOR S_FOREACH S_GUARD S_IF S_IN S_ITERATE S_REPEAT S_RETURN S_SWITCH S_UNTIL S_WHERE S_WHILE UPD class_BOOL class_CHARACTER class_DOUBLE class_FLOAT class_INT class_String class_UINT class_VOID collection_ARRAY collection_DICT collection_SET\n    translation-unit  :  statement-star\n                       | statement-star error\n    \n    statement-star : statement-star statement\n                    | statement-star error SEMICOLON\n                    | empty\n    \n    case-body  :  statement-star\n    \n    statement  :  SEMICOLON\n               | global-const-defn\n               | import-stmt\n               | pragma-stmt\n               | func-defn\n               | block\n               | if-stmt\n               | switch-stmt\n               | wait-stmt\n               | foreach-loop\n               | for-loop\n               | var-decl\n               | while-loop\n               | iterate-loop\n               | stmt-chain\n               | else-block\n               | var-name\n               | assignment\n               | func-call\n               | update-stmt\n    \n    global-const-defn  :  C_GLOBAL C_CONST var-decl SEMICOLON\n    \n    import-stmt  :  D_IMPORT module-path SEMICOLON\n                | D_IMPORT STR_LITERAL SEMICOLON\n    \n    module-path  :  ID path-star\n    \n    path-star : path-star DOT ID\n               |\n    \n    pragma-stmt  :  C_PRAGMA ID expr  SEMICOLON\n    \n    func-defn  :  swift-func-defn\n               | app-func-defn\n               | foreign-func-defn\n    \n    func-hdr  : D_FUNCTION ID\n              | D_FUNCTION ID formal-args\n              | D_FUNCTION ID formal-args formal-args\n    \n    type-params  : LESS var-name comma-name-star GREATER\n\t             | empty\n    \n    comma-name-star : comma-name-star COMMA var-name\n                     | empty\n    \n    formal-arg-list  : formal-args\n\t| empty\n    \n    formal-args  : LPAREN opt-formal-args RPAREN\n    \n    opt-formal-args : formal-arg comma-args-star\n\t| empty\n    \n    comma-args-star : comma-args-star COMMA formal-arg\n                     | empty\n    \n    formal-arg  :  empty-or-range var-name COLON type-prefix\n    \n    empty-or-range    : RANGE\n\t                    | empty\n    \n    empty-or-ass-expr    : formal-arg-list ASSIGN expr\n\t| empty\n    \n    swift-func-defn  :   func-hdr ARROW block\n    \n    app-func-defn  :   C_APP func-hdr LBRACE app-body RBRACE\n    \n    app-body  :  app-arg-expr app-arg-expr-star app-out-star empty-or-semicolon\n    \n    empty-or-semicolon    : SEMICOLON\n\t| empty\n    \n    app-out-star    : app-out-star std-in-out-err ASSIGN expr\n\t|\n    \n    std-in-out-err  : E_STDIN\n                   | E_STDOUT\n                   | E_STDERR\n    \n    app-arg-expr-star : app-arg-expr-star app-arg-expr\n                       |\n    \n    foreign-func-defn  :   func-hdr foreign-func-body\n    \n    foreign-func-body  :  STR_LITERAL STR_LITERAL empty-or-literal empty-or-more-literals\n    \n    empty-or-literal    : STR_LITERAL\n\t| empty\n    \n    empty-or-more-literals  : LBRACKET single-or-multiple-literal  RBRACKET\n\t| empty\n    \n    single-or-multiple-literal  : STR_LITERAL\n                               | MUL_STR_LITERAL\n    \n    var-decl  :  type-prefix var-decl-rest\n    \n    var-decl-rest-star : var-decl-rest-star COMMA var-decl-rest\n                        |\n    \n    var-decl-rest  :  var-name type-suffix empty-or-var-mapping empty-or-assign-expr\n    \n    empty :\n    \n    empty-or-var-mapping : var-mapping\n                        | empty\n    \n    empty-or-assign-expr    : ASSIGN expr\n\t                        | empty\n    \n    type-prefix  :  type-name\n                | param-type\n    \n    param-type  :  builtin-type-name LESS standalone-type GREATER\n                | ID LESS ID GREATER\n                | ID LESS compound-type GREATER\n    \n    compound-type  :  builtin-type-name type-suffix\n                   | param-type type-suffix\n                   | ID type-suffix-plus\n    \n    type-suffix  : type-suffix-plus\n\t| empty\n    \n    type-suffix-plus  : type-suffix-plus LBRACKET empty-or-standalone-type RBRACKET\n                      | LBRACKET empty-or-standalone-type RBRACKET\n    \n    empty-or-standalone-type : standalone-type\n\t| empty\n    \n    standalone-type  :  type-prefix type-suffix\n    \n    var-mapping  :  LESS expr GREATER\n    \n    block  :  LBRACE statement-star RBRACE\n    \n    block  :  LBRACE statement-star error RBRACE\n    \n    stmt-chain  :  chainable-stmt ARROW statement\n    \n    chainable-stmt  :  var-name\n                     | func-call\n                     | var-decl\n                     | assignment\n    \n    assignment  :  lval-or-paren-lval assign-or-plusas expr-list\n    \n    lval-or-lval-list   : lval-list\n                       | LPAREN lval-list RPAREN\n    \n    assign-or-plusas    : ASSIGN\n                       | PLUS_AS\n    \n    lval-or-paren-lval  :   lval-list\n                       | LPAREN lval-list RPAREN\n    \n    update-stmt  :  ID LESS ID GREATER UPD expr SEMICOLON\n    \n    if-stmt  :  S_IF LPAREN expr RPAREN block opt-else-block\n    \n    opt-else-block   : else-block\n\t| %prec IF_WITHOUT_ELSE\n    \n    else-block  :  S_ELSE block\n    \n    switch-stmt  :  S_SWITCH LPAREN expr RPAREN LBRACE case-star opt-default RBRACE\n    \n    opt-default : S_DEFAULT\n\t| empty\n    \n    case-star : case-star case\n               | empty\n    \n    case  :  S_CASE INT COLON case-body\n    \n    default  :  S_DEFAULT COLON case-body\n    \n    wait-stmt  :  E_WAIT opt-deep LPAREN expr-list RPAREN block\n    \n    opt-deep    : E_DEEP\n\t| empty\n    \n    foreach-loop  :   S_FOREACH var-name opt-comma-var-name S_IN expr block\n    \n    opt-comma-var-name  : COMMA var-name\n\t| empty\n    \n    for-loop  :   S_FOR LPAREN for-init-list SEMICOLON expr SEMICOLON for-update-list RPAREN block\n    \n    while-loop  :    S_WHILE LPAREN expr RPAREN block\n    \n    for-init-list  :  for-init for-init-star\n    \n    for-init-star : for-init-star COMMA for-init\n                   | empty\n    \n    for-init  :  for-assignment\n             | type-prefix var-name type-suffix ASSIGN expr\n    \n    for-update-list  :  for-assignment for-assignment-star\n    \n    for-assignment-star : for-assignment-star COMMA for-assignment\n                         | empty\n    \n    for-assignment  :  var-name ASSIGN expr\n    \n    iterate-loop  :  S_ITERATE var-name block S_UNTIL LPAREN expr RPAREN\n    \n    expr  :  expr LOG_OR expr\n          | expr LOG_AND expr\n          | expr EQUAL expr\n          | expr NOT_EQUAL expr\n          | expr LESS expr\n          | expr LESS_EQ expr\n          | expr GREATER expr\n          | expr GREATER_EQ expr\n          | expr PLUS expr\n          | expr MINUS expr\n          | expr MULT expr\n          | expr DIV expr\n          | expr MULTPER expr\n          | expr DOUBLEPER expr\n          | expr MOD expr\n          | MINUS postfix-expr\n          | EXCLAMATION postfix-expr\n          | postfix-expr\n    \n    postfix-expr  :  base-expr\n                 | postfix-expr array-or-struct\n    \n    array-or-struct : array-subscript\n                   | struct-subscript\n    \n    array-subscript  :  LBRACKET expr RBRACKET\n    \n    struct-subscript  :  DOT ID\n    \n    base-expr  :  literal\n                | func-call\n                | var-name\n                | LPAREN expr RPAREN\n                | -constructor\n                | array-constructor\n    \n    func-call  :   ID LPAREN func-call-arg-list RPAREN\n    \n    func-call-arg-list  :  expr-or-kw func-call-arg-star\n    \n    func-call-arg-star : func-call-arg-star COMMA expr-or-kw\n                        | empty\n    \n    expr-or-kw  :   expr\n               |   kw-expr\n               | empty\n    \n    -constructor  :  LPAREN expr COMMA expr comma-expr-star RPAREN\n    \n    comma-expr-star : comma-expr-star COMMA expr\n                     | empty\n    \n    array-constructor  :  array-list-constructor\n                      | array-range-constructor\n                      | array-kv-constructor\n    \n    array-list-constructor  :  LBRACKET opt-expr-list RBRACKET\n    \n    opt-expr-list    : expr-list\n\t| empty\n    \n    array-range-constructor  :  LBRACKET expr COLON expr opt-coloned-expr RBRACKET\n    \n    opt-coloned-expr    : COLON expr\n\t| empty\n    \n    array-kv-constructor  :  LBRACE opt-array-constructor RBRACE\n    \n    opt-array-constructor   : array-kv-elem comma-array-kv-elem-star\n\t| empty\n    \n    comma-array-kv-elem-star : comma-array-kv-elem-star COMMA array-kv-elem\n                              | empty\n    \n    array-kv-elem  :  expr COLON expr\n    \n    kw-expr  :  ID ASSIGN expr\n    \n    literal  :  STR_LITERAL\n            | MUL_STR_LITERAL\n            | INT\n            | float-literal\n            | bool-literal\n    \n    float-literal  :   DOUBLE\n                    | INF\n                    | NAN\n    \n    bool-literal  :  E_TRUE\n                 | E_FALSE\n    \n    expr-list  :  expr\n    \n    type-name  :  builtin-type-name\n              | ID\n    \n    builtin-type-name  :  class_INT\n              | class_DOUBLE\n              | class_FLOAT\n              | class_VOID\n              | class_UINT\n              | class_BOOL\n              | class_CHARACTER\n              | class_String\n              | collection_SET\n              | collection_ARRAY\n              | collection_DICT\n    \n    const-name  :   ID\n    \n    var-name  :     ID\n    \n    lval-list  :  lval-expr lval-expr-star\n    \n    lval-expr-star : lval-expr-star COMMA lval-expr\n                    |\n    \n    lval-expr  :  var-name subscript-star\n    \n    subscript-star   : subscript-star array-subscript\n                    | subscript-star struct-subscript\n                    | empty\n    \n    app-arg-expr  :   opt-at var-name\n                   | literal\n                   | array-constructor\n                   | LPAREN expr RPAREN\n    \n    opt-at  : AT\n\t| empty\n    '
     
-_lr_action_items = {'SEMICOLON':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,42,72,73,74,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,146,148,149,150,152,159,167,168,169,173,175,178,179,180,181,182,183,196,217,218,219,220,226,227,228,230,240,242,245,246,247,254,255,256,258,260,261,277,279,280,281,282,283,284,285,287,292,295,299,300,302,303,305,307,308,310,312,313,314,315,316,323,329,334,335,337,339,340,341,346,347,352,356,371,372,373,381,383,384,385,390,393,395,],[5,5,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,5,93,148,149,-29,-227,-72,-76,5,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,226,-25,-26,-27,228,-90,239,-76,-127,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-29,-30,-177,-124,-126,-76,-77,-78,-66,-76,-67,-63,-236,-237,-190,-136,-138,-140,-144,-151,-155,-174,-196,-28,-76,336,-76,-132,-75,-80,-76,-123,-65,-69,-53,-63,-58,-235,356,-106,-116,-119,-125,-79,-89,-84,-62,375,-238,-105,-128,-133,-68,-193,-184,-109,5,-58,-122,-57,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,63,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,393,],[-76,0,-1,-76,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,-2,-227,-72,-76,-76,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,-122,]),'C_GLOBAL':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[25,25,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,25,-227,-72,-76,25,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,25,-122,]),'D_IMPORT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[26,26,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,26,-227,-72,-76,26,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,26,-122,]),'C_PRAGMA':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[27,27,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,27,-227,-72,-76,27,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,27,-122,]),'LBRACE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,43,69,75,76,78,81,82,88,89,90,91,92,93,94,95,96,97,98,99,100,102,104,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,148,149,159,163,173,175,178,179,180,181,182,183,184,187,189,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,226,228,229,230,232,234,235,237,239,244,245,246,247,248,252,254,255,256,258,260,261,262,267,268,269,276,277,278,279,280,281,282,283,284,285,286,287,289,291,295,297,298,303,304,305,307,308,309,310,312,313,314,316,318,329,334,335,338,339,340,341,352,356,357,360,372,373,377,381,383,384,385,386,393,],[32,32,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,32,32,144,144,144,144,-227,144,-72,-76,144,32,32,-92,-93,-107,144,-101,-102,32,-64,184,-76,144,-134,-135,-137,-139,-143,-150,-154,-161,144,-165,-163,-164,-171,-172,-173,144,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,144,-170,-25,-26,-90,144,-76,-85,-91,-108,-98,-213,-52,-76,144,-76,-42,-169,144,144,144,-141,-142,144,-145,-146,-147,-148,-149,144,-152,-153,144,-156,-157,-158,-159,-160,-166,-167,-168,-162,-24,-30,144,-177,144,32,296,144,144,144,-76,-77,-78,144,32,-66,-76,-67,144,-236,-237,144,-35,-34,-36,144,-190,144,-136,-138,-140,-144,-151,-155,-174,144,-196,144,144,-76,32,32,-75,144,-80,-76,-123,144,-65,-69,-53,144,-235,-41,-106,-116,-119,144,-79,-89,-84,-238,-105,144,144,-133,-68,144,-193,-184,-109,32,32,-122,]),'S_IF':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[33,33,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,33,-227,-72,-76,33,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,33,-122,]),'S_SWITCH':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[35,35,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,35,-227,-72,-76,35,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,35,-122,]),'E_WAIT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[36,36,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,36,-227,-72,-76,36,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,36,-122,]),'S_FOREACH':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[37,37,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,37,-227,-72,-76,37,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,37,-122,]),'S_FOR':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[38,38,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,38,-227,-72,-76,38,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,38,-122,]),'S_WHILE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[40,40,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,40,-227,-72,-76,40,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,40,-122,]),'S_ITERATE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[41,41,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,41,-227,-72,-76,41,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,41,-122,]),'S_ELSE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[43,43,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,43,-227,-72,-76,43,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,43,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,43,-122,]),'ID':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,34,37,39,41,47,48,50,51,52,53,54,55,56,57,58,59,60,61,64,69,70,71,75,76,78,81,82,87,88,89,90,92,93,94,95,96,97,98,100,103,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,151,159,163,165,170,172,173,174,175,178,179,180,181,182,183,184,188,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,226,228,229,230,232,237,239,241,244,245,246,247,248,254,255,256,258,259,260,261,262,263,264,265,272,273,274,276,277,278,279,280,281,282,283,284,285,286,287,289,291,295,303,304,305,307,308,309,310,312,313,314,316,320,329,334,335,336,338,339,340,341,352,354,355,356,357,360,372,373,377,381,383,384,385,388,393,],[28,28,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,74,75,-225,-31,-32,-33,28,81,81,81,81,-81,-82,104,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,107,135,145,147,135,153,135,-227,135,172,-72,-76,135,28,-92,-93,-107,135,-101,-102,-64,147,81,135,-134,-135,-137,-139,-143,-150,-154,-161,135,-165,-163,-164,-171,-172,-173,135,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,135,-170,-225,-25,-26,227,-90,135,81,81,-225,-76,147,-85,-91,-108,-98,-213,-52,-76,-76,-76,-169,135,135,135,-141,-142,135,-145,-146,-147,-148,-149,135,-152,-153,135,-156,-157,-158,-159,-160,-166,-167,-168,-162,-24,-30,135,-177,153,135,135,172,135,-76,-77,-78,135,-66,-76,-67,-76,81,-236,-237,135,-239,-240,-83,-49,81,-48,135,-190,135,-136,-138,-140,-144,-151,-155,-174,135,-196,135,135,-76,-75,135,-80,-76,-123,135,-65,-69,-53,-76,-235,-76,-106,-116,-119,81,135,-79,-89,-84,-238,-49,147,-105,135,135,-133,-68,135,-193,-184,-109,28,81,-122,]),'C_APP':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[46,46,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,46,-227,-72,-76,46,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,46,-122,]),'LPAREN':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,33,35,36,38,40,69,75,76,78,81,82,83,84,85,88,89,90,92,93,94,95,96,97,98,100,104,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,148,149,153,159,163,173,175,178,179,180,181,182,183,184,187,189,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,226,228,229,230,232,237,239,244,245,246,247,248,253,254,255,256,258,260,261,262,276,277,278,279,280,281,282,283,284,285,286,287,289,291,295,303,304,305,307,308,309,310,312,313,314,316,318,329,334,335,338,339,340,341,352,356,357,360,372,373,377,381,383,384,385,393,],[34,34,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,76,-31,-32,-33,34,78,82,-76,87,90,127,127,127,127,-227,127,163,-117,-118,-72,-76,127,34,-92,-93,-107,127,-101,-102,-64,188,127,-134,-135,-137,-139,-143,-150,-154,-161,127,-165,-163,-164,-171,-172,-173,127,-175,-176,-203,-204,-205,-206,-207,76,-187,-188,-189,-208,-209,-210,-211,-212,127,-170,-25,-26,76,-90,127,-76,-85,-91,-108,-98,-213,-52,-76,262,188,-42,-169,127,127,127,-141,-142,127,-145,-146,-147,-148,-149,127,-152,-153,127,-156,-157,-158,-159,-160,-166,-167,-168,-162,-24,-30,127,-177,127,127,127,127,-76,-77,-78,127,309,-66,-76,-67,262,-236,-237,127,127,-190,127,-136,-138,-140,-144,-151,-155,-174,127,-196,127,127,-76,-75,127,-80,-76,-123,127,-65,-69,-53,262,-235,-41,-106,-116,-119,127,-79,-89,-84,-238,-105,127,127,-133,-68,127,-193,-184,-109,34,-122,]),'D_FUNCTION':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,46,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,356,372,373,381,383,384,385,393,],[50,50,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,50,50,-227,-72,-76,50,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,50,-122,]),'class_INT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[51,51,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,51,51,-227,51,-72,-76,51,-92,-93,-107,-64,51,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,51,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,51,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,51,-105,-133,-68,-193,-184,-109,51,-122,]),'class_DOUBLE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[52,52,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,52,52,-227,52,-72,-76,52,-92,-93,-107,-64,52,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,52,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,52,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,52,-105,-133,-68,-193,-184,-109,52,-122,]),'class_FLOAT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[53,53,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,53,53,-227,53,-72,-76,53,-92,-93,-107,-64,53,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,53,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,53,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,53,-105,-133,-68,-193,-184,-109,53,-122,]),'class_VOID':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[54,54,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,54,54,-227,54,-72,-76,54,-92,-93,-107,-64,54,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,54,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,54,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,54,-105,-133,-68,-193,-184,-109,54,-122,]),'class_UINT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[55,55,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,55,55,-227,55,-72,-76,55,-92,-93,-107,-64,55,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,55,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,55,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,55,-105,-133,-68,-193,-184,-109,55,-122,]),'class_BOOL':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[56,56,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,56,56,-227,56,-72,-76,56,-92,-93,-107,-64,56,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,56,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,56,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,56,-105,-133,-68,-193,-184,-109,56,-122,]),'class_CHARACTER':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[57,57,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,57,57,-227,57,-72,-76,57,-92,-93,-107,-64,57,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,57,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,57,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,57,-105,-133,-68,-193,-184,-109,57,-122,]),'class_String':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[58,58,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,58,58,-227,58,-72,-76,58,-92,-93,-107,-64,58,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,58,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,58,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,58,-105,-133,-68,-193,-184,-109,58,-122,]),'collection_SET':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[59,59,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,59,59,-227,59,-72,-76,59,-92,-93,-107,-64,59,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,59,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,59,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,59,-105,-133,-68,-193,-184,-109,59,-122,]),'collection_ARRAY':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[60,60,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,60,60,-227,60,-72,-76,60,-92,-93,-107,-64,60,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,60,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,60,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,60,-105,-133,-68,-193,-184,-109,60,-122,]),'collection_DICT':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,71,81,87,88,89,92,93,94,95,100,103,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,174,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,241,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,303,305,307,308,310,312,313,329,334,335,339,340,341,355,356,372,373,381,383,384,385,393,],[61,61,-108,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,61,61,-227,61,-72,-76,61,-92,-93,-107,-64,61,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,61,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,61,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-75,-80,-76,-123,-65,-69,-53,-106,-116,-119,-79,-89,-84,61,-105,-133,-68,-193,-184,-109,61,-122,]),'RBRACE':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,32,63,77,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,222,223,224,226,228,230,245,246,247,254,255,256,257,258,260,261,277,279,280,281,282,283,284,285,287,288,290,295,296,303,305,307,308,310,312,313,314,315,316,326,327,329,330,331,332,334,335,339,340,341,346,347,352,356,363,364,365,366,367,372,373,374,375,376,381,383,384,385,390,392,393,395,],[-1,-76,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,-76,-2,159,-227,-72,-76,-76,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-76,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,287,-76,-198,-24,-30,-177,-76,-77,-78,-66,-76,-67,313,-63,-236,-237,-190,-136,-138,-140,-144,-151,-155,-174,-196,-197,-200,-76,-76,-75,-80,-76,-123,-65,-69,-53,-63,-58,-235,-76,-201,-106,-76,-76,-113,-116,-119,-79,-89,-84,-62,-76,-238,-105,-199,384,-110,-111,-112,-133,-68,-54,-55,-56,-193,-184,-109,-76,-58,-114,-122,-57,]),'S_CASE':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,63,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,296,303,305,307,308,310,312,313,329,331,334,335,339,340,341,356,372,373,381,383,384,385,392,393,],[-1,-76,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,-2,-227,-72,-76,-76,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,333,-75,-80,-76,-123,-65,-69,-53,-106,333,-116,-119,-79,-89,-84,-105,-133,-68,-193,-184,-109,-76,-114,-122,]),'S_DEFAULT':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,28,29,30,31,63,81,88,89,92,93,94,95,100,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,148,149,159,173,175,178,179,180,181,182,183,196,217,218,219,220,226,228,230,245,246,247,254,255,256,277,279,280,281,282,283,284,285,287,295,296,303,305,307,308,310,312,313,329,330,331,332,334,335,339,340,341,356,367,372,373,381,383,384,385,392,393,],[-1,-76,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-227,-31,-32,-33,-2,-227,-72,-76,-76,-92,-93,-107,-64,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-25,-26,-90,-76,-85,-91,-108,-98,-213,-52,-76,-169,-166,-167,-168,-162,-24,-30,-177,-76,-77,-78,-66,-76,-67,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-76,-75,-80,-76,-123,-65,-69,-53,-106,365,-76,-113,-116,-119,-79,-89,-84,-105,-112,-133,-68,-193,-184,-109,-76,-114,-122,]),'ARROW':([16,21,22,23,28,42,45,81,88,89,104,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,173,175,180,181,187,189,196,217,218,219,220,230,245,246,247,267,268,269,277,279,280,281,282,283,284,285,287,303,305,307,318,339,340,341,381,383,],[-96,-94,-97,-95,-227,94,99,-227,-72,-76,-76,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-76,-85,-98,-213,-76,-42,-169,-166,-167,-168,-162,-177,-76,-77,-78,-35,-34,-36,-190,-136,-138,-140,-144,-151,-155,-174,-196,-75,-80,-76,-41,-79,-89,-84,-193,-184,]),'LESS':([21,28,47,51,52,53,54,55,56,57,58,59,60,61,81,89,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,147,153,172,173,175,196,217,218,219,220,230,277,282,283,284,285,287,307,341,381,383,],[64,-225,103,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-227,-76,203,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-225,-227,-225,248,-85,-169,-166,-167,-168,-162,-177,-190,-144,-151,-155,-174,-196,-76,-84,-193,-184,]),'LBRACKET':([21,28,47,48,51,52,53,54,55,56,57,58,59,60,61,66,67,69,75,76,78,80,81,82,89,90,96,97,98,110,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,147,153,163,183,184,186,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,229,230,232,237,239,243,244,248,254,255,256,258,260,261,262,265,276,277,278,285,286,287,289,291,304,307,309,314,316,338,352,357,360,377,381,383,],[69,-227,-81,-82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,69,69,110,110,110,110,69,-227,110,174,110,110,-101,-102,110,69,110,-165,-163,-164,-171,-172,-173,110,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,110,-170,-225,-227,110,-76,110,174,-169,110,110,110,-141,-142,110,-145,-146,-147,-148,-149,110,-152,-153,110,-156,-157,-158,-159,-160,-166,-167,-168,69,110,-177,110,110,110,174,110,110,-66,311,-67,110,-236,-237,110,-83,110,-190,110,-174,110,-196,110,110,110,174,110,110,-235,110,-238,110,110,110,-193,-184,]),'DOT':([21,28,66,67,74,80,81,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,227,230,277,285,287,381,383,],[70,-227,70,70,151,70,-227,70,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,70,151,-177,-190,-174,-196,-193,-184,]),'COMMA':([21,28,47,48,51,52,53,54,55,56,57,58,59,60,61,62,65,66,67,68,76,80,81,86,108,109,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,147,153,155,156,157,158,168,169,190,196,217,218,219,220,221,223,230,232,265,271,277,279,280,281,282,283,284,285,287,293,294,300,302,325,326,327,353,370,371,379,381,382,383,394,],[-76,-227,-81,-82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,106,-231,-76,-76,-234,-76,-76,-227,165,-232,-233,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-225,-227,232,-181,-182,-183,241,-127,106,-169,-166,-167,-168,-162,286,289,-177,-76,-83,320,-190,-136,-138,-140,-144,-151,-155,-174,-196,-202,232,241,-132,360,289,-201,320,388,-128,-47,-193,360,-184,388,]),'ASSIGN':([21,28,44,49,62,65,66,67,68,80,81,89,105,108,109,145,153,161,171,172,173,175,190,196,243,245,246,247,275,301,307,340,341,348,349,350,351,],[-76,-227,97,-103,-230,-231,-76,-76,-234,-76,-227,-76,-228,-232,-233,-170,229,-104,244,-227,-76,-85,-230,-169,-76,304,-77,-78,-229,338,-76,-89,-84,377,-59,-60,-61,]),'PLUS_AS':([21,28,44,49,62,65,66,67,68,80,81,105,108,109,145,161,190,196,275,],[-76,-227,98,-103,-230,-231,-76,-76,-234,-76,-227,-228,-232,-233,-170,-104,-230,-169,-229,]),'C_CONST':([25,],[71,]),'STR_LITERAL':([26,45,69,75,76,78,81,82,90,96,97,98,101,104,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,183,184,187,189,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,267,268,269,276,277,278,286,287,289,291,304,309,311,314,316,318,338,352,357,360,377,381,],[73,101,130,130,130,130,-227,130,130,130,-101,-102,183,-76,130,130,-163,-164,130,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,130,130,254,130,-76,-42,130,130,130,-141,-142,130,-145,-146,-147,-148,-149,130,-152,-153,130,-156,-157,-158,-159,-160,130,130,130,130,130,130,130,-236,-237,130,-35,-34,-36,130,-190,130,130,-196,130,130,130,130,344,130,-235,-41,130,-238,130,130,130,-193,]),'E_DEEP':([36,],[84,]),'GREATER':([47,48,51,52,53,54,55,56,57,58,59,60,61,107,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,147,153,175,185,186,196,217,218,219,220,230,265,266,277,279,280,281,282,283,284,285,287,306,307,341,381,383,],[-81,-82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,191,-134,-135,-137,206,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-225,-227,-85,265,-76,-169,-166,-167,-168,-162,-177,-83,-88,-190,-136,-138,-140,-144,-151,-155,-174,-196,340,-76,-84,-193,-184,]),'RBRACKET':([47,48,51,52,53,54,55,56,57,58,59,60,61,110,111,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,147,174,175,186,192,193,194,195,196,217,218,219,220,230,249,250,251,265,266,277,279,280,281,282,283,284,285,287,307,324,341,343,344,345,358,359,380,381,383,],[-81,-82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-76,196,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-225,-76,-85,-76,277,-213,-191,-192,-169,-166,-167,-168,-162,-177,307,-86,-87,-83,-88,-190,-136,-138,-140,-144,-151,-155,-174,-196,-76,-76,-84,373,-70,-71,381,-195,-194,-193,-184,]),'RPAREN':([47,48,51,52,53,54,55,56,57,58,59,60,61,62,65,66,67,68,76,79,80,81,105,108,109,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,147,153,154,155,156,157,158,160,162,176,181,188,190,196,217,218,219,220,221,230,231,232,233,236,265,270,271,272,275,277,279,280,281,282,283,284,285,287,293,294,302,317,319,321,325,328,342,353,361,362,369,370,378,379,381,382,383,387,389,391,394,396,],[-81,-82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-230,-231,-76,-76,-234,-76,161,-76,-227,-228,-232,-233,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-225,-227,230,-76,-181,-182,-183,234,235,252,-213,-76,-230,-169,-166,-167,-168,-162,285,-177,-178,-76,-180,297,-83,318,-76,-44,-229,-190,-136,-138,-140,-144,-151,-155,-174,-196,-202,-76,-132,352,-43,-46,-76,-179,372,-76,383,-186,386,-76,-45,-47,-193,-76,-184,-129,-131,-185,-76,-130,]),'MINUS':([69,75,76,78,82,90,96,97,98,110,116,117,118,119,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,153,163,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,229,230,232,237,239,244,248,262,276,277,278,282,283,284,285,286,287,289,291,304,309,338,357,360,377,381,383,],[122,122,122,122,122,122,122,-101,-102,122,210,-150,-154,-161,-165,-171,-172,-173,122,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,122,-170,-227,122,-169,122,122,122,-141,-142,122,-145,-146,-147,-148,-149,122,-152,-153,122,-156,-157,-158,-159,-160,-166,-167,-168,-162,122,-177,122,122,122,122,122,122,122,-190,122,210,-151,-155,-174,122,-196,122,122,122,122,122,122,122,122,-193,-184,]),'EXCLAMATION':([69,75,76,78,82,90,96,97,98,110,127,144,163,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[123,123,123,123,123,123,123,-101,-102,123,123,123,123,123,123,123,-141,-142,123,-145,-146,-147,-148,-149,123,-152,-153,123,-156,-157,-158,-159,-160,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'MUL_STR_LITERAL':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,311,314,316,338,352,357,360,377,381,],[131,131,131,131,-227,131,131,131,-101,-102,131,131,-163,-164,131,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,131,131,131,131,131,131,-141,-142,131,-145,-146,-147,-148,-149,131,-152,-153,131,-156,-157,-158,-159,-160,131,131,131,131,131,131,131,-236,-237,131,131,-190,131,131,-196,131,131,131,131,345,131,-235,131,-238,131,131,131,-193,]),'INT':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,333,338,352,357,360,377,381,],[132,132,132,132,-227,132,132,132,-101,-102,132,132,-163,-164,132,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,132,132,132,132,132,132,-141,-142,132,-145,-146,-147,-148,-149,132,-152,-153,132,-156,-157,-158,-159,-160,132,132,132,132,132,132,132,-236,-237,132,132,-190,132,132,-196,132,132,132,132,132,-235,368,132,-238,132,132,132,-193,]),'DOUBLE':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,338,352,357,360,377,381,],[139,139,139,139,-227,139,139,139,-101,-102,139,139,-163,-164,139,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,139,139,139,139,139,139,-141,-142,139,-145,-146,-147,-148,-149,139,-152,-153,139,-156,-157,-158,-159,-160,139,139,139,139,139,139,139,-236,-237,139,139,-190,139,139,-196,139,139,139,139,139,-235,139,-238,139,139,139,-193,]),'INF':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,338,352,357,360,377,381,],[140,140,140,140,-227,140,140,140,-101,-102,140,140,-163,-164,140,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,140,140,140,140,140,140,-141,-142,140,-145,-146,-147,-148,-149,140,-152,-153,140,-156,-157,-158,-159,-160,140,140,140,140,140,140,140,-236,-237,140,140,-190,140,140,-196,140,140,140,140,140,-235,140,-238,140,140,140,-193,]),'NAN':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,338,352,357,360,377,381,],[141,141,141,141,-227,141,141,141,-101,-102,141,141,-163,-164,141,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,141,141,141,141,141,141,-141,-142,141,-145,-146,-147,-148,-149,141,-152,-153,141,-156,-157,-158,-159,-160,141,141,141,141,141,141,141,-236,-237,141,141,-190,141,141,-196,141,141,141,141,141,-235,141,-238,141,141,141,-193,]),'E_TRUE':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,338,352,357,360,377,381,],[142,142,142,142,-227,142,142,142,-101,-102,142,142,-163,-164,142,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,142,142,142,142,142,142,-141,-142,142,-145,-146,-147,-148,-149,142,-152,-153,142,-156,-157,-158,-159,-160,142,142,142,142,142,142,142,-236,-237,142,142,-190,142,142,-196,142,142,142,142,142,-235,142,-238,142,142,142,-193,]),'E_FALSE':([69,75,76,78,81,82,90,96,97,98,110,120,122,123,127,130,131,132,133,134,136,137,138,139,140,141,142,143,144,163,184,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,232,237,239,244,248,258,260,261,262,276,277,278,286,287,289,291,304,309,314,316,338,352,357,360,377,381,],[143,143,143,143,-227,143,143,143,-101,-102,143,143,-163,-164,143,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,143,143,143,143,143,143,-141,-142,143,-145,-146,-147,-148,-149,143,-152,-153,143,-156,-157,-158,-159,-160,143,143,143,143,143,143,143,-236,-237,143,143,-190,143,143,-196,143,143,143,143,143,-235,143,-238,143,143,143,-193,]),'S_IN':([81,86,164,166,238,],[-227,-76,237,-121,-120,]),'AT':([81,130,131,132,133,134,136,137,138,139,140,141,142,143,184,258,260,261,277,287,314,316,352,381,],[-227,-203,-204,-205,-206,-207,-187,-188,-189,-208,-209,-210,-211,-212,263,263,-236,-237,-190,-196,263,-235,-238,-193,]),'E_STDIN':([81,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,196,217,218,219,220,230,258,260,261,277,279,280,281,282,283,284,285,287,314,315,316,346,352,381,383,390,],[-227,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-169,-166,-167,-168,-162,-177,-63,-236,-237,-190,-136,-138,-140,-144,-151,-155,-174,-196,-63,349,-235,-62,-238,-193,-184,349,]),'E_STDOUT':([81,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,196,217,218,219,220,230,258,260,261,277,279,280,281,282,283,284,285,287,314,315,316,346,352,381,383,390,],[-227,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-169,-166,-167,-168,-162,-177,-63,-236,-237,-190,-136,-138,-140,-144,-151,-155,-174,-196,-63,350,-235,-62,-238,-193,-184,350,]),'E_STDERR':([81,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,196,217,218,219,220,230,258,260,261,277,279,280,281,282,283,284,285,287,314,315,316,346,352,381,383,390,],[-227,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-169,-166,-167,-168,-162,-177,-63,-236,-237,-190,-136,-138,-140,-144,-151,-155,-174,-196,-63,351,-235,-62,-238,-193,-184,351,]),'COLON':([81,112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,193,196,217,218,219,220,225,230,277,279,280,281,282,283,284,285,287,322,324,368,381,383,],[-227,-134,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,278,-169,-166,-167,-168,-162,291,-177,-190,-136,-138,-140,-144,-151,-155,-174,-196,355,357,385,-193,-184,]),'LOG_OR':([112,113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,279,280,281,282,283,284,285,287,381,383,],[197,-135,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,-136,-138,-140,-144,-151,-155,-174,-196,-193,-184,]),'LOG_AND':([113,114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,279,280,281,282,283,284,285,287,381,383,],[198,-137,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,198,-138,-140,-144,-151,-155,-174,-196,-193,-184,]),'EQUAL':([114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,280,281,282,283,284,285,287,381,383,],[200,205,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,200,200,-144,-151,-155,-174,-196,-193,-184,]),'NOT_EQUAL':([114,115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,280,281,282,283,284,285,287,381,383,],[201,-139,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,201,201,-144,-151,-155,-174,-196,-193,-184,]),'LESS_EQ':([115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,282,283,284,285,287,381,383,],[204,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,-144,-151,-155,-174,-196,-193,-184,]),'GREATER_EQ':([115,116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,282,283,284,285,287,381,383,],[207,-143,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,-144,-151,-155,-174,-196,-193,-184,]),'PLUS':([116,117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,282,283,284,285,287,381,383,],[209,-150,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,209,-151,-155,-174,-196,-193,-184,]),'MULT':([117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,283,284,285,287,381,383,],[212,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,212,-155,-174,-196,-193,-184,]),'DIV':([117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,283,284,285,287,381,383,],[213,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,213,-155,-174,-196,-193,-184,]),'MULTPER':([117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,283,284,285,287,381,383,],[214,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,214,-155,-174,-196,-193,-184,]),'DOUBLEPER':([117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,283,284,285,287,381,383,],[215,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,215,-155,-174,-196,-193,-184,]),'MOD':([117,118,119,121,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,153,196,217,218,219,220,230,277,283,284,285,287,381,383,],[216,-154,-161,-165,-171,-172,-173,-175,-176,-203,-204,-205,-206,-207,-227,-187,-188,-189,-208,-209,-210,-211,-212,-170,-227,-169,-166,-167,-168,-162,-177,-190,216,-155,-174,-196,-193,-184,]),'S_UNTIL':([159,177,],[-90,253,]),'RANGE':([188,320,],[274,274,]),'UPD':([191,],[276,]),}
+_lr_action_items = {'error':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,4,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,149,-226,-76,-80,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,394,]),'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,69,70,71,75,79,86,87,90,91,96,106,108,109,110,111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,149,157,158,159,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,231,232,235,236,237,245,246,247,249,251,252,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,298,301,302,304,307,308,310,312,313,314,315,327,328,329,332,333,335,337,338,339,344,345,346,355,363,364,365,377,379,380,387,388,390,392,394,],[-80,6,-5,65,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,108,109,-32,6,-226,-76,-80,6,-119,-68,182,-28,-29,-30,-226,185,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,65,230,-80,-138,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-135,-137,-80,-81,-82,-70,-80,-71,-67,-235,-236,-167,-31,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,334,-143,-79,-84,-96,-134,-69,-73,-57,-62,-234,355,-116,-117,-127,-130,-136,-83,-100,-95,-66,368,-237,-115,-139,-144,-72,-182,-191,-120,-80,-133,-61,6,65,]),'C_GLOBAL':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,26,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,26,-226,-76,-80,26,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,26,]),'D_IMPORT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,27,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,27,-226,-76,-80,27,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,27,]),'C_PRAGMA':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,28,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,28,-226,-76,-80,28,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,28,]),'LBRACE':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,44,65,72,73,75,76,79,80,86,87,88,89,90,91,92,93,94,95,96,98,99,104,108,109,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,148,153,163,164,165,169,170,171,172,173,174,175,181,182,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,215,216,224,225,226,228,230,234,235,236,237,238,243,245,246,247,249,251,252,253,256,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,290,292,293,294,296,297,302,303,304,307,308,309,310,312,313,314,315,317,324,328,329,332,333,336,337,338,339,344,346,351,355,364,365,376,377,379,380,382,385,387,388,392,],[-80,33,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,33,-4,137,137,33,137,-226,137,-76,-80,137,33,33,-119,137,-111,-112,33,-68,174,-37,137,-28,-29,-226,137,-162,137,-163,-169,-170,-171,137,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,137,137,-101,137,-80,-93,-94,-103,-108,-211,-56,-80,137,-38,-168,-27,-33,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,-160,-164,-165,-166,-161,137,-175,-102,33,295,137,137,137,-80,-81,-82,137,33,-70,-80,-71,-67,-235,-236,137,-39,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,137,-188,137,-194,137,137,137,-118,33,33,-79,137,-84,-96,-134,137,-69,-73,-57,137,-234,-46,137,-116,-117,-127,-130,137,-83,-100,-95,-66,-237,137,-115,-144,-72,137,-182,-191,-120,33,137,-80,-133,33,]),'S_IF':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,34,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,34,-226,-76,-80,34,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,34,]),'S_SWITCH':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,36,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,36,-226,-76,-80,36,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,36,]),'E_WAIT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,37,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,37,-226,-76,-80,37,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,37,]),'S_FOREACH':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,38,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,38,-226,-76,-80,38,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,38,]),'S_FOR':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,39,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,39,-226,-76,-80,39,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,39,]),'S_WHILE':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,41,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,41,-226,-76,-80,41,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,41,]),'S_ITERATE':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,42,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,42,-226,-76,-80,42,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,42,]),'S_ELSE':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,44,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,44,-226,-76,-80,44,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,44,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,44,]),'ID':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,29,30,31,32,33,35,38,40,42,48,49,51,52,54,55,56,57,58,59,60,61,62,63,64,65,68,72,73,74,75,76,79,80,85,86,87,88,90,91,92,93,94,96,100,104,105,107,108,109,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,148,153,155,160,162,163,164,165,166,169,170,171,172,173,174,176,179,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,215,216,219,221,224,228,230,234,235,236,237,238,239,245,246,247,249,250,251,252,253,254,255,259,260,261,262,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,290,292,293,294,299,302,303,304,307,308,309,310,312,313,314,315,321,324,328,329,332,333,334,336,337,338,339,344,346,347,348,351,355,364,365,374,376,377,379,380,385,387,388,389,392,],[-80,29,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,71,72,-213,-34,-35,-36,-80,79,79,79,79,-85,-86,99,-212,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-4,107,111,138,144,29,111,-226,111,162,-76,-80,111,29,-119,111,-111,-112,-68,107,111,181,-213,-28,-29,-226,111,-162,111,-163,-169,-170,-171,111,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,111,111,-101,111,79,79,-213,-80,-93,-94,107,-103,-108,-211,-56,-80,-80,-80,79,-168,-27,266,267,-33,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-160,-164,-165,-166,-161,111,-175,-88,-89,-102,111,111,111,-80,-81,-82,111,107,-70,-80,-71,-67,79,-235,-236,111,-238,-239,-53,79,-52,-87,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,111,-188,111,-194,111,138,111,-118,162,-79,111,-84,-96,-134,111,-69,-73,-57,-80,-234,-88,111,-116,-117,-127,-130,79,111,-83,-100,-95,-66,-237,-80,107,111,-115,-144,-72,-53,111,-182,-191,-120,111,-80,-133,79,29,]),'C_APP':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,47,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,47,-226,-76,-80,47,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,47,]),'LPAREN':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,34,36,37,39,41,65,72,73,75,76,79,80,81,82,83,86,87,88,90,91,92,93,94,96,99,104,108,109,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,148,153,163,164,165,169,170,171,172,173,174,175,181,182,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,215,216,224,228,230,234,235,236,237,238,244,245,246,247,249,251,252,253,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,290,292,293,294,302,303,304,307,308,309,310,312,313,314,315,317,324,328,329,332,333,336,337,338,339,344,346,351,355,364,365,376,377,379,380,385,387,388,392,],[-80,35,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,73,-34,-35,-36,-80,76,80,-80,85,88,-4,120,120,35,120,-226,120,153,-128,-129,-76,-80,120,35,-119,120,-111,-112,-68,176,120,-28,-29,73,120,-162,120,-163,-169,-170,-171,120,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,120,120,73,-101,120,-80,-93,-94,-103,-108,-211,-56,-80,253,176,-168,-27,-33,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,-160,-164,-165,-166,-161,120,-175,-102,120,120,120,-80,-81,-82,120,309,-70,-80,-71,-67,-235,-236,120,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,120,-188,120,-194,120,120,120,-118,-79,120,-84,-96,-134,120,-69,-73,-57,253,-234,-46,120,-116,-117,-127,-130,120,-83,-100,-95,-66,-237,120,-115,-144,-72,120,-182,-191,-120,120,-80,-133,35,]),'D_FUNCTION':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,47,65,75,79,86,87,90,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,387,388,392,],[-80,51,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,51,-4,51,-226,-76,-80,51,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-80,-133,51,]),'class_INT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,54,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,54,54,54,-226,54,-76,-80,54,-119,-68,54,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,54,-103,-108,-211,-56,-80,-168,-27,54,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,54,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,54,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,54,-115,-144,-72,-182,-191,-120,-80,-133,54,]),'class_DOUBLE':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,55,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,55,55,55,-226,55,-76,-80,55,-119,-68,55,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,55,-103,-108,-211,-56,-80,-168,-27,55,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,55,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,55,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,55,-115,-144,-72,-182,-191,-120,-80,-133,55,]),'class_FLOAT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,56,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,56,56,56,-226,56,-76,-80,56,-119,-68,56,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,56,-103,-108,-211,-56,-80,-168,-27,56,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,56,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,56,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,56,-115,-144,-72,-182,-191,-120,-80,-133,56,]),'class_VOID':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,57,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,57,57,57,-226,57,-76,-80,57,-119,-68,57,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,57,-103,-108,-211,-56,-80,-168,-27,57,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,57,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,57,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,57,-115,-144,-72,-182,-191,-120,-80,-133,57,]),'class_UINT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,58,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,58,58,58,-226,58,-76,-80,58,-119,-68,58,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,58,-103,-108,-211,-56,-80,-168,-27,58,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,58,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,58,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,58,-115,-144,-72,-182,-191,-120,-80,-133,58,]),'class_BOOL':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,59,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,59,59,59,-226,59,-76,-80,59,-119,-68,59,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,59,-103,-108,-211,-56,-80,-168,-27,59,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,59,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,59,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,59,-115,-144,-72,-182,-191,-120,-80,-133,59,]),'class_CHARACTER':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,60,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,60,60,60,-226,60,-76,-80,60,-119,-68,60,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,60,-103,-108,-211,-56,-80,-168,-27,60,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,60,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,60,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,60,-115,-144,-72,-182,-191,-120,-80,-133,60,]),'class_String':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,61,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,61,61,61,-226,61,-76,-80,61,-119,-68,61,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,61,-103,-108,-211,-56,-80,-168,-27,61,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,61,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,61,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,61,-115,-144,-72,-182,-191,-120,-80,-133,61,]),'collection_SET':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,62,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,62,62,62,-226,62,-76,-80,62,-119,-68,62,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,62,-103,-108,-211,-56,-80,-168,-27,62,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,62,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,62,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,62,-115,-144,-72,-182,-191,-120,-80,-133,62,]),'collection_ARRAY':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,63,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,63,63,63,-226,63,-76,-80,63,-119,-68,63,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,63,-103,-108,-211,-56,-80,-168,-27,63,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,63,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,63,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,63,-115,-144,-72,-182,-191,-120,-80,-133,63,]),'collection_DICT':([0,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,68,74,75,79,85,86,87,90,91,96,100,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,166,169,170,171,172,173,181,182,183,185,201,202,203,204,205,216,224,235,236,237,239,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,299,302,304,307,308,310,312,313,328,329,332,333,337,338,339,348,355,364,365,377,379,380,387,388,392,],[-80,64,-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,64,64,64,-226,64,-76,-80,64,-119,-68,64,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,64,-103,-108,-211,-56,-80,-168,-27,64,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,64,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,64,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,64,-115,-144,-72,-182,-191,-120,-80,-133,64,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,65,79,86,87,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,302,304,307,308,310,312,313,328,329,332,333,337,338,339,355,364,365,377,379,380,388,],[-80,0,-1,-5,-2,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-4,-226,-76,-80,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-79,-84,-96,-134,-69,-73,-57,-116,-117,-127,-130,-83,-100,-95,-115,-144,-72,-182,-191,-120,-133,]),'RBRACE':([3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,65,75,79,86,87,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,148,149,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,211,212,213,216,224,235,236,237,245,246,247,248,249,251,252,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,288,289,294,295,302,304,307,308,310,312,313,314,315,325,328,329,330,331,332,333,337,338,339,344,345,346,354,355,356,357,358,359,364,365,366,368,369,377,379,380,387,388,390,391,392,],[-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-80,-4,148,-226,-76,-80,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-80,-101,224,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,287,-80,-196,-175,-102,-80,-81,-82,-70,-80,-71,313,-67,-235,-236,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-195,-198,-118,-80,-79,-84,-96,-134,-69,-73,-57,-62,-234,-199,-116,-117,-80,-124,-127,-130,-83,-100,-95,-66,-80,-237,-197,-115,380,-123,-121,-122,-144,-72,-58,-59,-60,-182,-191,-120,-80,-133,-61,-125,-6,]),'S_DEFAULT':([3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,65,79,86,87,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,295,302,304,307,308,310,312,313,328,329,330,331,332,333,337,338,339,355,357,364,365,377,379,380,387,388,391,392,],[-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-4,-226,-76,-80,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-80,-79,-84,-96,-134,-69,-73,-57,-116,-117,358,-124,-127,-130,-83,-100,-95,-115,-123,-144,-72,-182,-191,-120,-80,-133,-125,-6,]),'S_CASE':([3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,65,79,86,87,91,96,108,109,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,148,163,164,165,169,170,171,172,173,181,182,185,201,202,203,204,205,216,224,235,236,237,245,246,247,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,294,295,302,304,307,308,310,312,313,328,329,330,331,332,333,337,338,339,355,357,364,365,377,379,380,387,388,391,392,],[-5,-3,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-226,-34,-35,-36,-4,-226,-76,-80,-119,-68,-28,-29,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-101,-80,-93,-94,-103,-108,-211,-56,-80,-168,-27,-33,-160,-164,-165,-166,-161,-175,-102,-80,-81,-82,-70,-80,-71,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-118,-80,-79,-84,-96,-134,-69,-73,-57,-116,-117,360,-124,-127,-130,-83,-100,-95,-115,-123,-144,-72,-182,-191,-120,-80,-133,-125,-6,]),'ARROW':([17,22,23,24,29,43,46,79,86,87,99,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,163,164,165,170,171,175,181,201,202,203,204,205,216,235,236,237,256,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,302,304,307,317,337,338,339,377,379,],[-106,-104,-107,-105,-226,90,95,-226,-76,-80,-37,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-80,-93,-94,-108,-211,-38,-168,-160,-164,-165,-166,-161,-175,-80,-81,-82,-39,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-79,-84,-96,-46,-83,-100,-95,-182,-191,]),'LBRACKET':([22,29,48,49,52,54,55,56,57,58,59,60,61,62,63,64,66,67,72,73,76,78,79,80,87,88,92,93,94,102,103,104,107,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,144,146,147,153,164,173,174,178,181,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,215,216,220,221,228,230,233,234,238,245,246,247,249,251,252,253,262,265,266,283,284,285,286,287,290,292,293,303,307,309,314,315,321,324,336,338,339,344,346,351,376,377,379,385,],[-80,-226,-85,-86,-212,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,104,-233,136,136,136,-80,-226,136,166,136,136,-111,-112,-231,-232,136,-213,-226,136,104,136,-163,-169,-170,-171,136,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,136,136,-226,166,166,166,136,239,-80,136,166,-168,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,104,-164,-165,-166,104,136,-175,239,-89,136,136,166,136,136,-70,311,-71,-67,-235,-236,136,-87,-167,166,-172,136,-188,136,-194,136,136,136,136,-96,136,136,-234,-88,136,136,136,-95,-66,-237,136,136,-182,-191,136,]),'DOT':([22,29,66,67,71,78,79,102,103,110,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,181,201,202,203,204,205,216,265,267,283,285,287,377,379,],[-80,-226,105,-233,-32,-80,-226,-231,-232,184,-226,105,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,-168,105,-164,-165,-166,105,-175,-167,-31,-172,-188,-194,-182,-191,]),'COMMA':([22,29,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,73,78,79,84,101,102,103,107,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,140,141,142,143,158,159,181,201,202,203,204,205,206,212,216,217,218,221,231,232,258,262,264,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,288,289,291,292,301,318,319,321,322,325,326,335,349,350,354,362,363,373,375,377,379,383,384,386,393,],[-80,-226,-85,-86,-212,-229,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-230,-233,-80,-80,-226,155,179,-231,-232,-213,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,-80,-179,-180,-181,-80,-138,-168,-160,-164,-165,-166,-161,284,-80,-175,292,-178,-89,299,-137,-80,-87,-228,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,324,-198,-200,-80,-143,347,-50,-88,-80,-199,-177,-136,376,-184,-197,-80,-139,-49,-51,-182,-191,389,-142,-183,-141,]),'ASSIGN':([22,29,45,50,53,66,67,78,79,87,101,102,103,138,151,161,162,163,164,165,181,233,235,236,237,264,265,300,307,338,339,367,370,371,372,],[-80,-226,93,-113,-229,-230,-233,-80,-226,-80,-227,-231,-232,215,-114,234,-226,-80,-93,-94,-168,-80,303,-81,-82,-228,-167,336,-96,-100,-95,385,-63,-64,-65,]),'PLUS_AS':([22,29,45,50,53,66,67,78,79,101,102,103,151,181,264,265,],[-80,-226,94,-113,-229,-230,-233,-80,-226,-227,-231,-232,-114,-168,-228,-167,]),'C_CONST':([26,],[68,]),'STR_LITERAL':([27,46,72,73,76,79,80,88,92,93,94,97,99,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,173,174,175,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,256,284,285,286,287,290,292,293,303,309,311,314,315,317,324,336,338,344,346,351,376,379,385,],[70,97,123,123,123,-226,123,123,123,-111,-112,173,-37,123,123,123,123,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,123,123,123,245,123,-38,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-67,-235,-236,123,-39,123,-188,123,-194,123,123,123,123,123,342,123,-234,-46,123,123,123,-66,-237,123,123,-191,123,]),'LESS':([29,52,54,55,56,57,58,59,60,61,62,63,64,79,87,107,111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,144,146,150,152,162,163,164,165,167,171,180,181,201,202,203,204,205,206,208,214,216,265,266,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,307,316,322,323,325,327,337,339,340,363,377,378,379,386,390,],[74,100,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-226,-80,183,-226,190,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,190,183,100,190,190,183,238,-93,-94,190,190,190,-168,-160,-164,-165,-166,-161,190,190,190,-175,-167,183,190,190,-147,190,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,190,190,190,190,190,-96,190,190,190,190,190,190,-95,190,190,-182,190,-191,190,190,]),'E_DEEP':([37,],[82,]),'GREATER':([48,49,52,54,55,56,57,58,59,60,61,62,63,64,107,111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,144,145,146,147,150,152,164,165,167,171,177,178,180,181,201,202,203,204,205,206,208,214,216,220,221,222,223,262,263,265,266,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,307,316,321,322,323,325,327,337,339,340,363,377,378,379,386,390,],[-85,-86,-212,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-213,-226,192,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,192,219,221,-80,-80,192,192,-93,-94,192,192,262,-80,192,-168,-160,-164,-165,-166,-161,192,192,192,-175,-92,-89,-90,-91,-87,-99,-167,321,192,192,-147,192,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,192,192,192,192,338,-96,192,-88,192,192,192,192,192,-95,192,192,-182,192,-191,192,192,]),'RBRACKET':([48,49,52,54,55,56,57,58,59,60,61,62,63,64,107,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,164,165,166,178,180,181,201,202,203,204,205,207,208,209,210,216,221,239,240,241,242,262,263,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,306,307,321,323,339,341,342,343,352,353,377,378,379,],[-85,-86,-212,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-213,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-80,-93,-94,-80,-80,265,-168,-160,-164,-165,-166,-161,285,-211,-189,-190,-175,-89,-80,307,-97,-98,-87,-99,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,339,-96,-88,-80,-95,365,-74,-75,379,-193,-182,-192,-191,]),'RPAREN':([48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,73,77,78,79,101,102,103,107,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,143,150,152,167,171,176,181,201,202,203,204,205,206,216,217,218,221,227,257,258,259,262,264,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,292,301,316,318,319,321,322,326,340,349,350,361,362,373,375,377,379,383,384,386,393,],[-85,-86,-212,-229,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-230,-233,-80,151,-80,-226,-227,-231,-232,-213,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,216,-80,-179,-180,-181,225,226,243,-211,-80,-168,-160,-164,-165,-166,-161,283,-175,-176,-178,-89,296,317,-80,-48,-87,-228,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-200,-80,-143,346,-47,-50,-88,-80,-177,364,377,-184,382,-80,-49,-51,-182,-191,-140,-142,-183,-141,]),'MINUS':([72,73,76,80,88,92,93,94,104,111,112,114,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,141,150,152,153,167,171,180,181,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,208,214,215,216,228,230,234,238,253,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,290,291,292,293,297,298,301,303,305,309,316,322,323,324,325,327,336,337,338,340,351,363,376,377,378,379,385,386,390,],[113,113,113,113,113,113,-111,-112,113,-226,195,-162,-163,-169,-170,-171,113,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,113,113,-226,195,195,195,113,195,195,195,-168,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-160,-164,-165,-166,-161,195,195,195,113,-175,113,113,113,113,113,-167,195,195,195,195,195,195,195,195,-153,-154,-155,-156,-157,-158,-159,-172,113,-188,113,-194,113,195,113,113,195,195,195,113,195,113,195,195,195,113,195,195,113,195,113,195,113,195,113,-182,195,-191,113,195,195,]),'EXCLAMATION':([72,73,76,80,88,92,93,94,104,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,],[115,115,115,115,115,115,-111,-112,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'MUL_STR_LITERAL':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,311,314,315,324,336,338,344,346,351,376,379,385,],[124,124,124,-226,124,124,124,-111,-112,124,124,124,124,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-67,-235,-236,124,124,-188,124,-194,124,124,124,124,124,343,124,-234,124,124,124,-66,-237,124,124,-191,124,]),'INT':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,360,376,379,385,],[125,125,125,-226,125,125,125,-111,-112,125,125,125,125,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-67,-235,-236,125,125,-188,125,-194,125,125,125,125,125,125,-234,125,125,125,-66,-237,125,381,125,-191,125,]),'DOUBLE':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,376,379,385,],[131,131,131,-226,131,131,131,-111,-112,131,131,131,131,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,-67,-235,-236,131,131,-188,131,-194,131,131,131,131,131,131,-234,131,131,131,-66,-237,131,131,-191,131,]),'INF':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,376,379,385,],[132,132,132,-226,132,132,132,-111,-112,132,132,132,132,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,-67,-235,-236,132,132,-188,132,-194,132,132,132,132,132,132,-234,132,132,132,-66,-237,132,132,-191,132,]),'NAN':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,376,379,385,],[133,133,133,-226,133,133,133,-111,-112,133,133,133,133,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,-67,-235,-236,133,133,-188,133,-194,133,133,133,133,133,133,-234,133,133,133,-66,-237,133,133,-191,133,]),'E_TRUE':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,376,379,385,],[134,134,134,-226,134,134,134,-111,-112,134,134,134,134,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,-67,-235,-236,134,134,-188,134,-194,134,134,134,134,134,134,-234,134,134,134,-66,-237,134,134,-191,134,]),'E_FALSE':([72,73,76,79,80,88,92,93,94,104,113,115,120,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,249,251,252,253,284,285,286,287,290,292,293,303,309,314,315,324,336,338,344,346,351,376,379,385,],[135,135,135,-226,135,135,135,-111,-112,135,135,135,135,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,-67,-235,-236,135,135,-188,135,-194,135,135,135,135,135,135,-234,135,135,135,-66,-237,135,135,-191,135,]),'S_IN':([79,84,154,156,229,],[-226,-80,228,-132,-131,]),'AT':([79,123,124,125,126,127,128,129,130,131,132,133,134,135,174,249,251,252,285,287,314,315,344,346,379,],[-226,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,254,-67,-235,-236,-188,-194,254,-234,-66,-237,-191,]),'E_STDIN':([79,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,181,201,202,203,204,205,216,249,251,252,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,314,315,344,345,346,377,379,390,],[-226,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-168,-160,-164,-165,-166,-161,-175,-67,-235,-236,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-62,-234,-66,370,-237,-182,-191,-61,]),'E_STDOUT':([79,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,181,201,202,203,204,205,216,249,251,252,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,314,315,344,345,346,377,379,390,],[-226,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-168,-160,-164,-165,-166,-161,-175,-67,-235,-236,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-62,-234,-66,371,-237,-182,-191,-61,]),'E_STDERR':([79,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,181,201,202,203,204,205,216,249,251,252,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,314,315,344,345,346,377,379,390,],[-226,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-168,-160,-164,-165,-166,-161,-175,-67,-235,-236,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,-62,-234,-66,372,-237,-182,-191,-61,]),'COLON':([79,111,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,181,201,202,203,204,205,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,320,323,377,379,381,],[-226,-226,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-168,-160,-164,-165,-166,-161,286,290,-175,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,348,351,-182,-191,387,]),'LOG_OR':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,186,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,186,186,186,186,186,186,-168,-160,-164,-165,-166,-161,186,186,186,-175,-167,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,186,186,186,186,186,186,186,186,186,186,186,186,186,-182,186,-191,186,186,]),'LOG_AND':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,187,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,187,187,187,187,187,187,-168,-160,-164,-165,-166,-161,187,187,187,-175,-167,187,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,187,187,187,187,187,187,187,187,187,187,187,187,187,-182,187,-191,187,187,]),'EQUAL':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,188,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,188,188,188,188,188,188,-168,-160,-164,-165,-166,-161,188,188,188,-175,-167,188,188,-147,188,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,188,188,188,188,188,188,188,188,188,188,188,188,188,-182,188,-191,188,188,]),'NOT_EQUAL':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,189,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,189,189,189,189,189,189,-168,-160,-164,-165,-166,-161,189,189,189,-175,-167,189,189,-147,189,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,189,189,189,189,189,189,189,189,189,189,189,189,189,-182,189,-191,189,189,]),'LESS_EQ':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,191,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,191,191,191,191,191,191,-168,-160,-164,-165,-166,-161,191,191,191,-175,-167,191,191,-147,191,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,191,191,191,191,191,191,191,191,191,191,191,191,191,-182,191,-191,191,191,]),'GREATER_EQ':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,193,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,193,193,193,193,193,193,-168,-160,-164,-165,-166,-161,193,193,193,-175,-167,193,193,-147,193,-149,-150,-151,-152,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,193,193,193,193,193,193,193,193,193,193,193,193,193,-182,193,-191,193,193,]),'PLUS':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,194,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,194,194,194,194,194,194,-168,-160,-164,-165,-166,-161,194,194,194,-175,-167,194,194,194,194,194,194,194,194,-153,-154,-155,-156,-157,-158,-159,-172,-188,-194,194,194,194,194,194,194,194,194,194,194,194,194,194,-182,194,-191,194,194,]),'MULT':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,196,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,196,196,196,196,196,196,-168,-160,-164,-165,-166,-161,196,196,196,-175,-167,196,196,196,196,196,196,196,196,196,196,-155,-156,-157,-158,-159,-172,-188,-194,196,196,196,196,196,196,196,196,196,196,196,196,196,-182,196,-191,196,196,]),'DIV':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,197,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,197,197,197,197,197,197,-168,-160,-164,-165,-166,-161,197,197,197,-175,-167,197,197,197,197,197,197,197,197,197,197,-155,-156,-157,-158,-159,-172,-188,-194,197,197,197,197,197,197,197,197,197,197,197,197,197,-182,197,-191,197,197,]),'MULTPER':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,198,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,198,198,198,198,198,198,-168,-160,-164,-165,-166,-161,198,198,198,-175,-167,198,198,198,198,198,198,198,198,198,198,-155,-156,-157,-158,-159,-172,-188,-194,198,198,198,198,198,198,198,198,198,198,198,198,198,-182,198,-191,198,198,]),'DOUBLEPER':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,199,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,199,199,199,199,199,199,-168,-160,-164,-165,-166,-161,199,199,199,-175,-167,199,199,199,199,199,199,199,199,199,199,-155,-156,-157,-158,-159,-172,-188,-194,199,199,199,199,199,199,199,199,199,199,199,199,199,-182,199,-191,199,199,]),'MOD':([111,112,114,116,117,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,150,152,167,171,180,181,201,202,203,204,205,206,208,214,216,265,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,285,287,291,297,298,301,305,316,322,323,325,327,337,340,363,377,378,379,386,390,],[-226,200,-162,-163,-169,-170,-171,-173,-174,-201,-202,-203,-204,-205,-185,-186,-187,-206,-207,-208,-209,-210,-226,200,200,200,200,200,200,-168,-160,-164,-165,-166,-161,200,200,200,-175,-167,200,200,200,200,200,200,200,200,200,200,-155,-156,-157,-158,-159,-172,-188,-194,200,200,200,200,200,200,200,200,200,200,200,200,200,-182,200,-191,200,200,]),'S_UNTIL':([148,168,224,],[-101,244,-102,]),'RANGE':([176,347,],[261,261,]),'UPD':([219,],[293,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'translation-unit':([0,32,385,],[1,77,392,]),'statement-star':([0,3,32,385,],[2,63,2,2,]),'statement':([0,3,32,92,385,],[3,3,3,178,3,]),'empty':([0,3,21,32,36,66,67,76,80,86,89,92,104,110,144,155,168,173,174,183,184,186,187,188,223,232,243,245,255,258,271,294,295,296,300,307,314,320,324,325,326,330,331,347,353,370,382,385,394,],[4,4,68,4,85,68,68,158,68,166,175,179,189,195,224,233,242,247,251,256,264,175,269,272,290,158,175,305,312,264,321,233,179,332,242,175,264,354,359,362,290,366,332,376,321,389,362,4,389,]),'global-const-defn':([0,3,32,92,385,],[6,6,6,6,6,]),'import-stmt':([0,3,32,92,385,],[7,7,7,7,7,]),'pragma-stmt':([0,3,32,92,385,],[8,8,8,8,8,]),'func-defn':([0,3,32,92,385,],[9,9,9,9,9,]),'block':([0,3,32,43,91,92,99,234,252,297,298,385,386,],[10,10,10,95,177,10,182,295,308,334,335,10,393,]),'if-stmt':([0,3,32,92,385,],[11,11,11,11,11,]),'switch-stmt':([0,3,32,92,385,],[12,12,12,12,12,]),'wait-stmt':([0,3,32,92,385,],[13,13,13,13,13,]),'foreach-loop':([0,3,32,92,385,],[14,14,14,14,14,]),'for-loop':([0,3,32,92,385,],[15,15,15,15,15,]),'var-decl':([0,3,32,71,92,385,],[16,16,16,146,16,16,]),'while-loop':([0,3,32,92,385,],[17,17,17,17,17,]),'iterate-loop':([0,3,32,92,385,],[18,18,18,18,18,]),'stmt-chain':([0,3,32,92,385,],[19,19,19,19,19,]),'opt-else-block':([0,3,32,92,295,385,],[20,20,20,20,329,20,]),'var-name':([0,3,32,34,37,39,41,69,75,76,78,82,87,90,92,96,106,110,120,127,144,163,165,170,197,198,199,202,208,211,229,232,237,239,241,244,248,259,262,273,276,278,286,289,291,304,309,336,338,357,360,377,385,388,],[21,21,21,80,86,89,91,126,126,126,126,126,171,126,21,126,80,126,126,126,126,126,238,243,126,126,126,126,126,126,126,126,126,126,171,126,126,316,126,322,126,126,126,126,126,126,126,171,126,126,126,126,21,171,]),'assignment':([0,3,32,92,385,],[22,22,22,22,22,]),'func-call':([0,3,32,69,75,76,78,82,90,92,96,110,120,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,385,],[23,23,23,125,125,125,125,125,125,23,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,23,]),'update-stmt':([0,3,32,92,385,],[24,24,24,24,24,]),'swift-func-defn':([0,3,32,92,385,],[29,29,29,29,29,]),'app-func-defn':([0,3,32,92,385,],[30,30,30,30,30,]),'foreign-func-defn':([0,3,32,92,385,],[31,31,31,31,31,]),'type-prefix':([0,3,32,71,87,92,103,174,241,355,385,],[39,39,39,39,170,39,186,186,170,379,39,]),'chainable-stmt':([0,3,32,92,385,],[42,42,42,42,42,]),'lval-or-paren-lval':([0,3,32,92,385,],[44,44,44,44,44,]),'func-hdr':([0,3,32,46,92,385,],[45,45,45,102,45,45,]),'type-name':([0,3,32,71,87,92,103,174,241,355,385,],[47,47,47,47,47,47,47,47,47,47,47,]),'param-type':([0,3,32,71,87,92,103,174,241,355,385,],[48,48,48,48,48,48,48,48,48,48,48,]),'lval-list':([0,3,32,34,92,385,],[49,49,49,79,49,49,]),'lval-expr':([0,3,32,34,92,106,385,],[62,62,62,62,62,190,62,]),'subscript-star':([21,66,67,80,],[65,108,109,65,]),'array-subscript':([21,66,67,80,119,220,],[66,66,66,66,218,218,]),'struct-subscript':([21,66,67,80,119,220,],[67,67,67,67,219,219,]),'module-path':([26,],[72,]),'opt-deep':([36,],[83,]),'var-decl-rest':([39,],[88,]),'semicolon-or-arrow':([42,],[92,]),'assign-or-plusas':([44,],[96,]),'foreign-func-body':([45,],[100,]),'lval-expr-star':([62,190,],[105,275,]),'expr':([69,75,76,78,82,90,96,110,127,144,163,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[111,152,156,160,162,176,181,193,221,225,181,293,156,298,299,302,306,317,323,324,325,225,327,339,342,371,380,382,390,]),'or-expr':([69,75,76,78,82,90,96,110,127,144,163,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'and-expr':([69,75,76,78,82,90,96,110,127,144,163,197,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[113,113,113,113,113,113,113,113,113,113,113,279,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'eq-expr':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[114,114,114,114,114,114,114,114,114,114,114,114,280,281,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'cmp-expr':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'add-expr':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,202,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,282,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'mult-expr':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,202,208,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,283,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'unary-expr':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,284,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'postfix-expr':([69,75,76,78,82,90,96,110,120,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[119,119,119,119,119,119,119,119,220,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'minus-or-excl':([69,75,76,78,82,90,96,110,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'base-expr':([69,75,76,78,82,90,96,110,120,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'literal':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[124,124,124,124,124,124,124,124,124,124,124,124,260,124,124,124,124,124,124,124,124,124,124,124,124,260,124,124,124,124,124,124,124,124,260,124,124,124,124,]),'-constructor':([69,75,76,78,82,90,96,110,120,127,144,163,197,198,199,202,208,211,229,232,237,239,244,248,262,276,278,286,289,291,304,309,338,357,360,377,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'array-constructor':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[129,129,129,129,129,129,129,129,129,129,129,129,261,129,129,129,129,129,129,129,129,129,129,129,129,261,129,129,129,129,129,129,129,129,261,129,129,129,129,]),'float-literal':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,]),'bool-literal':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,]),'array-list-constructor':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,]),'array-range-constructor':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,]),'array-kv-constructor':([69,75,76,78,82,90,96,110,120,127,144,163,184,197,198,199,202,208,211,229,232,237,239,244,248,258,262,276,278,286,289,291,304,309,314,338,357,360,377,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'path-star':([74,227,],[150,292,]),'func-call-arg-list':([76,],[154,]),'expr-or-kw':([76,232,],[155,294,]),'kw-expr':([76,232,],[157,157,]),'opt-comma-var-name':([86,],[164,]),'for-init-list':([87,],[167,]),'for-init':([87,241,],[168,300,]),'for-assignment':([87,241,336,388,],[169,169,370,394,]),'type-suffix':([89,186,243,307,],[173,266,301,341,]),'expr-list':([96,110,163,],[180,194,236,]),'standalone-type':([103,174,],[185,250,]),'formal-arg-list':([104,187,],[187,267,]),'opt-expr-list':([110,],[192,]),'eq-or-not-eq':([114,280,281,],[199,199,199,]),'cmp-sign':([115,],[202,]),'add-sign':([116,282,],[208,208,]),'mult-sign':([117,283,],[211,211,]),'array-or-struct':([119,220,],[217,217,]),'opt-array-constructor':([144,],[222,]),'array-kv-elem':([144,289,],[223,326,]),'func-call-arg-star':([155,294,],[231,328,]),'for-init-star':([168,300,],[240,337,]),'empty-or-var-mapping':([173,],[245,]),'var-mapping':([173,],[246,]),'empty-or-standalone-type':([174,],[249,]),'empty-or-literal':([183,],[255,]),'app-body':([184,],[257,]),'app-arg-expr':([184,258,314,],[258,314,314,]),'opt-at':([184,258,314,],[259,259,259,]),'empty-or-arg-list':([187,],[268,]),'opt-formal-args':([188,],[270,]),'formal-arg':([188,320,],[271,353,]),'empty-or-range':([188,320,],[273,273,]),'comma-array-kv-elem-star':([223,326,],[288,363,]),'empty-or-assign-expr':([245,],[303,]),'empty-or-more-literals':([255,],[310,]),'app-arg-expr-star':([258,314,],[315,346,]),'comma-args-star':([271,353,],[319,378,]),'case-star':([296,331,],[330,367,]),'case':([296,331,],[331,331,]),'single-or-multiple-literal':([311,],[343,]),'app-out-star':([315,390,],[347,395,]),'std-in-out-err':([315,390,],[348,348,]),'opt-coloned-expr':([324,],[358,]),'comma-expr-star':([325,382,],[361,391,]),'opt-default':([330,],[364,]),'for-update-list':([336,],[369,]),'empty-or-semicolon':([347,],[374,]),'for-assignment-star':([370,394,],[387,396,]),}
+_lr_goto_items = {'translation-unit':([0,],[1,]),'statement-star':([0,33,387,],[2,75,392,]),'empty':([0,22,33,37,73,78,84,87,136,137,140,146,147,158,163,166,173,174,176,178,212,233,235,239,246,258,292,295,314,322,323,330,345,347,362,387,],[3,67,3,83,143,67,156,165,210,213,218,165,165,232,237,242,247,255,259,165,289,165,304,242,312,319,143,331,255,350,353,359,369,374,384,3,]),'statement':([2,75,90,392,],[5,5,169,5,]),'global-const-defn':([2,75,90,392,],[7,7,7,7,]),'import-stmt':([2,75,90,392,],[8,8,8,8,]),'pragma-stmt':([2,75,90,392,],[9,9,9,9,]),'func-defn':([2,75,90,392,],[10,10,10,10,]),'block':([2,44,75,89,90,95,225,243,296,297,382,392,],[11,91,11,168,11,172,294,308,332,333,388,11,]),'if-stmt':([2,75,90,392,],[12,12,12,12,]),'switch-stmt':([2,75,90,392,],[13,13,13,13,]),'wait-stmt':([2,75,90,392,],[14,14,14,14,]),'foreach-loop':([2,75,90,392,],[15,15,15,15,]),'for-loop':([2,75,90,392,],[16,16,16,16,]),'var-decl':([2,68,75,90,392,],[17,106,17,17,17,]),'while-loop':([2,75,90,392,],[18,18,18,18,]),'iterate-loop':([2,75,90,392,],[19,19,19,19,]),'stmt-chain':([2,75,90,392,],[20,20,20,20,]),'else-block':([2,75,90,294,392,],[21,21,21,329,21,]),'var-name':([2,35,38,40,42,72,73,75,76,80,85,88,90,92,104,113,115,120,136,137,153,155,160,179,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,250,253,260,284,286,290,292,293,299,303,309,324,334,336,338,351,376,385,389,392,],[22,78,84,87,89,119,119,22,119,119,161,119,22,119,119,119,119,119,119,119,119,229,233,78,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,315,119,320,119,119,119,119,119,161,119,119,119,161,119,119,119,119,119,161,22,]),'assignment':([2,75,90,392,],[23,23,23,23,]),'func-call':([2,72,73,75,76,80,88,90,92,104,113,115,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,392,],[24,118,118,24,118,118,118,24,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,24,]),'update-stmt':([2,75,90,392,],[25,25,25,25,]),'swift-func-defn':([2,75,90,392,],[30,30,30,30,]),'app-func-defn':([2,75,90,392,],[31,31,31,31,]),'foreign-func-defn':([2,75,90,392,],[32,32,32,32,]),'type-prefix':([2,68,75,85,90,100,166,239,299,348,392,],[40,40,40,160,40,178,178,178,160,375,40,]),'chainable-stmt':([2,75,90,392,],[43,43,43,43,]),'lval-or-paren-lval':([2,75,90,392,],[45,45,45,45,]),'func-hdr':([2,47,75,90,392,],[46,98,46,46,46,]),'type-name':([2,68,75,85,90,100,166,239,299,348,392,],[48,48,48,48,48,48,48,48,48,48,48,]),'param-type':([2,68,74,75,85,90,100,166,183,239,299,348,392,],[49,49,147,49,49,49,49,49,147,49,49,49,49,]),'lval-list':([2,35,75,90,392,],[50,77,50,50,50,]),'builtin-type-name':([2,68,74,75,85,90,100,166,183,239,299,348,392,],[52,52,146,52,52,52,52,52,146,52,52,52,52,]),'lval-expr':([2,35,75,90,179,392,],[53,53,53,53,264,53,]),'subscript-star':([22,78,],[66,66,]),'module-path':([27,],[69,]),'opt-deep':([37,],[81,]),'var-decl-rest':([40,],[86,]),'assign-or-plusas':([45,],[92,]),'foreign-func-body':([46,],[96,]),'lval-expr-star':([53,],[101,]),'array-subscript':([66,114,201,205,],[102,203,203,203,]),'struct-subscript':([66,114,201,205,],[103,204,204,204,]),'path-star':([71,],[110,]),'expr':([72,73,76,80,88,92,104,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,],[112,141,150,152,167,171,180,206,208,214,171,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,291,297,298,301,305,316,322,323,325,141,327,337,340,214,363,274,378,386,390,]),'postfix-expr':([72,73,76,80,88,92,104,113,115,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,],[114,114,114,114,114,114,114,201,205,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'base-expr':([72,73,76,80,88,92,104,113,115,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'literal':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[117,117,117,117,117,117,117,117,117,117,117,117,117,251,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,251,117,117,117,117,117,117,]),'-constructor':([72,73,76,80,88,92,104,113,115,120,136,137,153,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,324,336,338,351,376,385,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'array-constructor':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[122,122,122,122,122,122,122,122,122,122,122,122,122,252,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,252,122,122,122,122,122,122,]),'float-literal':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'bool-literal':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'array-list-constructor':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'array-range-constructor':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'array-kv-constructor':([72,73,76,80,88,92,104,113,115,120,136,137,153,174,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,228,230,234,238,253,284,286,290,292,293,303,309,314,324,336,338,351,376,385,],[130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'func-call-arg-list':([73,],[139,]),'expr-or-kw':([73,292,],[140,326,]),'kw-expr':([73,292,],[142,142,]),'compound-type':([74,183,],[145,145,]),'opt-comma-var-name':([84,],[154,]),'for-init-list':([85,],[157,]),'for-init':([85,299,],[158,335,]),'for-assignment':([85,299,334,389,],[159,159,362,393,]),'type-suffix':([87,146,147,178,233,],[163,222,223,263,300,]),'type-suffix-plus':([87,144,146,147,178,233,266,],[164,220,164,164,164,164,220,]),'expr-list':([92,136,153,],[170,209,227,]),'formal-args':([99,175,],[175,256,]),'standalone-type':([100,166,239,],[177,241,241,]),'array-or-struct':([114,201,205,],[202,202,202,]),'opt-expr-list':([136,],[207,]),'opt-array-constructor':([137,],[211,]),'array-kv-elem':([137,324,],[212,354,]),'func-call-arg-star':([140,],[217,]),'for-init-star':([158,],[231,]),'empty-or-var-mapping':([163,],[235,]),'var-mapping':([163,],[236,]),'empty-or-standalone-type':([166,239,],[240,306,]),'empty-or-literal':([173,],[246,]),'app-body':([174,],[248,]),'app-arg-expr':([174,314,],[249,344,]),'opt-at':([174,314,],[250,250,]),'opt-formal-args':([176,],[257,]),'formal-arg':([176,347,],[258,373,]),'empty-or-range':([176,347,],[260,260,]),'comma-array-kv-elem-star':([212,],[288,]),'empty-or-assign-expr':([235,],[302,]),'empty-or-more-literals':([246,],[310,]),'app-arg-expr-star':([249,],[314,]),'comma-args-star':([258,],[318,]),'opt-else-block':([294,],[328,]),'case-star':([295,],[330,]),'single-or-multiple-literal':([311,],[341,]),'app-out-star':([314,],[345,]),'comma-expr-star':([322,],[349,]),'opt-coloned-expr':([323,],[352,]),'opt-default':([330,],[356,]),'case':([330,],[357,]),'for-update-list':([334,],[361,]),'empty-or-semicolon':([345,],[366,]),'std-in-out-err':([345,],[367,]),'for-assignment-star':([362,],[383,]),'case-body':([387,],[391,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,244 +27,243 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> translation-unit","S'",1,None,None,None),
-  ('translation-unit -> statement-star','translation-unit',1,'p_translation_unit','yacc.py',11),
-  ('statement-star -> statement statement-star','statement-star',2,'p_statement_star','yacc.py',17),
-  ('statement-star -> empty','statement-star',1,'p_statement_star','yacc.py',18),
-  ('statement -> SEMICOLON','statement',1,'p_statement','yacc.py',27),
-  ('statement -> global-const-defn','statement',1,'p_statement','yacc.py',28),
-  ('statement -> import-stmt','statement',1,'p_statement','yacc.py',29),
-  ('statement -> pragma-stmt','statement',1,'p_statement','yacc.py',30),
-  ('statement -> func-defn','statement',1,'p_statement','yacc.py',31),
-  ('statement -> block','statement',1,'p_statement','yacc.py',32),
-  ('statement -> if-stmt','statement',1,'p_statement','yacc.py',33),
-  ('statement -> switch-stmt','statement',1,'p_statement','yacc.py',34),
-  ('statement -> wait-stmt','statement',1,'p_statement','yacc.py',35),
-  ('statement -> foreach-loop','statement',1,'p_statement','yacc.py',36),
-  ('statement -> for-loop','statement',1,'p_statement','yacc.py',37),
-  ('statement -> var-decl','statement',1,'p_statement','yacc.py',38),
-  ('statement -> while-loop','statement',1,'p_statement','yacc.py',39),
-  ('statement -> iterate-loop','statement',1,'p_statement','yacc.py',40),
-  ('statement -> stmt-chain','statement',1,'p_statement','yacc.py',41),
-  ('statement -> opt-else-block','statement',1,'p_statement','yacc.py',42),
-  ('statement -> var-name','statement',1,'p_statement','yacc.py',43),
-  ('statement -> assignment','statement',1,'p_statement','yacc.py',44),
-  ('statement -> func-call','statement',1,'p_statement','yacc.py',45),
-  ('statement -> update-stmt','statement',1,'p_statement','yacc.py',46),
-  ('global-const-defn -> C_GLOBAL C_CONST var-decl SEMICOLON','global-const-defn',4,'p_global_const_defn','yacc.py',52),
-  ('import-stmt -> D_IMPORT module-path SEMICOLON','import-stmt',3,'p_import_stmt','yacc.py',58),
-  ('import-stmt -> D_IMPORT STR_LITERAL SEMICOLON','import-stmt',3,'p_import_stmt','yacc.py',59),
-  ('module-path -> ID path-star','module-path',2,'p_module_path','yacc.py',65),
-  ('path-star -> DOT ID path-star','path-star',3,'p_path_star','yacc.py',71),
-  ('path-star -> <empty>','path-star',0,'p_path_star','yacc.py',72),
-  ('pragma-stmt -> C_PRAGMA ID expr SEMICOLON','pragma-stmt',4,'p_pragma_stms','yacc.py',81),
-  ('func-defn -> swift-func-defn','func-defn',1,'p_func_defn','yacc.py',87),
-  ('func-defn -> app-func-defn','func-defn',1,'p_func_defn','yacc.py',88),
-  ('func-defn -> foreign-func-defn','func-defn',1,'p_func_defn','yacc.py',89),
-  ('func-hdr -> D_FUNCTION ID formal-arg-list empty-or-arg-list','func-hdr',4,'p_func_hdr','yacc.py',95),
-  ('empty-or-arg-list -> formal-arg-list','empty-or-arg-list',1,'p_empty_or_arg_list','yacc.py',101),
-  ('empty-or-arg-list -> empty','empty-or-arg-list',1,'p_empty_or_arg_list','yacc.py',102),
-  ('type-params -> LESS var-name comma-name-star GREATER','type-params',4,'p_type_params','yacc.py',109),
-  ('type-params -> empty','type-params',1,'p_type_params','yacc.py',110),
-  ('comma-name-star -> COMMA var-name comma-name-star','comma-name-star',3,'p_comma_name_star','yacc.py',119),
-  ('comma-name-star -> empty','comma-name-star',1,'p_comma_name_star','yacc.py',120),
-  ('formal-arg-list -> LPAREN opt-formal-args RPAREN','formal-arg-list',3,'p_formal_arg_list','yacc.py',129),
-  ('formal-arg-list -> empty','formal-arg-list',1,'p_formal_arg_list','yacc.py',130),
-  ('opt-formal-args -> formal-arg comma-args-star','opt-formal-args',2,'p_opt_formal_args','yacc.py',139),
-  ('opt-formal-args -> empty','opt-formal-args',1,'p_opt_formal_args','yacc.py',140),
-  ('comma-args-star -> COMMA formal-arg comma-args-star','comma-args-star',3,'p_comma_args_star','yacc.py',148),
-  ('comma-args-star -> empty','comma-args-star',1,'p_comma_args_star','yacc.py',149),
-  ('formal-arg -> empty-or-range var-name COLON type-prefix','formal-arg',4,'p_formal_arg','yacc.py',158),
-  ('empty-or-range -> RANGE','empty-or-range',1,'p_empty_or_range','yacc.py',165),
-  ('empty-or-range -> empty','empty-or-range',1,'p_empty_or_range','yacc.py',166),
-  ('empty-or-ass-expr -> formal-arg-list ASSIGN expr','empty-or-ass-expr',3,'p_empty_or_ass_expr','yacc.py',172),
-  ('empty-or-ass-expr -> empty','empty-or-ass-expr',1,'p_empty_or_ass_expr','yacc.py',173),
-  ('swift-func-defn -> func-hdr ARROW block','swift-func-defn',3,'p_swift_func_defn','yacc.py',179),
-  ('app-func-defn -> C_APP func-hdr LBRACE app-body RBRACE','app-func-defn',5,'p_app_func_defn','yacc.py',186),
-  ('app-body -> app-arg-expr app-arg-expr-star app-out-star empty-or-semicolon','app-body',4,'p_app_body','yacc.py',193),
-  ('empty-or-semicolon -> SEMICOLON','empty-or-semicolon',1,'p_empty_or_semicolon','yacc.py',199),
-  ('empty-or-semicolon -> empty','empty-or-semicolon',1,'p_empty_or_semicolon','yacc.py',200),
-  ('app-out-star -> std-in-out-err ASSIGN expr app-out-star','app-out-star',4,'p_app_out_star','yacc.py',207),
-  ('app-out-star -> <empty>','app-out-star',0,'p_app_out_star','yacc.py',208),
-  ('std-in-out-err -> E_STDIN','std-in-out-err',1,'p_std_in_out_err','yacc.py',218),
-  ('std-in-out-err -> E_STDOUT','std-in-out-err',1,'p_std_in_out_err','yacc.py',219),
-  ('std-in-out-err -> E_STDERR','std-in-out-err',1,'p_std_in_out_err','yacc.py',220),
-  ('app-arg-expr-star -> app-arg-expr app-arg-expr-star','app-arg-expr-star',2,'p_app_arg_expr_star','yacc.py',227),
-  ('app-arg-expr-star -> <empty>','app-arg-expr-star',0,'p_app_arg_expr_star','yacc.py',228),
-  ('foreign-func-defn -> func-hdr foreign-func-body','foreign-func-defn',2,'p_foreign_func_defn','yacc.py',237),
-  ('foreign-func-body -> STR_LITERAL STR_LITERAL empty-or-literal empty-or-more-literals','foreign-func-body',4,'p_foreign_func_body','yacc.py',243),
-  ('empty-or-literal -> STR_LITERAL','empty-or-literal',1,'p_empty_or_literal','yacc.py',249),
-  ('empty-or-literal -> empty','empty-or-literal',1,'p_empty_or_literal','yacc.py',250),
-  ('empty-or-more-literals -> LBRACKET single-or-multiple-literal RBRACKET','empty-or-more-literals',3,'p_empty_or_more_literals','yacc.py',256),
-  ('empty-or-more-literals -> empty','empty-or-more-literals',1,'p_empty_or_more_literals','yacc.py',257),
-  ('single-or-multiple-literal -> STR_LITERAL','single-or-multiple-literal',1,'p_single_or_multistring_literal','yacc.py',266),
-  ('single-or-multiple-literal -> MUL_STR_LITERAL','single-or-multiple-literal',1,'p_single_or_multistring_literal','yacc.py',267),
-  ('var-decl -> type-prefix var-decl-rest','var-decl',2,'p_var_decl','yacc.py',273),
-  ('var-decl-rest-star -> COMMA var-decl-rest var-decl-rest-star','var-decl-rest-star',3,'p_var_decl_rest_star','yacc.py',279),
-  ('var-decl-rest-star -> <empty>','var-decl-rest-star',0,'p_var_decl_rest_star','yacc.py',280),
-  ('var-decl-rest -> var-name type-suffix empty-or-var-mapping empty-or-assign-expr','var-decl-rest',4,'p_var_decl_rest','yacc.py',289),
-  ('empty -> <empty>','empty',0,'p_empty','yacc.py',296),
-  ('empty-or-var-mapping -> var-mapping','empty-or-var-mapping',1,'p_empty_or_var_mapping','yacc.py',302),
-  ('empty-or-var-mapping -> empty','empty-or-var-mapping',1,'p_empty_or_var_mapping','yacc.py',303),
-  ('empty-or-assign-expr -> ASSIGN expr','empty-or-assign-expr',2,'p_empty_or_assign_expr','yacc.py',313),
-  ('empty-or-assign-expr -> empty','empty-or-assign-expr',1,'p_empty_or_assign_expr','yacc.py',314),
-  ('type-prefix -> type-name','type-prefix',1,'p_type_prefix','yacc.py',322),
-  ('type-prefix -> param-type','type-prefix',1,'p_type_prefix','yacc.py',323),
-  ('param-type -> type-name LESS standalone-type GREATER','param-type',4,'p_param_type','yacc.py',329),
-  ('type-suffix -> LBRACKET empty-or-standalone-type RBRACKET type-suffix','type-suffix',4,'p_type_suffix','yacc.py',335),
-  ('type-suffix -> empty','type-suffix',1,'p_type_suffix','yacc.py',336),
-  ('empty-or-standalone-type -> standalone-type','empty-or-standalone-type',1,'p_empty_or_standalone_type','yacc.py',345),
-  ('empty-or-standalone-type -> empty','empty-or-standalone-type',1,'p_empty_or_standalone_type','yacc.py',346),
-  ('standalone-type -> type-prefix type-suffix','standalone-type',2,'p_standalone_type','yacc.py',352),
-  ('var-mapping -> LESS expr GREATER','var-mapping',3,'p_var_mapping','yacc.py',358),
-  ('block -> LBRACE translation-unit RBRACE','block',3,'p_block','yacc.py',364),
-  ('stmt-chain -> chainable-stmt semicolon-or-arrow statement','stmt-chain',3,'p_stmt_chain','yacc.py',370),
-  ('semicolon-or-arrow -> SEMICOLON','semicolon-or-arrow',1,'p_semicolon_or_arrow','yacc.py',377),
-  ('semicolon-or-arrow -> ARROW','semicolon-or-arrow',1,'p_semicolon_or_arrow','yacc.py',378),
-  ('chainable-stmt -> var-name','chainable-stmt',1,'p_chainable_stmt','yacc.py',385),
-  ('chainable-stmt -> func-call','chainable-stmt',1,'p_chainable_stmt','yacc.py',386),
-  ('chainable-stmt -> var-decl','chainable-stmt',1,'p_chainable_stmt','yacc.py',387),
-  ('chainable-stmt -> assignment','chainable-stmt',1,'p_chainable_stmt','yacc.py',388),
-  ('assignment -> lval-or-paren-lval assign-or-plusas expr-list','assignment',3,'p_assignment','yacc.py',394),
-  ('lval-or-lval-list -> lval-list','lval-or-lval-list',1,'p_lval_or_lval_list','yacc.py',401),
-  ('lval-or-lval-list -> LPAREN lval-list RPAREN','lval-or-lval-list',3,'p_lval_or_lval_list','yacc.py',402),
-  ('assign-or-plusas -> ASSIGN','assign-or-plusas',1,'p_assign_or_plusas','yacc.py',412),
-  ('assign-or-plusas -> PLUS_AS','assign-or-plusas',1,'p_assign_or_plusas','yacc.py',413),
-  ('lval-or-paren-lval -> lval-list','lval-or-paren-lval',1,'p_lval_or_paren_lval','yacc.py',420),
-  ('lval-or-paren-lval -> LPAREN lval-list RPAREN','lval-or-paren-lval',3,'p_lval_or_paren_lval','yacc.py',421),
-  ('update-stmt -> var-name LESS ID GREATER UPD expr SEMICOLON','update-stmt',7,'p_update_stmt','yacc.py',431),
-  ('if-stmt -> S_IF LPAREN expr RPAREN block opt-else-block','if-stmt',6,'p_if_stmt','yacc.py',437),
-  ('opt-else-block -> S_ELSE block','opt-else-block',2,'p_opt_else_block','yacc.py',443),
-  ('opt-else-block -> empty','opt-else-block',1,'p_opt_else_block','yacc.py',444),
-  ('switch-stmt -> S_SWITCH LPAREN expr RPAREN LBRACE case-star opt-default RBRACE','switch-stmt',8,'p_switch_stmt','yacc.py',453),
-  ('opt-default -> S_DEFAULT','opt-default',1,'p_opt_default','yacc.py',459),
-  ('opt-default -> empty','opt-default',1,'p_opt_default','yacc.py',460),
-  ('case-star -> case case-star','case-star',2,'p_case_star','yacc.py',466),
-  ('case-star -> empty','case-star',1,'p_case_star','yacc.py',467),
-  ('case -> S_CASE INT COLON translation-unit','case',4,'p_case','yacc.py',476),
-  ('default -> S_DEFAULT COLON translation-unit','default',3,'p_default','yacc.py',482),
-  ('wait-stmt -> E_WAIT opt-deep LPAREN expr-list RPAREN block','wait-stmt',6,'p_wait_stmt','yacc.py',488),
-  ('opt-deep -> E_DEEP','opt-deep',1,'p_opt_deep','yacc.py',494),
-  ('opt-deep -> empty','opt-deep',1,'p_opt_deep','yacc.py',495),
-  ('foreach-loop -> S_FOREACH var-name opt-comma-var-name S_IN expr block','foreach-loop',6,'p_foreach_loop','yacc.py',501),
-  ('opt-comma-var-name -> COMMA var-name','opt-comma-var-name',2,'p_opt_comma_var_name','yacc.py',510),
-  ('opt-comma-var-name -> empty','opt-comma-var-name',1,'p_opt_comma_var_name','yacc.py',511),
-  ('for-loop -> S_FOR LPAREN for-init-list SEMICOLON expr SEMICOLON for-update-list RPAREN block','for-loop',9,'p_for_loop','yacc.py',519),
-  ('while-loop -> S_WHILE LPAREN expr RPAREN block','while-loop',5,'p_while_loop','yacc.py',525),
-  ('for-init-list -> for-init for-init-star','for-init-list',2,'p_for_init_list','yacc.py',531),
-  ('for-init-star -> COMMA for-init for-init-star','for-init-star',3,'p_for_init_star','yacc.py',537),
-  ('for-init-star -> empty','for-init-star',1,'p_for_init_star','yacc.py',538),
-  ('for-init -> for-assignment','for-init',1,'p_for_init','yacc.py',547),
-  ('for-init -> type-prefix var-name type-suffix ASSIGN expr','for-init',5,'p_for_init','yacc.py',548),
-  ('for-update-list -> for-assignment for-assignment-star','for-update-list',2,'p_for_update_list','yacc.py',558),
-  ('for-assignment-star -> COMMA for-assignment for-assignment-star','for-assignment-star',3,'p_for_assignment_star','yacc.py',564),
-  ('for-assignment-star -> empty','for-assignment-star',1,'p_for_assignment_star','yacc.py',565),
-  ('for-assignment -> var-name ASSIGN expr','for-assignment',3,'p_for_assignment','yacc.py',574),
-  ('iterate-loop -> S_ITERATE var-name block S_UNTIL LPAREN expr RPAREN','iterate-loop',7,'p_iterate_loop','yacc.py',580),
-  ('expr -> or-expr','expr',1,'p_expr','yacc.py',586),
-  ('or-expr -> and-expr','or-expr',1,'p_or_expr','yacc.py',592),
-  ('or-expr -> or-expr LOG_OR and-expr','or-expr',3,'p_or_expr','yacc.py',593),
-  ('and-expr -> eq-expr','and-expr',1,'p_and_expr','yacc.py',602),
-  ('and-expr -> and-expr LOG_AND eq-expr','and-expr',3,'p_and_expr','yacc.py',603),
-  ('eq-expr -> cmp-expr','eq-expr',1,'p_eq_expr','yacc.py',612),
-  ('eq-expr -> eq-expr eq-or-not-eq eq-expr','eq-expr',3,'p_eq_expr','yacc.py',613),
-  ('eq-or-not-eq -> EQUAL','eq-or-not-eq',1,'p_eq_or_not_eq','yacc.py',623),
-  ('eq-or-not-eq -> NOT_EQUAL','eq-or-not-eq',1,'p_eq_or_not_eq','yacc.py',624),
-  ('cmp-expr -> add-expr','cmp-expr',1,'p_cmp_expr','yacc.py',631),
-  ('cmp-expr -> cmp-expr cmp-sign add-expr','cmp-expr',3,'p_cmp_expr','yacc.py',632),
-  ('cmp-sign -> LESS','cmp-sign',1,'p_cmp_sign','yacc.py',642),
-  ('cmp-sign -> LESS_EQ','cmp-sign',1,'p_cmp_sign','yacc.py',643),
-  ('cmp-sign -> EQUAL','cmp-sign',1,'p_cmp_sign','yacc.py',644),
-  ('cmp-sign -> GREATER','cmp-sign',1,'p_cmp_sign','yacc.py',645),
-  ('cmp-sign -> GREATER_EQ','cmp-sign',1,'p_cmp_sign','yacc.py',646),
-  ('add-expr -> mult-expr','add-expr',1,'p_add_expr','yacc.py',653),
-  ('add-expr -> add-expr add-sign mult-expr','add-expr',3,'p_add_expr','yacc.py',654),
-  ('add-sign -> PLUS','add-sign',1,'p_add_sign','yacc.py',664),
-  ('add-sign -> MINUS','add-sign',1,'p_add_sign','yacc.py',665),
-  ('mult-expr -> unary-expr','mult-expr',1,'p_mult_expr','yacc.py',672),
-  ('mult-expr -> mult-expr mult-sign unary-expr','mult-expr',3,'p_mult_expr','yacc.py',673),
-  ('mult-sign -> MULT','mult-sign',1,'p_mult_sign','yacc.py',683),
-  ('mult-sign -> DIV','mult-sign',1,'p_mult_sign','yacc.py',684),
-  ('mult-sign -> MULTPER','mult-sign',1,'p_mult_sign','yacc.py',685),
-  ('mult-sign -> DOUBLEPER','mult-sign',1,'p_mult_sign','yacc.py',686),
-  ('mult-sign -> MOD','mult-sign',1,'p_mult_sign','yacc.py',687),
-  ('unary-expr -> postfix-expr','unary-expr',1,'p_unary_expr','yacc.py',694),
-  ('unary-expr -> minus-or-excl postfix-expr','unary-expr',2,'p_unary_expr','yacc.py',695),
-  ('minus-or-excl -> MINUS','minus-or-excl',1,'p_minus_or_excl','yacc.py',705),
-  ('minus-or-excl -> EXCLAMATION','minus-or-excl',1,'p_minus_or_excl','yacc.py',706),
-  ('postfix-expr -> base-expr','postfix-expr',1,'p_postfix_expr','yacc.py',713),
-  ('postfix-expr -> postfix-expr array-or-struct','postfix-expr',2,'p_postfix_expr','yacc.py',714),
-  ('array-or-struct -> array-subscript','array-or-struct',1,'p_array_or_struct','yacc.py',723),
-  ('array-or-struct -> struct-subscript','array-or-struct',1,'p_array_or_struct','yacc.py',724),
-  ('array-subscript -> LBRACKET expr RBRACKET','array-subscript',3,'p_array_subscript','yacc.py',730),
-  ('struct-subscript -> DOT ID','struct-subscript',2,'p_struct_subscript','yacc.py',736),
-  ('base-expr -> literal','base-expr',1,'p_base_expr','yacc.py',742),
-  ('base-expr -> func-call','base-expr',1,'p_base_expr','yacc.py',743),
-  ('base-expr -> var-name','base-expr',1,'p_base_expr','yacc.py',744),
-  ('base-expr -> LPAREN expr RPAREN','base-expr',3,'p_base_expr','yacc.py',745),
-  ('base-expr -> -constructor','base-expr',1,'p_base_expr','yacc.py',746),
-  ('base-expr -> array-constructor','base-expr',1,'p_base_expr','yacc.py',747),
-  ('func-call -> ID LPAREN func-call-arg-list RPAREN','func-call',4,'p_func_call','yacc.py',756),
-  ('func-call-arg-list -> expr-or-kw func-call-arg-star','func-call-arg-list',2,'p_func_call_arg_list','yacc.py',763),
-  ('func-call-arg-star -> COMMA expr-or-kw func-call-arg-star','func-call-arg-star',3,'p_def_expr_star','yacc.py',769),
-  ('func-call-arg-star -> empty','func-call-arg-star',1,'p_def_expr_star','yacc.py',770),
-  ('expr-or-kw -> expr','expr-or-kw',1,'p_expr_or_kw','yacc.py',779),
-  ('expr-or-kw -> kw-expr','expr-or-kw',1,'p_expr_or_kw','yacc.py',780),
-  ('expr-or-kw -> empty','expr-or-kw',1,'p_expr_or_kw','yacc.py',781),
-  ('-constructor -> LPAREN expr COMMA expr comma-expr-star RPAREN','-constructor',6,'p__constructor','yacc.py',790),
-  ('comma-expr-star -> COMMA expr comma-expr-star','comma-expr-star',3,'p_comma_expr_star','yacc.py',796),
-  ('comma-expr-star -> empty','comma-expr-star',1,'p_comma_expr_star','yacc.py',797),
-  ('array-constructor -> array-list-constructor','array-constructor',1,'p_array_constructor','yacc.py',806),
-  ('array-constructor -> array-range-constructor','array-constructor',1,'p_array_constructor','yacc.py',807),
-  ('array-constructor -> array-kv-constructor','array-constructor',1,'p_array_constructor','yacc.py',808),
-  ('array-list-constructor -> LBRACKET opt-expr-list RBRACKET','array-list-constructor',3,'p_array_list_constructor','yacc.py',814),
-  ('opt-expr-list -> expr-list','opt-expr-list',1,'p_opt_expr_list','yacc.py',820),
-  ('opt-expr-list -> empty','opt-expr-list',1,'p_opt_expr_list','yacc.py',821),
-  ('array-range-constructor -> LBRACKET expr COLON expr opt-coloned-expr RBRACKET','array-range-constructor',6,'p_array_range_constructor','yacc.py',827),
-  ('opt-coloned-expr -> COLON expr','opt-coloned-expr',2,'p_opt_coloned_expr','yacc.py',833),
-  ('opt-coloned-expr -> empty','opt-coloned-expr',1,'p_opt_coloned_expr','yacc.py',834),
-  ('array-kv-constructor -> LBRACE opt-array-constructor RBRACE','array-kv-constructor',3,'p_array_kv_constructor','yacc.py',842),
-  ('opt-array-constructor -> array-kv-elem comma-array-kv-elem-star','opt-array-constructor',2,'p_opt_array_constructor','yacc.py',848),
-  ('opt-array-constructor -> empty','opt-array-constructor',1,'p_opt_array_constructor','yacc.py',849),
-  ('comma-array-kv-elem-star -> COMMA array-kv-elem comma-array-kv-elem-star','comma-array-kv-elem-star',3,'p_comma_array_kv_elem_star','yacc.py',857),
-  ('comma-array-kv-elem-star -> empty','comma-array-kv-elem-star',1,'p_comma_array_kv_elem_star','yacc.py',858),
-  ('array-kv-elem -> expr COLON expr','array-kv-elem',3,'p_array_kv_elem','yacc.py',867),
-  ('kw-expr -> ID ASSIGN expr','kw-expr',3,'p_kw_expr','yacc.py',874),
-  ('literal -> STR_LITERAL','literal',1,'p_literal','yacc.py',880),
-  ('literal -> MUL_STR_LITERAL','literal',1,'p_literal','yacc.py',881),
-  ('literal -> INT','literal',1,'p_literal','yacc.py',882),
-  ('literal -> float-literal','literal',1,'p_literal','yacc.py',883),
-  ('literal -> bool-literal','literal',1,'p_literal','yacc.py',884),
-  ('float-literal -> DOUBLE','float-literal',1,'p_float_literal','yacc.py',890),
-  ('float-literal -> INF','float-literal',1,'p_float_literal','yacc.py',891),
-  ('float-literal -> NAN','float-literal',1,'p_float_literal','yacc.py',892),
-  ('bool-literal -> E_TRUE','bool-literal',1,'p_bool_literal','yacc.py',899),
-  ('bool-literal -> E_FALSE','bool-literal',1,'p_bool_literal','yacc.py',900),
-  ('expr-list -> expr','expr-list',1,'p_expr_list','yacc.py',906),
-  ('type-name -> class_INT','type-name',1,'p_type_name','yacc.py',913),
-  ('type-name -> class_DOUBLE','type-name',1,'p_type_name','yacc.py',914),
-  ('type-name -> class_FLOAT','type-name',1,'p_type_name','yacc.py',915),
-  ('type-name -> class_VOID','type-name',1,'p_type_name','yacc.py',916),
-  ('type-name -> class_UINT','type-name',1,'p_type_name','yacc.py',917),
-  ('type-name -> class_BOOL','type-name',1,'p_type_name','yacc.py',918),
-  ('type-name -> class_CHARACTER','type-name',1,'p_type_name','yacc.py',919),
-  ('type-name -> class_String','type-name',1,'p_type_name','yacc.py',920),
-  ('type-name -> collection_SET','type-name',1,'p_type_name','yacc.py',921),
-  ('type-name -> collection_ARRAY','type-name',1,'p_type_name','yacc.py',922),
-  ('type-name -> collection_DICT','type-name',1,'p_type_name','yacc.py',923),
-  ('type-name -> ID','type-name',1,'p_type_name','yacc.py',924),
-  ('const-name -> ID','const-name',1,'p_const_name','yacc.py',930),
-  ('var-name -> ID','var-name',1,'p_var_name','yacc.py',936),
-  ('lval-list -> lval-expr lval-expr-star','lval-list',2,'p_lval_list','yacc.py',942),
-  ('lval-expr-star -> COMMA lval-expr lval-expr-star','lval-expr-star',3,'p_lval_expr_star','yacc.py',948),
-  ('lval-expr-star -> <empty>','lval-expr-star',0,'p_lval_expr_star','yacc.py',949),
-  ('lval-expr -> var-name subscript-star','lval-expr',2,'p_lval_expr','yacc.py',958),
-  ('subscript-star -> array-subscript subscript-star','subscript-star',2,'p_subscript_star','yacc.py',964),
-  ('subscript-star -> struct-subscript subscript-star','subscript-star',2,'p_subscript_star','yacc.py',965),
-  ('subscript-star -> empty','subscript-star',1,'p_subscript_star','yacc.py',966),
-  ('app-arg-expr -> opt-at var-name','app-arg-expr',2,'p_app_arg_expr','yacc.py',975),
-  ('app-arg-expr -> literal','app-arg-expr',1,'p_app_arg_expr','yacc.py',976),
-  ('app-arg-expr -> array-constructor','app-arg-expr',1,'p_app_arg_expr','yacc.py',977),
-  ('app-arg-expr -> LPAREN expr RPAREN','app-arg-expr',3,'p_app_arg_expr','yacc.py',978),
-  ('opt-at -> AT','opt-at',1,'p_opt_at','yacc.py',989),
-  ('opt-at -> empty','opt-at',1,'p_opt_at','yacc.py',990),
+  ('translation-unit -> statement-star','translation-unit',1,'p_translation_unit','yacc.py',33),
+  ('translation-unit -> statement-star error','translation-unit',2,'p_translation_unit','yacc.py',34),
+  ('statement-star -> statement-star statement','statement-star',2,'p_statement_star','yacc.py',41),
+  ('statement-star -> statement-star error SEMICOLON','statement-star',3,'p_statement_star','yacc.py',42),
+  ('statement-star -> empty','statement-star',1,'p_statement_star','yacc.py',43),
+  ('case-body -> statement-star','case-body',1,'p_case_body','yacc.py',55),
+  ('statement -> SEMICOLON','statement',1,'p_statement','yacc.py',63),
+  ('statement -> global-const-defn','statement',1,'p_statement','yacc.py',64),
+  ('statement -> import-stmt','statement',1,'p_statement','yacc.py',65),
+  ('statement -> pragma-stmt','statement',1,'p_statement','yacc.py',66),
+  ('statement -> func-defn','statement',1,'p_statement','yacc.py',67),
+  ('statement -> block','statement',1,'p_statement','yacc.py',68),
+  ('statement -> if-stmt','statement',1,'p_statement','yacc.py',69),
+  ('statement -> switch-stmt','statement',1,'p_statement','yacc.py',70),
+  ('statement -> wait-stmt','statement',1,'p_statement','yacc.py',71),
+  ('statement -> foreach-loop','statement',1,'p_statement','yacc.py',72),
+  ('statement -> for-loop','statement',1,'p_statement','yacc.py',73),
+  ('statement -> var-decl','statement',1,'p_statement','yacc.py',74),
+  ('statement -> while-loop','statement',1,'p_statement','yacc.py',75),
+  ('statement -> iterate-loop','statement',1,'p_statement','yacc.py',76),
+  ('statement -> stmt-chain','statement',1,'p_statement','yacc.py',77),
+  ('statement -> else-block','statement',1,'p_statement','yacc.py',78),
+  ('statement -> var-name','statement',1,'p_statement','yacc.py',79),
+  ('statement -> assignment','statement',1,'p_statement','yacc.py',80),
+  ('statement -> func-call','statement',1,'p_statement','yacc.py',81),
+  ('statement -> update-stmt','statement',1,'p_statement','yacc.py',82),
+  ('global-const-defn -> C_GLOBAL C_CONST var-decl SEMICOLON','global-const-defn',4,'p_global_const_defn','yacc.py',88),
+  ('import-stmt -> D_IMPORT module-path SEMICOLON','import-stmt',3,'p_import_stmt','yacc.py',94),
+  ('import-stmt -> D_IMPORT STR_LITERAL SEMICOLON','import-stmt',3,'p_import_stmt','yacc.py',95),
+  ('module-path -> ID path-star','module-path',2,'p_module_path','yacc.py',101),
+  ('path-star -> path-star DOT ID','path-star',3,'p_path_star','yacc.py',107),
+  ('path-star -> <empty>','path-star',0,'p_path_star','yacc.py',108),
+  ('pragma-stmt -> C_PRAGMA ID expr SEMICOLON','pragma-stmt',4,'p_pragma_stms','yacc.py',118),
+  ('func-defn -> swift-func-defn','func-defn',1,'p_func_defn','yacc.py',124),
+  ('func-defn -> app-func-defn','func-defn',1,'p_func_defn','yacc.py',125),
+  ('func-defn -> foreign-func-defn','func-defn',1,'p_func_defn','yacc.py',126),
+  ('func-hdr -> D_FUNCTION ID','func-hdr',2,'p_func_hdr','yacc.py',132),
+  ('func-hdr -> D_FUNCTION ID formal-args','func-hdr',3,'p_func_hdr','yacc.py',133),
+  ('func-hdr -> D_FUNCTION ID formal-args formal-args','func-hdr',4,'p_func_hdr','yacc.py',134),
+  ('type-params -> LESS var-name comma-name-star GREATER','type-params',4,'p_type_params','yacc.py',142),
+  ('type-params -> empty','type-params',1,'p_type_params','yacc.py',143),
+  ('comma-name-star -> comma-name-star COMMA var-name','comma-name-star',3,'p_comma_name_star','yacc.py',152),
+  ('comma-name-star -> empty','comma-name-star',1,'p_comma_name_star','yacc.py',153),
+  ('formal-arg-list -> formal-args','formal-arg-list',1,'p_formal_arg_list','yacc.py',163),
+  ('formal-arg-list -> empty','formal-arg-list',1,'p_formal_arg_list','yacc.py',164),
+  ('formal-args -> LPAREN opt-formal-args RPAREN','formal-args',3,'p_formal_args','yacc.py',170),
+  ('opt-formal-args -> formal-arg comma-args-star','opt-formal-args',2,'p_opt_formal_args','yacc.py',176),
+  ('opt-formal-args -> empty','opt-formal-args',1,'p_opt_formal_args','yacc.py',177),
+  ('comma-args-star -> comma-args-star COMMA formal-arg','comma-args-star',3,'p_comma_args_star','yacc.py',186),
+  ('comma-args-star -> empty','comma-args-star',1,'p_comma_args_star','yacc.py',187),
+  ('formal-arg -> empty-or-range var-name COLON type-prefix','formal-arg',4,'p_formal_arg','yacc.py',197),
+  ('empty-or-range -> RANGE','empty-or-range',1,'p_empty_or_range','yacc.py',204),
+  ('empty-or-range -> empty','empty-or-range',1,'p_empty_or_range','yacc.py',205),
+  ('empty-or-ass-expr -> formal-arg-list ASSIGN expr','empty-or-ass-expr',3,'p_empty_or_ass_expr','yacc.py',211),
+  ('empty-or-ass-expr -> empty','empty-or-ass-expr',1,'p_empty_or_ass_expr','yacc.py',212),
+  ('swift-func-defn -> func-hdr ARROW block','swift-func-defn',3,'p_swift_func_defn','yacc.py',221),
+  ('app-func-defn -> C_APP func-hdr LBRACE app-body RBRACE','app-func-defn',5,'p_app_func_defn','yacc.py',228),
+  ('app-body -> app-arg-expr app-arg-expr-star app-out-star empty-or-semicolon','app-body',4,'p_app_body','yacc.py',235),
+  ('empty-or-semicolon -> SEMICOLON','empty-or-semicolon',1,'p_empty_or_semicolon','yacc.py',241),
+  ('empty-or-semicolon -> empty','empty-or-semicolon',1,'p_empty_or_semicolon','yacc.py',242),
+  ('app-out-star -> app-out-star std-in-out-err ASSIGN expr','app-out-star',4,'p_app_out_star','yacc.py',249),
+  ('app-out-star -> <empty>','app-out-star',0,'p_app_out_star','yacc.py',250),
+  ('std-in-out-err -> E_STDIN','std-in-out-err',1,'p_std_in_out_err','yacc.py',261),
+  ('std-in-out-err -> E_STDOUT','std-in-out-err',1,'p_std_in_out_err','yacc.py',262),
+  ('std-in-out-err -> E_STDERR','std-in-out-err',1,'p_std_in_out_err','yacc.py',263),
+  ('app-arg-expr-star -> app-arg-expr-star app-arg-expr','app-arg-expr-star',2,'p_app_arg_expr_star','yacc.py',270),
+  ('app-arg-expr-star -> <empty>','app-arg-expr-star',0,'p_app_arg_expr_star','yacc.py',271),
+  ('foreign-func-defn -> func-hdr foreign-func-body','foreign-func-defn',2,'p_foreign_func_defn','yacc.py',281),
+  ('foreign-func-body -> STR_LITERAL STR_LITERAL empty-or-literal empty-or-more-literals','foreign-func-body',4,'p_foreign_func_body','yacc.py',287),
+  ('empty-or-literal -> STR_LITERAL','empty-or-literal',1,'p_empty_or_literal','yacc.py',294),
+  ('empty-or-literal -> empty','empty-or-literal',1,'p_empty_or_literal','yacc.py',295),
+  ('empty-or-more-literals -> LBRACKET single-or-multiple-literal RBRACKET','empty-or-more-literals',3,'p_empty_or_more_literals','yacc.py',301),
+  ('empty-or-more-literals -> empty','empty-or-more-literals',1,'p_empty_or_more_literals','yacc.py',302),
+  ('single-or-multiple-literal -> STR_LITERAL','single-or-multiple-literal',1,'p_single_or_multistring_literal','yacc.py',311),
+  ('single-or-multiple-literal -> MUL_STR_LITERAL','single-or-multiple-literal',1,'p_single_or_multistring_literal','yacc.py',312),
+  ('var-decl -> type-prefix var-decl-rest','var-decl',2,'p_var_decl','yacc.py',318),
+  ('var-decl-rest-star -> var-decl-rest-star COMMA var-decl-rest','var-decl-rest-star',3,'p_var_decl_rest_star','yacc.py',324),
+  ('var-decl-rest-star -> <empty>','var-decl-rest-star',0,'p_var_decl_rest_star','yacc.py',325),
+  ('var-decl-rest -> var-name type-suffix empty-or-var-mapping empty-or-assign-expr','var-decl-rest',4,'p_var_decl_rest','yacc.py',335),
+  ('empty -> <empty>','empty',0,'p_empty','yacc.py',342),
+  ('empty-or-var-mapping -> var-mapping','empty-or-var-mapping',1,'p_empty_or_var_mapping','yacc.py',348),
+  ('empty-or-var-mapping -> empty','empty-or-var-mapping',1,'p_empty_or_var_mapping','yacc.py',349),
+  ('empty-or-assign-expr -> ASSIGN expr','empty-or-assign-expr',2,'p_empty_or_assign_expr','yacc.py',359),
+  ('empty-or-assign-expr -> empty','empty-or-assign-expr',1,'p_empty_or_assign_expr','yacc.py',360),
+  ('type-prefix -> type-name','type-prefix',1,'p_type_prefix','yacc.py',369),
+  ('type-prefix -> param-type','type-prefix',1,'p_type_prefix','yacc.py',370),
+  ('param-type -> builtin-type-name LESS standalone-type GREATER','param-type',4,'p_param_type','yacc.py',376),
+  ('param-type -> ID LESS ID GREATER','param-type',4,'p_param_type','yacc.py',377),
+  ('param-type -> ID LESS compound-type GREATER','param-type',4,'p_param_type','yacc.py',378),
+  ('compound-type -> builtin-type-name type-suffix','compound-type',2,'p_compound_type','yacc.py',388),
+  ('compound-type -> param-type type-suffix','compound-type',2,'p_compound_type','yacc.py',389),
+  ('compound-type -> ID type-suffix-plus','compound-type',2,'p_compound_type','yacc.py',390),
+  ('type-suffix -> type-suffix-plus','type-suffix',1,'p_type_suffix','yacc.py',396),
+  ('type-suffix -> empty','type-suffix',1,'p_type_suffix','yacc.py',397),
+  ('type-suffix-plus -> type-suffix-plus LBRACKET empty-or-standalone-type RBRACKET','type-suffix-plus',4,'p_type_suffix_plus','yacc.py',403),
+  ('type-suffix-plus -> LBRACKET empty-or-standalone-type RBRACKET','type-suffix-plus',3,'p_type_suffix_plus','yacc.py',404),
+  ('empty-or-standalone-type -> standalone-type','empty-or-standalone-type',1,'p_empty_or_standalone_type','yacc.py',414),
+  ('empty-or-standalone-type -> empty','empty-or-standalone-type',1,'p_empty_or_standalone_type','yacc.py',415),
+  ('standalone-type -> type-prefix type-suffix','standalone-type',2,'p_standalone_type','yacc.py',421),
+  ('var-mapping -> LESS expr GREATER','var-mapping',3,'p_var_mapping','yacc.py',427),
+  ('block -> LBRACE statement-star RBRACE','block',3,'p_block','yacc.py',433),
+  ('block -> LBRACE statement-star error RBRACE','block',4,'p_block_error','yacc.py',439),
+  ('stmt-chain -> chainable-stmt ARROW statement','stmt-chain',3,'p_stmt_chain','yacc.py',446),
+  ('chainable-stmt -> var-name','chainable-stmt',1,'p_chainable_stmt','yacc.py',454),
+  ('chainable-stmt -> func-call','chainable-stmt',1,'p_chainable_stmt','yacc.py',455),
+  ('chainable-stmt -> var-decl','chainable-stmt',1,'p_chainable_stmt','yacc.py',456),
+  ('chainable-stmt -> assignment','chainable-stmt',1,'p_chainable_stmt','yacc.py',457),
+  ('assignment -> lval-or-paren-lval assign-or-plusas expr-list','assignment',3,'p_assignment','yacc.py',463),
+  ('lval-or-lval-list -> lval-list','lval-or-lval-list',1,'p_lval_or_lval_list','yacc.py',470),
+  ('lval-or-lval-list -> LPAREN lval-list RPAREN','lval-or-lval-list',3,'p_lval_or_lval_list','yacc.py',471),
+  ('assign-or-plusas -> ASSIGN','assign-or-plusas',1,'p_assign_or_plusas','yacc.py',481),
+  ('assign-or-plusas -> PLUS_AS','assign-or-plusas',1,'p_assign_or_plusas','yacc.py',482),
+  ('lval-or-paren-lval -> lval-list','lval-or-paren-lval',1,'p_lval_or_paren_lval','yacc.py',489),
+  ('lval-or-paren-lval -> LPAREN lval-list RPAREN','lval-or-paren-lval',3,'p_lval_or_paren_lval','yacc.py',490),
+  ('update-stmt -> ID LESS ID GREATER UPD expr SEMICOLON','update-stmt',7,'p_update_stmt','yacc.py',500),
+  ('if-stmt -> S_IF LPAREN expr RPAREN block opt-else-block','if-stmt',6,'p_if_stmt','yacc.py',506),
+  ('opt-else-block -> else-block','opt-else-block',1,'p_opt_else_block','yacc.py',512),
+  ('opt-else-block -> <empty>','opt-else-block',0,'p_opt_else_block','yacc.py',513),
+  ('else-block -> S_ELSE block','else-block',2,'p_else_block','yacc.py',519),
+  ('switch-stmt -> S_SWITCH LPAREN expr RPAREN LBRACE case-star opt-default RBRACE','switch-stmt',8,'p_switch_stmt','yacc.py',525),
+  ('opt-default -> S_DEFAULT','opt-default',1,'p_opt_default','yacc.py',531),
+  ('opt-default -> empty','opt-default',1,'p_opt_default','yacc.py',532),
+  ('case-star -> case-star case','case-star',2,'p_case_star','yacc.py',538),
+  ('case-star -> empty','case-star',1,'p_case_star','yacc.py',539),
+  ('case -> S_CASE INT COLON case-body','case',4,'p_case','yacc.py',549),
+  ('default -> S_DEFAULT COLON case-body','default',3,'p_default','yacc.py',555),
+  ('wait-stmt -> E_WAIT opt-deep LPAREN expr-list RPAREN block','wait-stmt',6,'p_wait_stmt','yacc.py',561),
+  ('opt-deep -> E_DEEP','opt-deep',1,'p_opt_deep','yacc.py',567),
+  ('opt-deep -> empty','opt-deep',1,'p_opt_deep','yacc.py',568),
+  ('foreach-loop -> S_FOREACH var-name opt-comma-var-name S_IN expr block','foreach-loop',6,'p_foreach_loop','yacc.py',574),
+  ('opt-comma-var-name -> COMMA var-name','opt-comma-var-name',2,'p_opt_comma_var_name','yacc.py',580),
+  ('opt-comma-var-name -> empty','opt-comma-var-name',1,'p_opt_comma_var_name','yacc.py',581),
+  ('for-loop -> S_FOR LPAREN for-init-list SEMICOLON expr SEMICOLON for-update-list RPAREN block','for-loop',9,'p_for_loop','yacc.py',589),
+  ('while-loop -> S_WHILE LPAREN expr RPAREN block','while-loop',5,'p_while_loop','yacc.py',595),
+  ('for-init-list -> for-init for-init-star','for-init-list',2,'p_for_init_list','yacc.py',601),
+  ('for-init-star -> for-init-star COMMA for-init','for-init-star',3,'p_for_init_star','yacc.py',607),
+  ('for-init-star -> empty','for-init-star',1,'p_for_init_star','yacc.py',608),
+  ('for-init -> for-assignment','for-init',1,'p_for_init','yacc.py',618),
+  ('for-init -> type-prefix var-name type-suffix ASSIGN expr','for-init',5,'p_for_init','yacc.py',619),
+  ('for-update-list -> for-assignment for-assignment-star','for-update-list',2,'p_for_update_list','yacc.py',629),
+  ('for-assignment-star -> for-assignment-star COMMA for-assignment','for-assignment-star',3,'p_for_assignment_star','yacc.py',635),
+  ('for-assignment-star -> empty','for-assignment-star',1,'p_for_assignment_star','yacc.py',636),
+  ('for-assignment -> var-name ASSIGN expr','for-assignment',3,'p_for_assignment','yacc.py',646),
+  ('iterate-loop -> S_ITERATE var-name block S_UNTIL LPAREN expr RPAREN','iterate-loop',7,'p_iterate_loop','yacc.py',652),
+  ('expr -> expr LOG_OR expr','expr',3,'p_expr','yacc.py',658),
+  ('expr -> expr LOG_AND expr','expr',3,'p_expr','yacc.py',659),
+  ('expr -> expr EQUAL expr','expr',3,'p_expr','yacc.py',660),
+  ('expr -> expr NOT_EQUAL expr','expr',3,'p_expr','yacc.py',661),
+  ('expr -> expr LESS expr','expr',3,'p_expr','yacc.py',662),
+  ('expr -> expr LESS_EQ expr','expr',3,'p_expr','yacc.py',663),
+  ('expr -> expr GREATER expr','expr',3,'p_expr','yacc.py',664),
+  ('expr -> expr GREATER_EQ expr','expr',3,'p_expr','yacc.py',665),
+  ('expr -> expr PLUS expr','expr',3,'p_expr','yacc.py',666),
+  ('expr -> expr MINUS expr','expr',3,'p_expr','yacc.py',667),
+  ('expr -> expr MULT expr','expr',3,'p_expr','yacc.py',668),
+  ('expr -> expr DIV expr','expr',3,'p_expr','yacc.py',669),
+  ('expr -> expr MULTPER expr','expr',3,'p_expr','yacc.py',670),
+  ('expr -> expr DOUBLEPER expr','expr',3,'p_expr','yacc.py',671),
+  ('expr -> expr MOD expr','expr',3,'p_expr','yacc.py',672),
+  ('expr -> MINUS postfix-expr','expr',2,'p_expr','yacc.py',673),
+  ('expr -> EXCLAMATION postfix-expr','expr',2,'p_expr','yacc.py',674),
+  ('expr -> postfix-expr','expr',1,'p_expr','yacc.py',675),
+  ('postfix-expr -> base-expr','postfix-expr',1,'p_postfix_expr','yacc.py',688),
+  ('postfix-expr -> postfix-expr array-or-struct','postfix-expr',2,'p_postfix_expr','yacc.py',689),
+  ('array-or-struct -> array-subscript','array-or-struct',1,'p_array_or_struct','yacc.py',698),
+  ('array-or-struct -> struct-subscript','array-or-struct',1,'p_array_or_struct','yacc.py',699),
+  ('array-subscript -> LBRACKET expr RBRACKET','array-subscript',3,'p_array_subscript','yacc.py',705),
+  ('struct-subscript -> DOT ID','struct-subscript',2,'p_struct_subscript','yacc.py',711),
+  ('base-expr -> literal','base-expr',1,'p_base_expr','yacc.py',717),
+  ('base-expr -> func-call','base-expr',1,'p_base_expr','yacc.py',718),
+  ('base-expr -> var-name','base-expr',1,'p_base_expr','yacc.py',719),
+  ('base-expr -> LPAREN expr RPAREN','base-expr',3,'p_base_expr','yacc.py',720),
+  ('base-expr -> -constructor','base-expr',1,'p_base_expr','yacc.py',721),
+  ('base-expr -> array-constructor','base-expr',1,'p_base_expr','yacc.py',722),
+  ('func-call -> ID LPAREN func-call-arg-list RPAREN','func-call',4,'p_func_call','yacc.py',731),
+  ('func-call-arg-list -> expr-or-kw func-call-arg-star','func-call-arg-list',2,'p_func_call_arg_list','yacc.py',738),
+  ('func-call-arg-star -> func-call-arg-star COMMA expr-or-kw','func-call-arg-star',3,'p_def_expr_star','yacc.py',747),
+  ('func-call-arg-star -> empty','func-call-arg-star',1,'p_def_expr_star','yacc.py',748),
+  ('expr-or-kw -> expr','expr-or-kw',1,'p_expr_or_kw','yacc.py',758),
+  ('expr-or-kw -> kw-expr','expr-or-kw',1,'p_expr_or_kw','yacc.py',759),
+  ('expr-or-kw -> empty','expr-or-kw',1,'p_expr_or_kw','yacc.py',760),
+  ('-constructor -> LPAREN expr COMMA expr comma-expr-star RPAREN','-constructor',6,'p__constructor','yacc.py',766),
+  ('comma-expr-star -> comma-expr-star COMMA expr','comma-expr-star',3,'p_comma_expr_star','yacc.py',772),
+  ('comma-expr-star -> empty','comma-expr-star',1,'p_comma_expr_star','yacc.py',773),
+  ('array-constructor -> array-list-constructor','array-constructor',1,'p_array_constructor','yacc.py',783),
+  ('array-constructor -> array-range-constructor','array-constructor',1,'p_array_constructor','yacc.py',784),
+  ('array-constructor -> array-kv-constructor','array-constructor',1,'p_array_constructor','yacc.py',785),
+  ('array-list-constructor -> LBRACKET opt-expr-list RBRACKET','array-list-constructor',3,'p_array_list_constructor','yacc.py',791),
+  ('opt-expr-list -> expr-list','opt-expr-list',1,'p_opt_expr_list','yacc.py',797),
+  ('opt-expr-list -> empty','opt-expr-list',1,'p_opt_expr_list','yacc.py',798),
+  ('array-range-constructor -> LBRACKET expr COLON expr opt-coloned-expr RBRACKET','array-range-constructor',6,'p_array_range_constructor','yacc.py',804),
+  ('opt-coloned-expr -> COLON expr','opt-coloned-expr',2,'p_opt_coloned_expr','yacc.py',810),
+  ('opt-coloned-expr -> empty','opt-coloned-expr',1,'p_opt_coloned_expr','yacc.py',811),
+  ('array-kv-constructor -> LBRACE opt-array-constructor RBRACE','array-kv-constructor',3,'p_array_kv_constructor','yacc.py',819),
+  ('opt-array-constructor -> array-kv-elem comma-array-kv-elem-star','opt-array-constructor',2,'p_opt_array_constructor','yacc.py',825),
+  ('opt-array-constructor -> empty','opt-array-constructor',1,'p_opt_array_constructor','yacc.py',826),
+  ('comma-array-kv-elem-star -> comma-array-kv-elem-star COMMA array-kv-elem','comma-array-kv-elem-star',3,'p_comma_array_kv_elem_star','yacc.py',835),
+  ('comma-array-kv-elem-star -> empty','comma-array-kv-elem-star',1,'p_comma_array_kv_elem_star','yacc.py',836),
+  ('array-kv-elem -> expr COLON expr','array-kv-elem',3,'p_array_kv_elem','yacc.py',846),
+  ('kw-expr -> ID ASSIGN expr','kw-expr',3,'p_kw_expr','yacc.py',853),
+  ('literal -> STR_LITERAL','literal',1,'p_literal','yacc.py',859),
+  ('literal -> MUL_STR_LITERAL','literal',1,'p_literal','yacc.py',860),
+  ('literal -> INT','literal',1,'p_literal','yacc.py',861),
+  ('literal -> float-literal','literal',1,'p_literal','yacc.py',862),
+  ('literal -> bool-literal','literal',1,'p_literal','yacc.py',863),
+  ('float-literal -> DOUBLE','float-literal',1,'p_float_literal','yacc.py',869),
+  ('float-literal -> INF','float-literal',1,'p_float_literal','yacc.py',870),
+  ('float-literal -> NAN','float-literal',1,'p_float_literal','yacc.py',871),
+  ('bool-literal -> E_TRUE','bool-literal',1,'p_bool_literal','yacc.py',878),
+  ('bool-literal -> E_FALSE','bool-literal',1,'p_bool_literal','yacc.py',879),
+  ('expr-list -> expr','expr-list',1,'p_expr_list','yacc.py',885),
+  ('type-name -> builtin-type-name','type-name',1,'p_type_name','yacc.py',892),
+  ('type-name -> ID','type-name',1,'p_type_name','yacc.py',893),
+  ('builtin-type-name -> class_INT','builtin-type-name',1,'p_builtin_type_name','yacc.py',899),
+  ('builtin-type-name -> class_DOUBLE','builtin-type-name',1,'p_builtin_type_name','yacc.py',900),
+  ('builtin-type-name -> class_FLOAT','builtin-type-name',1,'p_builtin_type_name','yacc.py',901),
+  ('builtin-type-name -> class_VOID','builtin-type-name',1,'p_builtin_type_name','yacc.py',902),
+  ('builtin-type-name -> class_UINT','builtin-type-name',1,'p_builtin_type_name','yacc.py',903),
+  ('builtin-type-name -> class_BOOL','builtin-type-name',1,'p_builtin_type_name','yacc.py',904),
+  ('builtin-type-name -> class_CHARACTER','builtin-type-name',1,'p_builtin_type_name','yacc.py',905),
+  ('builtin-type-name -> class_String','builtin-type-name',1,'p_builtin_type_name','yacc.py',906),
+  ('builtin-type-name -> collection_SET','builtin-type-name',1,'p_builtin_type_name','yacc.py',907),
+  ('builtin-type-name -> collection_ARRAY','builtin-type-name',1,'p_builtin_type_name','yacc.py',908),
+  ('builtin-type-name -> collection_DICT','builtin-type-name',1,'p_builtin_type_name','yacc.py',909),
+  ('const-name -> ID','const-name',1,'p_const_name','yacc.py',915),
+  ('var-name -> ID','var-name',1,'p_var_name','yacc.py',921),
+  ('lval-list -> lval-expr lval-expr-star','lval-list',2,'p_lval_list','yacc.py',927),
+  ('lval-expr-star -> lval-expr-star COMMA lval-expr','lval-expr-star',3,'p_lval_expr_star','yacc.py',933),
+  ('lval-expr-star -> <empty>','lval-expr-star',0,'p_lval_expr_star','yacc.py',934),
+  ('lval-expr -> var-name subscript-star','lval-expr',2,'p_lval_expr','yacc.py',944),
+  ('subscript-star -> subscript-star array-subscript','subscript-star',2,'p_subscript_star','yacc.py',950),
+  ('subscript-star -> subscript-star struct-subscript','subscript-star',2,'p_subscript_star','yacc.py',951),
+  ('subscript-star -> empty','subscript-star',1,'p_subscript_star','yacc.py',952),
+  ('app-arg-expr -> opt-at var-name','app-arg-expr',2,'p_app_arg_expr','yacc.py',962),
+  ('app-arg-expr -> literal','app-arg-expr',1,'p_app_arg_expr','yacc.py',963),
+  ('app-arg-expr -> array-constructor','app-arg-expr',1,'p_app_arg_expr','yacc.py',964),
+  ('app-arg-expr -> LPAREN expr RPAREN','app-arg-expr',3,'p_app_arg_expr','yacc.py',965),
+  ('opt-at -> AT','opt-at',1,'p_opt_at','yacc.py',976),
+  ('opt-at -> empty','opt-at',1,'p_opt_at','yacc.py',977),
 ]
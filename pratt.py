@@ -0,0 +1,413 @@
+"""
+Precedence-climbing expression sub-parser the LALR parser hands expressions off to.
+The LALR automaton spends a shift and a couple of reductions, each a Python call with a YaccProduction,
+on every operand and operator. In states where only an `expr` can start, the parse method made by
+yacc.build_offset_parser(expressions) calls ExpressionParser.parse instead, which reads the whole expression
+with one Python call per operand and pushes a finished `expr` symbol. The nodes and offsets are the same as those
+of the actions of yacc.py; on anything it does not handle, e.g. a syntax error, it puts the tokens back and
+the LALR automaton parses the expression itself, so errors and recovery are unchanged
+"""
+from ply.yacc import YaccSymbol
+
+import ast_nodes as nodes
+import yacc
+
+# Productions of the nonterminals an expression starts with, the sub-parser implements every one of them
+EXPRESSION_PRODUCTIONS = frozenset((
+    'expr -> postfix-expr',
+    'expr -> MINUS postfix-expr',
+    'expr -> EXCLAMATION postfix-expr',
+    'postfix-expr -> base-expr',
+    'postfix-expr -> postfix-expr array-or-struct',
+    'base-expr -> literal',
+    'base-expr -> func-call',
+    'base-expr -> var-name',
+    'base-expr -> LPAREN expr RPAREN',
+    'base-expr -> -constructor',
+    'base-expr -> array-constructor',
+    'literal -> STR_LITERAL',
+    'literal -> MUL_STR_LITERAL',
+    'literal -> INT',
+    'literal -> float-literal',
+    'literal -> bool-literal',
+    'float-literal -> DOUBLE',
+    'float-literal -> INF',
+    'float-literal -> NAN',
+    'bool-literal -> E_TRUE',
+    'bool-literal -> E_FALSE',
+    'func-call -> ID LPAREN func-call-arg-list RPAREN',
+    'var-name -> ID',
+    '-constructor -> LPAREN expr COMMA expr comma-expr-star RPAREN',
+    'array-constructor -> array-list-constructor',
+    'array-constructor -> array-range-constructor',
+    'array-constructor -> array-kv-constructor',
+    'array-list-constructor -> LBRACKET opt-expr-list RBRACKET',
+    'array-range-constructor -> LBRACKET expr COLON expr opt-coloned-expr RBRACKET',
+    'array-kv-constructor -> LBRACE opt-array-constructor RBRACE',
+))
+LITERALS = frozenset(('STR_LITERAL', 'MUL_STR_LITERAL', 'INT', 'DOUBLE', 'INF', 'NAN', 'E_TRUE', 'E_FALSE'))
+UNARY = frozenset(('MINUS', 'EXCLAMATION'))
+
+
+class _Fallback(Exception):
+    """Raised when the sub-parser meets input it leaves to the LALR automaton"""
+
+
+def _symbols(production):
+    return production.str.split(' -> ')[1].split() if production.len else []
+
+
+def _is_binary(string):
+    symbols = string.split()
+    return len(symbols) == 5 and symbols[:3] == ['expr', '->', 'expr'] and symbols[4] == 'expr'
+
+
+def _first_sets(rules):
+    """
+    Method computes the FIRST set of every nonterminal
+    :param rules: dict nonterminal -> list of right-hand sides
+    :return: (dict nonterminal -> set of tokens, set of nullable nonterminals)
+    """
+    first = {name: set() for name in rules}
+    nullable = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, bodies in rules.items():
+            for body in bodies:
+                for symbol in body:
+                    added = first[symbol] if symbol in rules else {symbol}
+                    if not added <= first[name]:
+                        first[name] |= added
+                        changed = True
+                    if symbol not in nullable:
+                        break
+                else:
+                    if name not in nullable:
+                        nullable.add(name)
+                        changed = True
+    return first, nullable
+
+
+def expression_entries(parser):
+    """
+    Method finds where the LALR parser can hand off to the sub-parser: the LR(0) item sets are rebuilt from the
+    productions and matched with the states of the tables, a token starts a hand-off in a state when every item
+    that could shift it belongs to an expression the state expects
+    :param parser: parser made by yacc.build_parser
+    :return: dict state -> frozenset of token types
+    """
+    productions = parser.productions
+    bodies = [_symbols(production) for production in productions]
+    rules = {}
+    for production, body in zip(productions, bodies):
+        rules.setdefault(production.name, []).append(body)
+    by_name = {}
+    for index, production in enumerate(productions):
+        by_name.setdefault(production.name, []).append(index)
+
+    def closure(items):
+        items = set(items)
+        todo = list(items)
+        while todo:
+            index, dot = todo.pop()
+            if dot < len(bodies[index]):
+                for added in by_name.get(bodies[index][dot], ()):
+                    if (added, 0) not in items:
+                        items.add((added, 0))
+                        todo.append((added, 0))
+        return frozenset(items)
+
+    inner = {productions[index].name for index, _ in closure((index, 0) for index in by_name['expr'])}
+    found = {productions[index].str for name in inner for index in by_name[name]}
+    if {string for string in found if not _is_binary(string)} != EXPRESSION_PRODUCTIONS:
+        raise NotImplementedError('Expressions start with productions the sub-parser does not implement')
+    first, _ = _first_sets(rules)
+    expression_first = first['expr']
+
+    candidates = {}
+    states = {0: closure([(0, 0)])}
+    kernels = {0: frozenset([(0, 0)])}
+    todo = [0]
+    while todo:
+        state = todo.pop()
+        unsafe = set()
+        expected = False
+        moves = {}
+        for index, dot in states[state]:
+            body = bodies[index]
+            if dot == len(body):
+                continue
+            symbol = body[dot]
+            moves.setdefault(symbol, []).append((index, dot + 1))
+            if dot == 0 and productions[index].name in inner:
+                continue
+            if symbol == 'expr':
+                if _is_binary(productions[index].str):  # The right operand is only a part of an expression
+                    unsafe |= expression_first
+                else:
+                    expected = True
+            elif symbol in inner:  # Something else starting like an expression, e.g. a var-name statement
+                unsafe |= first[symbol]
+            elif symbol not in rules:
+                unsafe.add(symbol)
+            # The items of other nonterminals are in the closure and are checked on their own
+        actions = parser.action.get(state, {})
+        if expected:
+            tokens = frozenset(token for token in expression_first - unsafe if actions.get(token, 0) > 0)
+            if tokens:
+                candidates[state] = tokens
+        for symbol, moved in moves.items():
+            target = parser.goto.get(state, {}).get(symbol) if symbol in rules else actions.get(symbol, 0)
+            if target and target > 0 and target not in states:
+                kernels[target] = frozenset(moved)
+                states[target] = closure(moved)
+                todo.append(target)
+
+    # The sub-parser reads every binary operator after an operand. That is what the automaton does where an
+    # operator leads to the state of that operator alone, e.g. not after `var-mapping : LESS expr GREATER`,
+    # where a GREATER followed by an ID ends the mapping
+    operators = {}
+    for index, production in enumerate(productions):
+        if _is_binary(production.str):
+            operators[bodies[index][1]] = frozenset([(index, 2)])
+    binary_states = {operator: state for state, kernel in kernels.items()
+                     for operator, binary in operators.items() if kernel == binary}
+    entries = {}
+    for state, tokens in candidates.items():
+        after = parser.action.get(parser.goto[state]['expr'], {})
+        if all(after.get(operator) == binary_states.get(operator) for operator in operators):
+            entries[state] = tokens
+    return entries
+
+
+class ExpressionParser:
+    """
+    Sub-parser of one parser, it keeps the tokens of the expression being read so it is not shared between threads
+    """
+
+    def __init__(self, entries, levels, right):
+        self.entries = entries  # State -> token types that start a hand-off
+        self.levels = levels  # Binary operator -> binding level, higher binds tighter
+        self.right = right  # Right-associative binary operators
+        self.read = []
+        self.index = 0
+        self.tok = None
+        self.get_token = None
+        self.lookaheadstack = None
+
+    def parse(self, lookahead, get_token, lookaheadstack):
+        """
+        Method reads an expression the way the LALR parser reads it
+        :param lookahead: first token of the expression
+        :param get_token: token function of the lexer
+        :param lookaheadstack: tokens put back for the parser, read before the lexer
+        :return: (AST, offset of the first token, next lookahead), or None after putting back every token read
+        """
+        self.read = [lookahead]
+        self.index = 0
+        self.tok = lookahead
+        self.get_token = get_token
+        self.lookaheadstack = lookaheadstack
+        try:
+            value = self.expression(0)
+        except (_Fallback, RecursionError):  # Nesting too deep for Python recursion is left to the LALR tables
+            lookaheadstack.extend(reversed(self.read[1:]))
+            return None
+        lookaheadstack.extend(reversed(self.read[self.index + 1:]))  # Peeked tokens
+        return value, lookahead.lexpos, self.tok
+
+    def advance(self):
+        index = self.index = self.index + 1
+        read = self.read
+        if index == len(read):
+            read.append(self._read())
+        self.tok = read[index]
+
+    def peek(self):
+        read = self.read
+        if self.index + 1 == len(read):
+            read.append(self._read())
+        return read[self.index + 1]
+
+    def _read(self):
+        if self.lookaheadstack:
+            return self.lookaheadstack.pop()
+        tok = self.get_token()
+        if tok is None:
+            tok = YaccSymbol()
+            tok.type = '$end'
+        return tok
+
+    def expect(self, kind):
+        if self.tok.type != kind:
+            raise _Fallback
+        self.advance()
+
+    def expression(self, min_level):
+        """
+        Method reads operands joined by binary operators binding at least as tight as min_level
+        :param min_level: loosest level the expression may use
+        :return: AST
+        """
+        first = self.tok
+        value = self.unary()
+        pos = first.lexpos  # Read after the operand, the end of the input has no offset
+        levels = self.levels
+        while True:
+            tok = self.tok
+            level = levels.get(tok.type, -1)
+            if level < min_level:
+                return value
+            self.advance()
+            right = self.expression(level if tok.type in self.right else level + 1)
+            value = nodes.BinaryOp(pos, tok.value, value, right)
+
+    def unary(self):
+        tok = self.tok
+        if tok.type in UNARY:
+            self.advance()
+            return nodes.UnaryOp(tok.lexpos, tok.value, self.postfix())
+        return self.postfix()
+
+    def postfix(self):
+        first = self.tok
+        value = self.base()
+        pos = first.lexpos
+        while True:
+            tok = self.tok
+            if tok.type == 'LBRACKET':
+                self.advance()
+                index = self.expression(0)
+                self.expect('RBRACKET')
+                value = nodes.Postfix(pos, value, nodes.Index(tok.lexpos, index))
+            elif tok.type == 'DOT':
+                self.advance()
+                name = self.tok
+                self.expect('ID')
+                value = nodes.Postfix(pos, value, nodes.Member(tok.lexpos, name.value))
+            else:
+                return value
+
+    def base(self):
+        tok = self.tok
+        kind = tok.type
+        if kind in LITERALS:
+            self.advance()
+            return tok.value
+        if kind == 'ID':
+            self.advance()
+            if self.tok.type == 'LPAREN':
+                return nodes.FuncCall(tok.lexpos, tok.value, self.arguments())
+            return tok.value
+        if kind == 'LPAREN':
+            self.advance()
+            value = self.expression(0)
+            if self.tok.type != 'COMMA':
+                self.expect('RPAREN')
+                return value
+            values = [value]
+            while self.tok.type == 'COMMA':
+                self.advance()
+                values.append(self.expression(0))
+            self.expect('RPAREN')
+            return nodes.Tuple(tok.lexpos, values)
+        if kind == 'LBRACKET':
+            return self.array()
+        if kind == 'LBRACE':
+            return self.key_values()
+        raise _Fallback
+
+    def arguments(self):
+        """
+        Method reads the arguments of a call, an argument is an expression, a keyword argument or missing
+        :return: list of arguments, empty for a call without any
+        """
+        self.advance()
+        arguments = [self.argument()]
+        while self.tok.type == 'COMMA':
+            self.advance()
+            arguments.append(self.argument())
+        self.expect('RPAREN')
+        return [] if arguments == [None] else arguments
+
+    def argument(self):
+        tok = self.tok
+        if tok.type == 'COMMA' or tok.type == 'RPAREN':
+            return None
+        if tok.type == 'ID' and self.peek().type == 'ASSIGN':
+            self.advance()
+            self.advance()
+            return nodes.KeywordArg(tok.lexpos, tok.value, self.expression(0))
+        return self.expression(0)
+
+    def array(self):
+        pos = self.tok.lexpos
+        self.advance()
+        if self.tok.type == 'RBRACKET':
+            self.advance()
+            return nodes.ArrayList(pos, [])
+        start = self.expression(0)
+        if self.tok.type != 'COLON':
+            self.expect('RBRACKET')
+            return nodes.ArrayList(pos, [start])
+        self.advance()
+        stop = self.expression(0)
+        step = None
+        if self.tok.type == 'COLON':
+            self.advance()
+            step = self.expression(0)
+        self.expect('RBRACKET')
+        return nodes.ArrayRange(pos, start, stop, step)
+
+    def key_values(self):
+        pos = self.tok.lexpos
+        self.advance()
+        elements = []
+        if self.tok.type != 'RBRACE':
+            elements.append(self.key_value())
+            while self.tok.type == 'COMMA':
+                self.advance()
+                elements.append(self.key_value())
+        self.expect('RBRACE')
+        return nodes.ArrayKV(pos, elements)
+
+    def key_value(self):
+        first = self.tok
+        key = self.expression(0)
+        self.expect('COLON')
+        return nodes.KeyValue(first.lexpos, key, self.expression(0))
+
+
+def binding_levels(parser):
+    """
+    Method finds the binary operators of `expr` and their levels in yacc.precedence
+    :param parser: parser made by yacc.build_parser
+    :return: (dict operator -> level, set of right-associative operators)
+    """
+    operators = {_symbols(production)[1] for production in parser.productions if _is_binary(production.str)}
+    levels = {}
+    right = set()
+    for level, (associativity, *names) in enumerate(yacc.precedence):
+        for name in names:
+            if name in operators:
+                levels[name] = level
+                if associativity == 'right':
+                    right.add(name)
+    if set(levels) != operators:
+        raise NotImplementedError('Binary operators without a precedence level')
+    return levels, frozenset(right)
+
+
+_tables = None
+
+
+def build_parser():
+    """
+    Method creates a parser like yacc.build_offset_parser() that hands expressions off to an ExpressionParser
+    :return: parser
+    """
+    global _tables
+    if _tables is None:
+        _tables = (expression_entries(yacc.build_parser()),) + binding_levels(yacc.build_parser())
+    return yacc.build_offset_parser(ExpressionParser(*_tables))
@@ -1,12 +1,21 @@
+import re
+
+# Everything that can start a comment or a string literal. Triple quotes go
+# first so that a multiline literal is not taken for an empty string.
+_START_RE = re.compile(r'"""|"|//|/\*')
+_BLOCK_RE = re.compile(r'(/\*)|\*/')
+_BLOCK_BYTES_RE = re.compile(rb'(/\*)|\*/')  # For memory-mapped sources
+_STRING_RE = re.compile(r'\\.|"|\n')
+_MUL_STRING_RE = re.compile(r'\\.|"""', re.DOTALL)
+
+
 def preprocess_comments(content):
     """
     Method combines multiline and inline comments processing
     :param content: source file
     :return: source file with removed comments
     """
-    multiline_cleaned = format_multiline_comment(content)
-    inline_cleaned = format_inline_comment(multiline_cleaned)
-    return inline_cleaned
+    return strip_comments(content)
 
 
 def format_multiline_comment(content):
@@ -15,13 +24,7 @@ def format_multiline_comment(content):
     :param content: source file
     :return: code without multiline comments
     """
-    start = content.find('/*')
-    while start != -1:
-        end = content.find('*/') + len('*/')
-        comment = content[start:end]
-        content = content.replace(comment, '')
-        start = content.find('/*')
-    return content
+    return strip_comments(content, inline=False)
 
 
 def format_inline_comment(content):
@@ -30,14 +33,81 @@ def format_inline_comment(content):
     :param content: source code
     :return: code without inline comments
     """
-    start = content.find('//')
-    while start != -1:
-        end = content[start:].find('\n')  # End in a substring from start index
-        if end == -1:
-            end = len(content)
-        end = start + end
-
-        comment = content[start:end]
-        content = content.replace(comment, '')
-        start = content.find('//')
-    return content
+    return strip_comments(content, multiline=False)
+
+
+def skip_multiline_comment(content, start):
+    """
+    Method finds the end of a (possibly nested) multiline comment
+    :param content: source code as str, bytes or mmap
+    :param start: index of the opening '/*'
+    :return: index right after the matching '*/' or len(content) if it is not closed
+    """
+    depth = 0
+    block_re = _BLOCK_RE if isinstance(content, str) else _BLOCK_BYTES_RE
+    for match in block_re.finditer(content, start):
+        if match.lastindex == 1:  # Opening '/*'
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return len(content)
+
+
+def skip_string_literal(content, start):
+    """
+    Method finds the end of a string literal, escaped characters are skipped
+    :param content: source code
+    :param start: index of the opening quote(s)
+    :return: index right after the closing quote(s); an unterminated one-line string ends at the line break
+    """
+    if content.startswith('"""', start):
+        for match in _MUL_STRING_RE.finditer(content, start + 3):
+            if match.group() == '"""':
+                return match.end()
+        return len(content)
+    for match in _STRING_RE.finditer(content, start + 1):
+        if match.group() == '"':
+            return match.end()
+        if match.group() == '\n':
+            return match.start()
+    return len(content)
+
+
+def strip_comments(content, inline=True, multiline=True):
+    """
+    Method removes comments in a single pass over the source.
+    Comment markers inside string literals are left alone, multiline comments nest as in Swift
+    and are replaced with the line breaks they contained (or a space), so line numbers do not shift.
+    :param content: source code
+    :param inline: remove inline comments (//abracadabra)
+    :param multiline: remove multiline comments (/* example */)
+    :return: code without comments
+    """
+    parts = []
+    position = 0  # Start of the text not copied yet
+    match = _START_RE.search(content)
+    while match:
+        start = match.start()
+        marker = match.group()
+        if marker == '//':
+            end = content.find('\n', start)
+            if end == -1:
+                end = len(content)
+            if inline:
+                parts.append(content[position:start])
+                position = end
+        elif marker == '/*':
+            end = skip_multiline_comment(content, start)
+            if multiline:
+                parts.append(content[position:start])
+                parts.append('\n' * content.count('\n', start, end) or ' ')
+                position = end
+        else:
+            end = skip_string_literal(content, start)
+        match = _START_RE.search(content, end)
+    if not parts:
+        return content
+    parts.append(content[position:])
+    return ''.join(parts)
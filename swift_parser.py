@@ -0,0 +1,281 @@
+import collections
+import contextlib
+import copy
+
+import fast_lexer
+import lexer
+import pratt
+import table_parser
+import yacc
+
+
+def _skip(p):
+    pass
+
+
+def _column(data, pos):
+    newline = '\n' if isinstance(data, str) else b'\n'
+    return pos - data.rfind(newline, 0, pos)
+
+
+def _syntax_error(token, filename=None):
+    if token is None:
+        return SyntaxError('Unexpected end of input')  # Located by the caller, which knows the lexer
+    return SyntaxError('Syntax error at %s %r' % (token.type, token.value),
+                       (filename, token.lineno, _column(token.lexer.lexdata, token.lexpos), None))
+
+
+def _collect_errors(errors, filename=None):
+    """
+    Method creates a parser error handler that collects diagnostics, the error productions of the grammar
+    then recover from the error and parsing goes on
+    :param errors: list receiving a SyntaxError for every syntax error
+    :param filename: file name stored in the errors
+    :return: error handler
+    """
+    def collect(token):
+        errors.append(_syntax_error(token, filename))
+    return collect
+
+
+def _collect_illegal(errors, data, filename=None):
+    """
+    Method creates a lexer error handler that collects the illegal characters with the syntax errors
+    :param errors: list receiving a SyntaxError for every illegal character
+    :param data: input of the lexer
+    :param filename: file name stored in the errors
+    :return: error handler
+    """
+    def collect(character, lineno, lexpos):
+        errors.append(SyntaxError("Illegal character '%s'" % character,
+                                  (filename, lineno, _column(data, lexpos), None)))
+    return collect
+
+
+def _locate_end(errors, data, lex):
+    # Details passed to the constructor survive pickling, attributes set later do not
+    for index, error in enumerate(errors):
+        if error.lineno is None:
+            errors[index] = SyntaxError(error.msg, (error.filename, lex.lineno, _column(data, len(data)), None))
+
+
+def build_checker():
+    """
+    Method creates a parser that only checks syntax: it shares the LALR tables of yacc.build_parser(),
+    every semantic action does nothing, so no AST is built
+    :return: parser
+    """
+    parser = copy.copy(yacc.build_parser())
+    parser.productions = []
+    for production in yacc.build_parser().productions:
+        production = copy.copy(production)
+        if production.callable is not None:
+            production.callable = _skip
+        parser.productions.append(production)
+    return parser
+
+
+class ParserPool:
+    """
+    Pool of lexer and parser pairs. Every parse checks out its own pair, so threads never share lexer or parser state.
+    Lexers are cloned from the module lexer and parsers are copies sharing the LALR tables that track offsets only,
+    checking out and returning a pair are single deque operations, so no locking is needed.
+    check_only=True pairs a FastLexer and a parser made by build_checker,
+    pratt=True parsers hand expressions off to the precedence-climbing sub-parser of pratt.py,
+    table_driver=True parsers are the dense-table driver of table_parser.py
+    """
+
+    def __init__(self, size=0, fast_lexer=False, check_only=False, pratt=False, table_driver=False):
+        if pratt and table_driver:
+            raise ValueError('The expression sub-parser only works with the PLY driver')
+        self.fast_lexer = fast_lexer
+        self.check_only = check_only
+        self.pratt = pratt
+        self.table_driver = table_driver
+        self.idle = collections.deque(self.create() for _ in range(size))
+
+    def create(self):
+        """
+        Method creates a new lexer and parser pair
+        :return: (lexer, parser)
+        """
+        if self.check_only:
+            return fast_lexer.build_lexer(), build_checker()
+        new_lexer = fast_lexer.build_lexer() if self.fast_lexer else lexer.build_lexer()
+        if self.table_driver:
+            return new_lexer, table_parser.build_parser()
+        return new_lexer, pratt.build_parser() if self.pratt else yacc.build_offset_parser()
+
+    @contextlib.contextmanager
+    def checkout(self):
+        """
+        Method lends a lexer and parser pair for the duration of the with block
+        :return: (lexer, parser)
+        """
+        try:
+            pair = self.idle.pop()
+        except IndexError:  # All pairs are busy
+            pair = self.create()
+        try:
+            yield pair
+        finally:
+            self.idle.append(pair)
+
+
+class SwiftParser:
+    """
+    Reusable parser of Swift code, one instance can be used from many threads at once.
+    The lexer and LALR tables are built once, every parse_* method returns the AST
+    and prints nothing but syntax errors, which are collected into a list instead when one is passed as errors.
+    fast_lexer=True lexes with the table-driven FastLexer instead of the PLY lexer,
+    pratt=True parses expressions with the sub-parser of pratt.py and table_driver=True parses with the driver of
+    table_parser.py, the AST is the same.
+    The validate_* and check_* methods only check syntax, they build no AST
+    """
+
+    def __init__(self, pool=None, fast_lexer=False, pratt=False, table_driver=False):
+        self.pool = pool if pool is not None else ParserPool(size=1, fast_lexer=fast_lexer, pratt=pratt,
+                                                             table_driver=table_driver)
+        self.checkers = ParserPool(check_only=True)  # Created on the first check
+
+    def parse_string(self, data, errors=None, filename=None):
+        """
+        Method parses source code, syntax errors are recovered from at statement and block boundaries
+        :param data: source code
+        :param errors: list receiving a SyntaxError with line and column for every syntax error and illegal character,
+                       errors are written to stderr by default
+        :param filename: file name stored in the errors
+        :return: AST
+        """
+        with self.pool.checkout() as (lex, parser):
+            lex.lineno = 1
+            lex.input(data)
+            return self._parse(lex, parser, data, errors, filename, tracking=True)
+
+    def parse_bytes(self, data, encoding='utf8', errors=None):
+        """
+        Method parses encoded source code
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :param errors: list receiving a SyntaxError for every syntax error
+        :return: AST
+        """
+        return self.parse_string(data.decode(encoding), errors)
+
+    def parse_file(self, path, encoding='utf8', errors=None):
+        """
+        Method parses a source file
+        :param path: path to the source file
+        :param encoding: encoding of the source file
+        :param errors: list receiving a SyntaxError for every syntax error
+        :return: AST
+        """
+        with open(path, 'r', encoding=encoding, newline='') as file:  # Same offsets as parse_mmap and the cache
+            return self.parse_string(file.read(), errors, path)
+
+    def parse_mmap(self, path, encoding='utf8', errors=None):
+        """
+        Method parses a memory-mapped source file without reading it into a string,
+        node positions and error columns are in bytes. The file is read with parse_file if MmapLexer does not
+        support the rules of lexer.py, positions are then in characters
+        :param path: path to the source file
+        :param encoding: encoding of the source file
+        :param errors: list receiving a SyntaxError for every syntax error
+        :return: AST
+        """
+        if not fast_lexer.supported():
+            return self.parse_file(path, encoding, errors)
+        source = fast_lexer.open_source(path)
+        lex = fast_lexer.MmapLexer(encoding=encoding)
+        lex.input(source)
+        try:
+            with self.pool.checkout() as (_, parser):
+                return self._parse(lex, parser, source, errors, path, tracking=True)
+        finally:
+            if hasattr(source, 'close'):
+                source.close()
+
+    def validate_string(self, data, filename=None):
+        """
+        Method checks the syntax of source code without building the AST, every syntax error and illegal character
+        is reported in one pass
+        :param data: source code
+        :param filename: file name stored in the errors
+        :return: list of SyntaxError with lineno and offset (1-based column), empty if the code parses
+                 and has no illegal character
+        """
+        errors = []
+        with self.checkers.checkout() as (lex, parser):
+            lex.lineno = 1
+            lex.input(data)
+            self._parse(lex, parser, data, errors, filename=filename)
+        return errors
+
+    def validate_bytes(self, data, encoding='utf8'):
+        """
+        Method checks the syntax of encoded source code without building the AST
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :return: list of SyntaxError, empty if the code parses
+        """
+        return self.validate_string(data.decode(encoding))
+
+    def validate_file(self, path, encoding='utf8'):
+        """
+        Method checks the syntax of a source file without building the AST
+        :param path: path to the source file
+        :param encoding: encoding of the source file
+        :return: list of SyntaxError with filename set, empty if the code parses
+        """
+        with open(path, 'r', encoding=encoding, newline='') as file:  # Same offsets as parse_mmap and the cache
+            return self.validate_string(file.read(), path)
+
+    @staticmethod
+    def _parse(lex, parser, data, errors, filename=None, tracking=False):
+        """
+        Method runs a checked out parser and lexer with the error handlers of the call
+        :param lex: lexer with its input set
+        :param parser: parser
+        :param data: input of the lexer
+        :param errors: list receiving the syntax errors and illegal characters, None to write them to stderr
+        :param filename: file name stored in the errors
+        :param tracking: track the positions of the nodes
+        :return: result of the parser
+        """
+        if errors is None:
+            parser.errorfunc = yacc.p_error
+            lex.errorfunc = lexer.report_error
+            return parser.parse(lexer=lex, tracking=tracking)
+        found = []
+        parser.errorfunc = _collect_errors(found, filename)
+        lex.errorfunc = _collect_illegal(found, data, filename)
+        result = parser.parse(lexer=lex, tracking=tracking)
+        _locate_end(found, data, lex)
+        errors.extend(found)
+        return result
+
+    def check_string(self, data):
+        """
+        Method checks the syntax of source code without building the AST
+        :param data: source code
+        :return: True if the code parses and has no illegal character, False otherwise
+        """
+        return not self.validate_string(data)
+
+    def check_bytes(self, data, encoding='utf8'):
+        """
+        Method checks the syntax of encoded source code without building the AST
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :return: True if the code parses and has no illegal character, False otherwise
+        """
+        return not self.validate_bytes(data, encoding)
+
+    def check_file(self, path, encoding='utf8'):
+        """
+        Method checks the syntax of a source file without building the AST
+        :param path: path to the source file
+        :param encoding: encoding of the source file
+        :return: True if the code parses and has no illegal character, False otherwise
+        """
+        return not self.validate_file(path, encoding)
@@ -0,0 +1,344 @@
+"""
+LALR driver specialized for the grammar of yacc.py, built straight from the tables of parsetab.py.
+The generic loop of PLY looks actions and gotos up in dicts keyed by symbol names, wraps every symbol in a
+YaccSymbol and every reduction in a YaccProduction slice. Here token and nonterminal names are numbered once,
+the action and goto tables are dense lists indexed by state and number, the values and offsets of the stack
+live in two parallel lists, and rules whose action only does p[0] = p[1] are not called at all: the value
+stays on the stack and only the state changes. eliminate_unit_rules() goes further and removes such unit rules
+from the automaton, so most of them are never even looked up. Input with a syntax error is parsed again from
+the start by the PLY driver, so error messages and recovery are exactly those of yacc.build_offset_parser()
+"""
+import ast
+import inspect
+import textwrap
+
+import parsetab
+import yacc
+
+
+class _Restart(Exception):
+    """Raised at the first syntax error, the input is then parsed by the PLY driver"""
+
+
+class Production:
+    """
+    The `p` of the grammar actions: p[n] is the value of symbol n, p[0] the result, p.lexpos(n) its offset
+    """
+    __slots__ = ('values', 'positions', 'lexer', 'parser')
+
+    def __init__(self, lexer, parser):
+        self.values = None
+        self.positions = None
+        self.lexer = lexer
+        self.parser = parser
+
+    def __getitem__(self, n):
+        return self.values[n]
+
+    def __setitem__(self, n, value):
+        self.values[n] = value
+
+    def __len__(self):
+        return len(self.values)
+
+    def lexpos(self, n):
+        return self.positions[n]
+
+
+def _len_test(test, size):
+    """
+    Method evaluates a condition of the form len(p) == K or len(p) != K
+    :param test: ast node of the condition
+    :param size: len(p) of the production
+    :return: True or False, None for any other condition
+    """
+    if not (isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.left, ast.Call)
+            and isinstance(test.left.func, ast.Name) and test.left.func.id == 'len'
+            and isinstance(test.comparators[0], ast.Constant)):
+        return None
+    if isinstance(test.ops[0], ast.Eq):
+        return size == test.comparators[0].value
+    if isinstance(test.ops[0], ast.NotEq):
+        return size != test.comparators[0].value
+    return None
+
+
+def _taken_statement(statements, size):
+    """
+    Method follows the len(p) branches of an action down to the single statement run for a production
+    :param statements: body of the action
+    :param size: len(p) of the production
+    :return: ast statement or None if the branch does more than one thing
+    """
+    statements = [statement for statement in statements if not (
+        isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant))]  # Docstrings
+    if len(statements) != 1:
+        return None
+    statement = statements[0]
+    if isinstance(statement, ast.If):
+        taken = _len_test(statement.test, size)
+        if taken is None:
+            return None
+        return _taken_statement(statement.body if taken else statement.orelse, size)
+    return statement
+
+
+def _subscript(node, name, index):
+    return (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == name
+            and isinstance(node.slice, ast.Constant) and node.slice.value == index)
+
+
+def passes_through(function, length):
+    """
+    Method checks whether the action of a production with one symbol only does p[0] = p[1]
+    :param function: grammar action
+    :param length: number of symbols of the production
+    :return: bool
+    """
+    if length != 1:
+        return False
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return False
+    definition = tree.body[0]
+    if not isinstance(definition, ast.FunctionDef) or len(definition.args.args) != 1:
+        return False
+    name = definition.args.args[0].arg
+    statement = _taken_statement(definition.body, length + 1)
+    return (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+            and _subscript(statement.targets[0], name, 0) and _subscript(statement.value, name, 1))
+
+
+class Tables:
+    """
+    Dense LALR tables: action[state][token number] is a shift (> 0), a reduction (< 0), accept (0) or None,
+    goto[state][nonterminal number] the state after a reduction, default[state] the reduction of a state
+    that has no other action, done without reading a token, the way PLY does it
+    """
+
+    def __init__(self, module=parsetab, actions=yacc):
+        self.token_ids = {}
+        for row in module._lr_action.values():
+            for name in row:
+                self.token_ids.setdefault(name, len(self.token_ids))
+        for name in list(actions.tokens) + ['$end']:  # Tokens no state accepts are syntax errors
+            self.token_ids.setdefault(name, len(self.token_ids))
+        nonterminal_ids = {}
+        for row in module._lr_goto.values():
+            for name in row:
+                nonterminal_ids.setdefault(name, len(nonterminal_ids))
+        states = max(module._lr_action) + 1
+        self.action = [[None] * len(self.token_ids) for _ in range(states)]
+        self.default = [None] * states
+        for state, row in module._lr_action.items():
+            for name, value in row.items():
+                self.action[state][self.token_ids[name]] = value
+            if len(row) == 1 and next(iter(row.values())) < 0:
+                self.default[state] = next(iter(row.values()))
+        self.goto = [[None] * len(nonterminal_ids) for _ in range(states)]
+        for state, row in module._lr_goto.items():
+            for name, value in row.items():
+                self.goto[state][nonterminal_ids[name]] = value
+        # Rule -> (nonterminal number, number of symbols, action or None when the value passes through)
+        self.rules = []
+        self.passed_through = 0
+        for _, name, length, function_name, _, _ in module._lr_productions:
+            function = getattr(actions, function_name) if function_name else None
+            if function is not None and passes_through(function, length):
+                function = None
+                self.passed_through += 1
+            self.rules.append((nonterminal_ids.get(name), length, function))
+        self.end = self.token_ids['$end']
+        self.redirected = 0
+        self.bypassed = 0
+
+    def _unit_rule(self, state):
+        """
+        Method finds the pass-through unit rule A -> B that is the only action of a state
+        :param state: state number
+        :return: (nonterminal number of A, whether the state reduces without reading a token) or None
+        """
+        actions = {value for value in self.action[state] if value is not None}
+        if len(actions) != 1:
+            return None
+        rule = -actions.pop()
+        if rule <= 0:
+            return None
+        lhs, length, function = self.rules[rule]
+        if length != 1 or function is not None:
+            return None
+        return lhs, self.default[state] is not None
+
+    def _bypass(self, below, state, units):
+        """
+        Method follows the unit reductions that a shift or goto from one state into another would be followed by
+        :param below: state the transition starts from, it stays under the new state on the stack
+        :param state: state the transition leads to
+        :param units: state -> result of _unit_rule for every state
+        :return: the last state of the chain that behaves the same, state itself when there is none
+        """
+        target = state
+        reads = False
+        while units[state] is not None:
+            lhs, defaulted = units[state]
+            reads = reads or not defaulted
+            state = self.goto[below][lhs]
+            # A unit state that reads a token must not be skipped to a state that reduces without reading one:
+            # rules without symbols would then take their offset before the token instead of after it
+            if not reads or self.default[state] is None:
+                target = state
+        return target
+
+    def eliminate_unit_rules(self):
+        """
+        Method removes the pass-through unit rules A -> B from the automaton: a shift or goto into a state whose
+        only action is the reduction of such a rule leads straight to the state the reduction would go to.
+        The value and the offset of B become those of A unchanged and B would be reduced to A on every token,
+        a token that is an error there is still an error a few states later, before it is shifted
+        :return: the tables
+        """
+        units = [self._unit_rule(state) for state in range(len(self.action))]
+        action = [list(row) for row in self.action]
+        goto = [list(row) for row in self.goto]
+        for below in range(len(action)):
+            for table, row in ((action, self.action[below]), (goto, self.goto[below])):
+                for symbol, state in enumerate(row):
+                    if state is not None and state > 0:
+                        target = self._bypass(below, state, units)
+                        if target != state:
+                            table[below][symbol] = target
+                            self.redirected += 1
+        self.action, self.goto = action, goto
+        reachable = {state for rows in (action, goto) for row in rows for state in row if state is not None}
+        self.bypassed = sum(1 for state, unit in enumerate(units) if unit is not None and state not in reachable)
+        return self
+
+
+_tables = {}  # eliminate_unit_rules -> Tables
+
+
+class TableParser:
+    """
+    Parser with the interface of a PLY parser that yacc.build_offset_parser() would make
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.errorfunc = yacc.p_error
+        self.fallback = None  # PLY parser for input with syntax errors, made on the first one
+        self.restarts = 0
+        self.reductions = None  # Reductions of the last parse, None when the PLY driver parsed it
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        """
+        Method parses the tokens of a lexer
+        :param input: source code given to the lexer first
+        :param lexer: lexer, which must let lexpos and lineno be set so it can be rewound,
+                      its errorfunc only hears of illegal characters once
+        :param debug: trace the parse, done by the PLY driver
+        :param tracking: propagate token offsets to the nodes, they always are
+        :param tokenfunc: token function, the PLY driver parses with it
+        :return: AST
+        """
+        if lexer is None or debug or tokenfunc is not None:
+            return self._fallback().parse(input, lexer, debug, tracking, tokenfunc)
+        if input is not None:
+            lexer.input(input)
+        start = lexer.lexpos, lexer.lineno
+        self.reductions = None
+        report = lexer.errorfunc
+        illegal = []
+        lexer.errorfunc = lambda *error: illegal.append(error)  # The PLY driver would lex them a second time
+        try:
+            result = self._parse(lexer)
+        except _Restart:
+            result = _Restart
+        finally:
+            lexer.errorfunc = report
+        if result is _Restart:
+            self.restarts += 1
+            lexer.lexpos, lexer.lineno = start
+            return self._fallback().parse(lexer=lexer, tracking=tracking)
+        for error in illegal:
+            report(*error)
+        return result
+
+    def _fallback(self):
+        if self.fallback is None:
+            self.fallback = yacc.build_offset_parser()
+        self.fallback.errorfunc = self.errorfunc
+        return self.fallback
+
+    def _parse(self, lexer):
+        tables = self.tables
+        action = tables.action
+        goto = tables.goto
+        default = tables.default
+        rules = tables.rules
+        token_ids = tables.token_ids
+        end = tables.end
+        get_token = lexer.token
+        p = Production(lexer, self)
+        states = [0]
+        values = [None]
+        positions = [0]
+        state = 0
+        lookahead = None
+        kind = end
+        reductions = 0
+        while True:
+            t = default[state]
+            if t is None:
+                if lookahead is None:
+                    lookahead = get_token()
+                    kind = end if lookahead is None else token_ids[lookahead.type]
+                t = action[state][kind]
+                if t is None:
+                    raise _Restart
+                if t > 0:
+                    states.append(t)
+                    values.append(lookahead.value)
+                    positions.append(lookahead.lexpos)
+                    state = t
+                    lookahead = None
+                    continue
+                if t == 0:
+                    self.reductions = reductions
+                    return values[-1]
+            reductions += 1
+            lhs, length, function = rules[-t]
+            if function is None:  # p[0] = p[1], the value and the offset stay
+                state = states[-1] = goto[states[-2]][lhs]
+                continue
+            if length:
+                p.values = values[-length - 1:]
+                p.positions = positions[-length - 1:]
+                p.values[0] = None
+                try:
+                    function(p)
+                except SyntaxError:  # Raised by an action to start error recovery
+                    raise _Restart
+                position = positions[-length]
+                del values[-length:], positions[-length:], states[-length:]
+            else:
+                p.values = [None]
+                p.positions = [lexer.lexpos]
+                function(p)
+                position = lexer.lexpos
+            values.append(p.values[0])
+            positions.append(position)
+            state = goto[states[-1]][lhs]
+            states.append(state)
+
+
+def build_parser(eliminate_unit_rules=True):
+    """
+    Method creates a TableParser, the tables are built from parsetab.py once per process
+    :param eliminate_unit_rules: remove the pass-through unit rules from the automaton, the AST is the same
+    :return: TableParser
+    """
+    if eliminate_unit_rules not in _tables:
+        tables = Tables()
+        _tables[eliminate_unit_rules] = tables.eliminate_unit_rules() if eliminate_unit_rules else tables
+    return TableParser(_tables[eliminate_unit_rules])
@@ -0,0 +1,286 @@
+"""
+Token-only lexing for tools that do not need the AST: syntax highlighting, keyword statistics, identifier indexes.
+Tokens come out as a structure of arrays (type id, start offset, end offset, line) instead of LexToken objects.
+Type ids are indices in lexer.tokens. The scanner regex is rebuilt from the rules of lexer.py, so the token types
+and lines are the same as those of lexer.lexer, token values are slices of the source made on demand.
+The scanner is built on first use; if lexer.py has a rule it does not know, the PLY lexer fills the arrays instead
+"""
+import array
+import collections
+import hashlib
+import re
+
+import lexer
+from preprocess_comments import skip_multiline_comment
+
+TYPE_IDS = {name: index for index, name in enumerate(lexer.tokens)}
+TYPE_NAMES = tuple(lexer.tokens)
+RESERVED_IDS = {word: TYPE_IDS[name] for word, name in lexer.reserved.items()}
+ID = TYPE_IDS['ID']
+COMMENT = TYPE_IDS['COMMENT']
+MUL_COMMENT = TYPE_IDS['MUL_COMMENT']
+
+# What the scanner does with a match, by regex group
+_TOKEN = 0  # Token of a fixed type
+_OPERATOR = 1  # Operator or punctuation, the type is looked up by its text
+_IDENTIFIER = 2  # ID or a reserved word
+_NEWLINE = 3
+_LINE_COMMENT = 4
+_BLOCK_COMMENT = 5
+_IGNORE = 6
+_ERROR = 7
+_VALUE_RULES = {'t_MUL_STR_LITERAL', 't_STR_LITERAL', 't_DOUBLE', 't_INT'}  # Rules that only convert the value
+
+
+def _literal(pattern):
+    """
+    Method finds the text matched by a regex made of escaped characters only
+    :param pattern: regex
+    :return: text or None if the regex matches more than one text
+    """
+    if re.fullmatch(r'(\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]|()])+', pattern) is None:
+        return None
+    return re.sub(r'\\(.)', r'\1', pattern)
+
+
+def _build_scanner():
+    """
+    Method rebuilds the master regex of the module lexer in a faster shape: the function rules keep their groups
+    and order, the string rules, which are all escaped operators, become one group of alternatives, longest first,
+    whose matched text is looked up in a dict. Groups for ignored and illegal characters are added
+    :return: (compiled regex, list of (action, type id) by group index, dict operator -> type id)
+    """
+    if len(lexer.lexer.lexre) != 1:
+        raise ValueError('Master regex is split into several parts')
+    regex, functions = lexer.lexer.lexre[0]
+    special = {lexer.t_ID.__name__: _IDENTIFIER, lexer.t_newline.__name__: _NEWLINE,
+               lexer.t_COMMENT.__name__: _LINE_COMMENT, lexer.t_MUL_COMMENT.__name__: _BLOCK_COMMENT}
+    # Ignored characters come first, so blanks do not have to fail every token pattern before they match
+    patterns = ['([%s]+)' % re.escape(lexer.lexer.lexignore)]
+    actions = [None, (_IGNORE, -1)]
+    operators = {}
+    for entry in functions:
+        if entry is None:
+            continue
+        function, name = entry
+        if function is None:
+            text = _literal(getattr(lexer, 't_' + name))
+            if text is None:
+                raise ValueError('String rule t_%s is not an operator' % name)
+            operators[text] = TYPE_IDS[name]
+            continue
+        if function.__name__ in special:
+            action = special[function.__name__]
+        elif function.__name__ in _VALUE_RULES:
+            action = _TOKEN
+        else:
+            raise ValueError('Lexer rule %s is not supported' % function.__name__)
+        patterns.append('(%s)' % function.__doc__)
+        actions.append((action, TYPE_IDS.get(name, -1)))
+        actions.extend([None] * re.compile(function.__doc__, regex.flags).groups)
+    patterns.append('(%s)' % '|'.join(re.escape(text) for text in sorted(operators, key=len, reverse=True)))
+    actions.append((_OPERATOR, -1))
+    patterns.append('(.)')
+    actions.append((_ERROR, -1))
+    return re.compile('|'.join(patterns), regex.flags | re.DOTALL), actions, operators
+
+
+_scanner = None  # Result of _build_scanner, built on first use, () if the rules of lexer.py are not supported
+
+
+def _load_scanner():
+    """
+    Method builds the scanner the first time it is needed, so a lexer rule it does not support only turns it off
+    :return: (compiled regex, actions, operators) of _build_scanner, None if the rules are not supported
+    """
+    global _scanner
+    if _scanner is None:
+        try:
+            _scanner = _build_scanner()
+        except ValueError:
+            _scanner = ()
+    return _scanner or None
+
+
+def operator_ids():
+    """
+    Method maps the text of every operator and punctuation token to its type id
+    :return: dict operator -> type id, ValueError is raised if the rules of lexer.py are not supported
+    """
+    scanner = _load_scanner()
+    if scanner is None:
+        raise ValueError('Rules of lexer.py are not supported by the scanner')
+    return scanner[2]
+
+
+class TokenArrays:
+    """
+    Tokens of a source as parallel arrays, errors holds a SyntaxError with line and column per illegal character
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.types = array.array('H')
+        self.starts = array.array('i')
+        self.ends = array.array('i')
+        self.lines = array.array('i')
+        self.errors = []
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        return zip(self.types, self.starts, self.ends, self.lines)
+
+    def type_name(self, index):
+        return TYPE_NAMES[self.types[index]]
+
+    def text(self, index):
+        """
+        Method slices the source text of a token
+        :param index: index of the token
+        :return: str
+        """
+        return self.data[self.starts[index]:self.ends[index]]
+
+    def count(self):
+        """
+        Method counts the tokens of every type
+        :return: collections.Counter type name -> number of tokens
+        """
+        return collections.Counter(TYPE_NAMES[kind] for kind in self.types)
+
+
+def tokenize_string(data, keep_comments=False):
+    """
+    Method splits source code into tokens
+    :param data: source code
+    :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+    :return: TokenArrays, illegal characters are skipped and reported in its errors
+    """
+    scanner = _load_scanner()
+    if scanner is None:
+        return _tokenize_ply(data, keep_comments)
+    result = TokenArrays(data)
+    types, starts, ends, lines = result.types, result.starts, result.ends, result.lines
+    match = scanner[0].match
+    actions = scanner[1]
+    reserved = RESERVED_IDS.get
+    operators = scanner[2]
+    line = 1
+    pos = 0
+    size = len(data)
+    while pos < size:
+        found = match(data, pos)
+        end = found.end()
+        action, kind = actions[found.lastindex]
+        if action == _OPERATOR:
+            kind = operators[found.group()]
+        elif action == _TOKEN:
+            pass
+        elif action == _IGNORE:
+            pos = end
+            continue
+        elif action == _IDENTIFIER:
+            kind = reserved(found.group(), ID)
+        elif action == _NEWLINE:
+            line += end - pos
+            pos = end
+            continue
+        elif action == _LINE_COMMENT:
+            if not keep_comments:
+                pos = end
+                continue
+        elif action == _BLOCK_COMMENT:
+            end = skip_multiline_comment(data, pos)
+            newlines = data.count('\n', pos, end)
+            if not keep_comments:
+                line += newlines
+                pos = end
+                continue
+            types.append(kind)
+            starts.append(pos)
+            ends.append(end)
+            lines.append(line)
+            line += newlines
+            pos = end
+            continue
+        else:
+            result.errors.append(SyntaxError("Illegal character '%s'" % data[pos],
+                                             (None, line, pos - data.rfind('\n', 0, pos), None)))
+            pos = end
+            continue
+        types.append(kind)
+        starts.append(pos)
+        ends.append(end)
+        lines.append(line)
+        pos = end
+    return result
+
+
+def _tokenize_ply(data, keep_comments):
+    """
+    Method splits source code into tokens with the PLY lexer, for rules the scanner does not support
+    :param data: source code
+    :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+    :return: TokenArrays
+    """
+    result = TokenArrays(data)
+    lex = lexer.build_lexer(keep_comments)
+    lex.errorfunc = lambda character, lineno, lexpos: result.errors.append(SyntaxError(
+        "Illegal character '%s'" % character, (None, lineno, lexpos - data.rfind('\n', 0, lexpos), None)))
+    lex.input(data)
+    for tok in lex:
+        result.types.append(TYPE_IDS[tok.type])
+        result.starts.append(tok.lexpos)
+        result.ends.append(lex.lexpos)
+        result.lines.append(tok.lineno)
+    return result
+
+
+class TokenCache:
+    """
+    Memo of tokenize results keyed by a hash of the source, the least recently used entries are dropped
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def tokenize_bytes(self, data, encoding='utf8', keep_comments=False):
+        """
+        Method splits encoded source code into tokens or returns the memoized result
+        :param data: source code as bytes
+        :param encoding: encoding of the source code
+        :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+        :return: TokenArrays, shared with other callers, must not be modified
+        """
+        key = (hashlib.sha256(data).digest(), encoding, keep_comments)
+        tokens = self.entries.get(key)
+        if tokens is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return tokens
+        self.misses += 1
+        tokens = self.entries[key] = tokenize_string(data.decode(encoding), keep_comments)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return tokens
+
+
+def tokenize_file(path, encoding='utf8', keep_comments=False, cache=None):
+    """
+    Method splits a source file into tokens
+    :param path: path to the source file
+    :param encoding: encoding of the source file
+    :param keep_comments: emit comments as COMMENT/MUL_COMMENT tokens
+    :param cache: TokenCache, no memoization by default
+    :return: TokenArrays
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if cache is not None:
+        return cache.tokenize_bytes(data, encoding, keep_comments)
+    return tokenize_string(data.decode(encoding), keep_comments)
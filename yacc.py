@@ -1,26 +1,62 @@
+import copy
+import linecache
+import re
+import sys
+import textwrap
+import types
+
 import ply.yacc as yacc
-import json
+import ast_json
+import ast_nodes as nodes
 import lexer
 
 
 tokens = lexer.tokens
 
+# Binary operators from the loosest to the tightest. EQUAL binds like the comparisons and NOT_EQUAL groups
+# to the right, as they did in the chain of one nonterminal per level this table replaces.
+# An if without else binds looser than S_ELSE, so an else belongs to the nearest if
+precedence = (
+    ('nonassoc', 'IF_WITHOUT_ELSE'),
+    ('nonassoc', 'S_ELSE'),
+    ('left', 'LOG_OR'),
+    ('left', 'LOG_AND'),
+    ('right', 'NOT_EQUAL'),
+    ('left', 'EQUAL', 'LESS', 'LESS_EQ', 'GREATER', 'GREATER_EQ'),
+    ('left', 'PLUS', 'MINUS'),
+    ('left', 'MULT', 'DIV', 'MULTPER', 'DOUBLEPER', 'MOD'),
+)
+
 
 def p_translation_unit(p):
     """
     translation-unit  :  statement-star
+                       | statement-star error
     """
+    # An error that runs into the end of the input keeps the statements before it, see _END_RECOVERY
     p[0] = p[1]
 
 def p_statement_star(p):
     """
-    statement-star  : statement statement-star
+    statement-star : statement-star statement
+                    | statement-star error SEMICOLON
                     | empty
     """
-    try:
-        p[0] = (p[1], (p[2]))
-    except:
+    if len(p) == 3:
+        p[1].append(p[2])
         p[0] = p[1]
+    elif len(p) == 4:  # Panic mode: the broken statement is skipped up to its semicolon
+        p[0] = p[1]
+    else:
+        p[0] = []
+
+def p_case_body(p):
+    """
+    case-body  :  statement-star
+    """
+    # Not translation-unit, so the top-level statements are only reduced at the end of the input,
+    # and a stray RBRACE is a syntax error recovered from by statement-star
+    p[0] = p[1]
 
 def p_statement(p):
     """
@@ -39,7 +75,7 @@ def p_statement(p):
                | while-loop
                | iterate-loop
                | stmt-chain
-               | opt-else-block
+               | else-block
                | var-name
                | assignment
                | func-call
@@ -51,36 +87,37 @@ def p_global_const_defn(p):
     """
     global-const-defn  :  C_GLOBAL C_CONST var-decl SEMICOLON
     """
-    p[0] = ('GLOBAL_CONSTANT', p[3])
+    p[0] = nodes.GlobalConstant(p.lexpos(1), p[3])
 
 def p_import_stmt(p):
     """
     import-stmt  :  D_IMPORT module-path SEMICOLON
                 | D_IMPORT STR_LITERAL SEMICOLON
     """
-    p[0] = ('IMPORT', p[2])
+    p[0] = nodes.Import(p.lexpos(1), p[2])
 
 def p_module_path(p):
     """
     module-path  :  ID path-star
     """
-    p[0] = ('MODULE_PATH', (p[1]))
+    p[0] = nodes.ModulePath(p.lexpos(1), p[1])
 
 def p_path_star(p):
     """
-    path-star   : DOT ID path-star
-	|
+    path-star : path-star DOT ID
+               |
     """
-    try:
-        p[0] = ('PATH', p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_pragma_stms(p):
     """
     pragma-stmt  :  C_PRAGMA ID expr  SEMICOLON
     """
-    p[0] = ('PRAGMA', p[2], p[3])
+    p[0] = nodes.Pragma(p.lexpos(1), p[2], p[3])
 
 def p_func_defn(p):
     """
@@ -92,16 +129,12 @@ def p_func_defn(p):
 
 def p_func_hdr(p):
     """
-    func-hdr  : D_FUNCTION ID formal-arg-list empty-or-arg-list
+    func-hdr  : D_FUNCTION ID
+              | D_FUNCTION ID formal-args
+              | D_FUNCTION ID formal-args formal-args
     """
-    p[0] = (p[3], p[1], p[2], p[4])
-
-def p_empty_or_arg_list(p):
-    """
-    empty-or-arg-list    : formal-arg-list
-	                     | empty
-    """
-    p[0] = p[1]
+    # A single argument list is the first one, the alternatives spell it out so no empty list has to be guessed
+    p[0] = nodes.FuncHeader(p.lexpos(1), p[2], p[3] if len(p) > 3 else None, p[4] if len(p) > 4 else None)
 
 
 def p_type_params(p):
@@ -109,55 +142,61 @@ def p_type_params(p):
     type-params  : LESS var-name comma-name-star GREATER
 	             | empty
     """
-    try:
-        p[0] = ('NAME', p[2], (p[3]))
-    except:
+    if len(p) == 5:
+        p[0] = nodes.TypeParams(p.lexpos(1), [p[2]] + p[3])
+    else:
         p[0] = None
 
 def p_comma_name_star(p):
     """
-    comma-name-star : COMMA var-name comma-name-star
-	| empty
+    comma-name-star : comma-name-star COMMA var-name
+                     | empty
     """
-    try:
-        p[0] = ('NAME', p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_formal_arg_list(p):
     """
-    formal-arg-list  : LPAREN opt-formal-args RPAREN
+    formal-arg-list  : formal-args
 	| empty
     """
-    try:
-        p[0] = ('ARGS', p[2])
-    except:
-        p[0] = None
+    p[0] = p[1]
+
+def p_formal_args(p):
+    """
+    formal-args  : LPAREN opt-formal-args RPAREN
+    """
+    p[0] = nodes.FormalArgs(p.lexpos(1), p[2])
 
 def p_opt_formal_args(p):
     """
     opt-formal-args : formal-arg comma-args-star
 	| empty
     """
-    try: p[0] = (p[1], (p[2]))
-    except:
-        p[0] = None
+    if p[1] is not None:
+        p[0] = [p[1]] + p[2]
+    else:
+        p[0] = []
 
 def p_comma_args_star(p):
     """
-    comma-args-star : COMMA formal-arg comma-args-star
-	| empty
+    comma-args-star : comma-args-star COMMA formal-arg
+                     | empty
     """
-    try:
-        p[0] = ('ARGS', p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_formal_arg(p):
     """
     formal-arg  :  empty-or-range var-name COLON type-prefix
     """
-    p[0] = ('ARG', p[2], p[4], p[1])
+    p[0] = nodes.FormalArg(p.lexpos(1) if p[1] else p.lexpos(2), p[2], p[4], p[1])
 
 
 def p_empty_or_range(p):
@@ -172,27 +211,30 @@ def p_empty_or_ass_expr(p):
     empty-or-ass-expr    : formal-arg-list ASSIGN expr
 	| empty
     """
-    p[0] = ('ASSIGN', p[1], p[2])
+    if len(p) == 4:
+        p[0] = nodes.Initializer(p.lexpos(2), p[3])
+    else:
+        p[0] = None
 
 def p_swift_func_defn(p):
     """
     swift-func-defn  :   func-hdr ARROW block
     """
-    p[0] = (p[1], p[3])
+    p[0] = nodes.FuncDefn(p.lexpos(1), p[1], p[3])
 
 
 def p_app_func_defn(p):
     """
     app-func-defn  :   C_APP func-hdr LBRACE app-body RBRACE
     """
-    p[0] = ('APP', p[3], p[5])
+    p[0] = nodes.AppFuncDefn(p.lexpos(1), p[2], p[4])
 
 
 def p_app_body(p):
     """
     app-body  :  app-arg-expr app-arg-expr-star app-out-star empty-or-semicolon
     """
-    p[0] = ('BODY', p[1], (p[2]), (p[3]), p[4])
+    p[0] = nodes.AppBody(p.lexpos(1), [p[1]] + p[2], p[3])
 
 def p_empty_or_semicolon(p):
     """
@@ -204,13 +246,14 @@ def p_empty_or_semicolon(p):
 
 def p_app_out_star(p):
     """
-    app-out-star    : std-in-out-err ASSIGN expr app-out-star
+    app-out-star    : app-out-star std-in-out-err ASSIGN expr
 	|
     """
-    try:
-        p[0] = ('APP_OUT', (p[2], p[1], p[3]), (p[4]))
-    except:
-        p[0] = None
+    if len(p) == 5:
+        p[1].append(nodes.AppOutput(p.lexpos(2), p[2], p[4]))
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 
 def p_std_in_out_err(p):
@@ -224,25 +267,27 @@ def p_std_in_out_err(p):
 
 def p_app_arg_expr_star(p):
     """
-    app-arg-expr-star   : app-arg-expr app-arg-expr-star
-	|
+    app-arg-expr-star : app-arg-expr-star app-arg-expr
+                       |
     """
-    try:
-        p[0] = ('APP_ARG_EXPRESSION', p[1], (p[2]))
-    except:
-        p[0] = None
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_foreign_func_defn(p):
     """
     foreign-func-defn  :   func-hdr foreign-func-body
     """
-    p[0] = (p[2], p[3], (p[1]))
+    p[0] = nodes.ForeignFuncDefn(p.lexpos(1), p[1], p[2])
 
 def p_foreign_func_body(p):
     """
     foreign-func-body  :  STR_LITERAL STR_LITERAL empty-or-literal empty-or-more-literals
     """
-    p[0] = ('FOREIGN_FUNC', p[1], p[2], p[3], p[4])
+    strings = [p[1], p[2]] if p[3] is None else [p[1], p[2], p[3]]
+    p[0] = nodes.ForeignFuncBody(p.lexpos(1), strings, p[4])
 
 def p_empty_or_literal(p):
     """
@@ -256,8 +301,8 @@ def p_empty_or_more_literals(p):
     empty-or-more-literals  : LBRACKET single-or-multiple-literal  RBRACKET
 	| empty
     """
-    if len(p)==3:
-        p[0] = (p[2])
+    if len(p) == 4:
+        p[0] = p[2]
     else:
         p[0] = p[1]
 
@@ -272,23 +317,24 @@ def p_var_decl(p):
     """
     var-decl  :  type-prefix var-decl-rest
     """
-    p[0] = ('VARS_DEC', p[1], (p[2]))
+    p[0] = nodes.VarDecl(p.lexpos(1), p[1], p[2])
 
 def p_var_decl_rest_star(p):
     """
-    var-decl-rest-star  : COMMA var-decl-rest var-decl-rest-star
-	|
+    var-decl-rest-star : var-decl-rest-star COMMA var-decl-rest
+                        |
     """
-    try:
-        p[0] = ('VAR_DECL', p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_var_decl_rest(p):
     """
     var-decl-rest  :  var-name type-suffix empty-or-var-mapping empty-or-assign-expr
     """
-    p[0] = ('VAR_DECL_TAILER', p[1], p[2], p[3], p[4])
+    p[0] = nodes.VarDeclRest(p.lexpos(1), p[1], p[2], p[3], p[4])
 
 
 def p_empty(p):
@@ -313,8 +359,9 @@ def p_empty_or_assign_expr(p):
     empty-or-assign-expr    : ASSIGN expr
 	                        | empty
     """
-    try: p[0] = ('ASSIGN', p[2])
-    except:
+    if len(p) == 3:
+        p[0] = nodes.Initializer(p.lexpos(1), p[2])
+    else:
         p[0] = None
 
 def p_type_prefix(p):
@@ -326,19 +373,41 @@ def p_type_prefix(p):
 
 def p_param_type(p):
     """
-    param-type  :  type-name LESS standalone-type GREATER
+    param-type  :  builtin-type-name LESS standalone-type GREATER
+                | ID LESS ID GREATER
+                | ID LESS compound-type GREATER
     """
-    p[0] = (p[3], p[1])
+    # ID is not reduced to type-name before '<', so "name<key> := value" can still become an update-stmt;
+    # a bare ID parameter has its own alternative for the same reason
+    if isinstance(p[3], str):
+        p[3] = nodes.StandaloneType(p.lexpos(3), p[3], [])
+    p[0] = nodes.ParamType(p.lexpos(1), p[1], p[3])
+
+def p_compound_type(p):
+    """
+    compound-type  :  builtin-type-name type-suffix
+                   | param-type type-suffix
+                   | ID type-suffix-plus
+    """
+    p[0] = nodes.StandaloneType(p.lexpos(1), p[1], p[2])
 
 def p_type_suffix(p):
     """
-    type-suffix  : LBRACKET empty-or-standalone-type RBRACKET type-suffix
+    type-suffix  : type-suffix-plus
 	| empty
     """
-    try:
-        p[0] = ('TYPE_SUFFIX', p[4], (p[2]))
-    except:
-        p[0] = None
+    p[0] = p[1] or []
+
+def p_type_suffix_plus(p):
+    """
+    type-suffix-plus  : type-suffix-plus LBRACKET empty-or-standalone-type RBRACKET
+                      | LBRACKET empty-or-standalone-type RBRACKET
+    """
+    if len(p) == 5:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = [p[2]]
 
 def p_empty_or_standalone_type(p):
     """
@@ -351,33 +420,33 @@ def p_standalone_type(p):
     """
     standalone-type  :  type-prefix type-suffix
     """
-    p[0] = ('STANDALONE_TYPE', p[1], p[2])
+    p[0] = nodes.StandaloneType(p.lexpos(1), p[1], p[2])
 
 def p_var_mapping(p):
     """
     var-mapping  :  LESS expr GREATER
     """
-    p[0] = ('VAR_MAPPING', p[1])
+    p[0] = nodes.VarMapping(p.lexpos(1), p[2])
 
 def p_block(p):
     """
-    block  :  LBRACE translation-unit RBRACE
+    block  :  LBRACE statement-star RBRACE
     """
-    p[0] = ('CODE_BLOCK', (p[2]))
+    p[0] = nodes.Block(p.lexpos(1), p[2])
 
-def p_stmt_chain(p):
+def p_block_error(p):
     """
-    stmt-chain  :  chainable-stmt semicolon-or-arrow statement
+    block  :  LBRACE statement-star error RBRACE
     """
-    p[0] = ('STATEMENT_CHAIN', ('STATEMENT', p[2]), p[1])
-
+    # Panic mode: the rest of the block is skipped up to its closing brace, the statements before the error are kept
+    p[0] = nodes.Block(p.lexpos(1), p[2])
 
-def p_semicolon_or_arrow(p):
+def p_stmt_chain(p):
     """
-    semicolon-or-arrow  : SEMICOLON
-                       | ARROW
+    stmt-chain  :  chainable-stmt ARROW statement
     """
-    p[0] = p[1]
+    # A SEMICOLON after a chainable statement always ends the statement, it never chained
+    p[0] = nodes.StmtChain(p.lexpos(1), p[1], p[2], p[3])
 
 
 def p_chainable_stmt(p):
@@ -387,13 +456,13 @@ def p_chainable_stmt(p):
                      | var-decl
                      | assignment
     """
-    p[0] = ('CHAINABLE_STMT', p[1])
+    p[0] = nodes.ChainableStmt(p.lexpos(1), p[1])
 
 def p_assignment(p):
     """
     assignment  :  lval-or-paren-lval assign-or-plusas expr-list
     """
-    p[0] = ('ASSIGNMENT', p[3], p[1], p[2])
+    p[0] = nodes.Assignment(p.lexpos(1), p[1], p[2], p[3])
 
 
 def p_lval_or_lval_list(p):
@@ -428,31 +497,34 @@ def p_lval_or_paren_lval(p):
 
 def p_update_stmt(p):
     """
-    update-stmt  :  var-name LESS ID GREATER UPD expr SEMICOLON
+    update-stmt  :  ID LESS ID GREATER UPD expr SEMICOLON
     """
-    p[0] = ('UPDATE', p[1], p[6])
+    p[0] = nodes.Update(p.lexpos(1), p[1], p[3], p[6])
 
 def p_if_stmt(p):
     """
     if-stmt  :  S_IF LPAREN expr RPAREN block opt-else-block
     """
-    p[0] = ('IF', p[3], p[5], p[6])
+    p[0] = nodes.If(p.lexpos(1), p[3], p[5], p[6])
 
 def p_opt_else_block(p):
     """
-    opt-else-block   : S_ELSE block
-	| empty
+    opt-else-block   : else-block
+	| %prec IF_WITHOUT_ELSE
     """
-    try:
-        p[0] = ('ELSE', p[2])
-    except:
-        p[0] = p[1]
+    p[0] = p[1] if len(p) == 2 else None
+
+def p_else_block(p):
+    """
+    else-block  :  S_ELSE block
+    """
+    p[0] = nodes.Else(p.lexpos(1), p[2])
 
 def p_switch_stmt(p):
     """
     switch-stmt  :  S_SWITCH LPAREN expr RPAREN LBRACE case-star opt-default RBRACE
     """
-    p[0] = ('SWITCH', p[3], (p[6]), p[7])
+    p[0] = nodes.Switch(p.lexpos(1), p[3], p[6], p[7])
 
 def p_opt_default(p):
     """
@@ -463,31 +535,32 @@ def p_opt_default(p):
 
 def p_case_star(p):
     """
-    case-star   : case case-star
-	| empty
+    case-star : case-star case
+               | empty
     """
-    try:
-        p[0] = ('CASES', p[1], (p[2]))
-    except:
-        p[0] = None
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_case(p):
     """
-    case  :  S_CASE INT COLON translation-unit
+    case  :  S_CASE INT COLON case-body
     """
-    p[0] = (p[1], p[2], (p[4]))
+    p[0] = nodes.Case(p.lexpos(1), p[2], p[4])
 
 def p_default(p):
     """
-    default  :  S_DEFAULT COLON translation-unit
+    default  :  S_DEFAULT COLON case-body
     """
-    p[0] = (p[1], (p[3]))
+    p[0] = nodes.Default(p.lexpos(1), p[3])
 
 def p_wait_stmt(p):
     """
     wait-stmt  :  E_WAIT opt-deep LPAREN expr-list RPAREN block
     """
-    p[0] = (p[1], p[2], p[3], p[4], p[5], p[6])
+    p[0] = nodes.Wait(p.lexpos(1), p[2], p[4], p[6])
 
 def p_opt_deep(p):
     """
@@ -500,10 +573,7 @@ def p_foreach_loop(p):
     """
     foreach-loop  :   S_FOREACH var-name opt-comma-var-name S_IN expr block
     """
-    if len(p) == 8:
-        p[0] = (p[1], p[2], p[3], p[4], p[5], p[6], p[7], p[8])
-    else:
-        p[0] = (p[1], p[2], p[3], p[4], p[5], p[6], p[7])
+    p[0] = nodes.Foreach(p.lexpos(1), p[2], p[3], p[5], p[6])
 
 def p_opt_comma_var_name(p):
     """
@@ -518,29 +588,30 @@ def p_for_loop(p):
     """
     for-loop  :   S_FOR LPAREN for-init-list SEMICOLON expr SEMICOLON for-update-list RPAREN block
     """
-    p[0] = ('FOR_LOOP', p[3], p[5], p[7], p[9])
+    p[0] = nodes.For(p.lexpos(1), p[3], p[5], p[7], p[9])
 
 def p_while_loop(p):
     """
     while-loop  :    S_WHILE LPAREN expr RPAREN block
     """
-    p[0] = (p[1], p[3], p[5])
+    p[0] = nodes.While(p.lexpos(1), p[3], p[5])
 
 def p_for_init_list(p):
     """
     for-init-list  :  for-init for-init-star
     """
-    p[0] = (p[1], (p[2]))
+    p[0] = [p[1]] + p[2]
 
 def p_for_init_star(p):
     """
-    for-init-star   : COMMA for-init for-init-star
-	                | empty
+    for-init-star : for-init-star COMMA for-init
+                   | empty
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_for_init(p):
     """
@@ -548,7 +619,7 @@ def p_for_init(p):
              | type-prefix var-name type-suffix ASSIGN expr
     """
     if len(p) == 6:
-        p[0] = (p[1], p[2], p[3], p[4], p[5])
+        p[0] = nodes.ForInit(p.lexpos(1), p[1], p[2], p[3], p[5])
     else:
         p[0] = p[1]
 
@@ -557,164 +628,68 @@ def p_for_update_list(p):
     """
     for-update-list  :  for-assignment for-assignment-star
     """
-    p[0] = (p[1], (p[2]))
+    p[0] = [p[1]] + p[2]
 
 def p_for_assignment_star(p):
     """
-    for-assignment-star : COMMA for-assignment for-assignment-star
-	| empty
+    for-assignment-star : for-assignment-star COMMA for-assignment
+                         | empty
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_for_assignment(p):
     """
     for-assignment  :  var-name ASSIGN expr
     """
-    p[0] = (p[2], p[1], p[3])
+    p[0] = nodes.ForAssignment(p.lexpos(1), p[1], p[3])
 
 def p_iterate_loop(p):
     """
     iterate-loop  :  S_ITERATE var-name block S_UNTIL LPAREN expr RPAREN
     """
-    p[0] = (p[1], p[2], p[3], p[4], p[6])
+    p[0] = nodes.Iterate(p.lexpos(1), p[2], p[3], p[6])
 
 def p_expr(p):
     """
-    expr  :  or-expr
-    """
-    p[0] = p[1]
-
-def p_or_expr(p):
-    """
-    or-expr  :  and-expr
-            | or-expr LOG_OR and-expr
-    """
-    if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-def p_and_expr(p):
-    """
-    and-expr  :  eq-expr
-             | and-expr LOG_AND eq-expr
-    """
-    if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-def p_eq_expr(p):
-    """
-    eq-expr  :  cmp-expr
-            | eq-expr eq-or-not-eq eq-expr
-    """
-    if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-
-def p_eq_or_not_eq(p):
-    """
-    eq-or-not-eq    : EQUAL
-                   | NOT_EQUAL
-    """
-    p[0] = p[1]
-
-
-def p_cmp_expr(p):
-    """
-    cmp-expr  :  add-expr
-             | cmp-expr cmp-sign add-expr
-    """
-    if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-
-def p_cmp_sign(p):
-    """
-    cmp-sign        : LESS
-                   | LESS_EQ
-                   | EQUAL
-                   | GREATER
-                   | GREATER_EQ
-    """
-    p[0] = p[1]
-
-
-def p_add_expr(p):
-    """
-    add-expr  :  mult-expr
-             | add-expr add-sign mult-expr
-    """
-    if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-
-def p_add_sign(p):
-    """
-    add-sign    : PLUS
-               | MINUS
-    """
-    p[0] = p[1]
-
-
-def p_mult_expr(p):
-    """
-    mult-expr  :  unary-expr
-              | mult-expr mult-sign unary-expr
-    """
+    expr  :  expr LOG_OR expr
+          | expr LOG_AND expr
+          | expr EQUAL expr
+          | expr NOT_EQUAL expr
+          | expr LESS expr
+          | expr LESS_EQ expr
+          | expr GREATER expr
+          | expr GREATER_EQ expr
+          | expr PLUS expr
+          | expr MINUS expr
+          | expr MULT expr
+          | expr DIV expr
+          | expr MULTPER expr
+          | expr DOUBLEPER expr
+          | expr MOD expr
+          | MINUS postfix-expr
+          | EXCLAMATION postfix-expr
+          | postfix-expr
+    """
+    # One rule for every level, the levels and the associativity are in `precedence`
     if len(p) == 4:
-        p[0] = (p[2], p[1], p[3])
-    else:
-        p[0] = p[1]
-
-
-def p_mult_sign(p):
-    """
-    mult-sign   : MULT
-               | DIV
-               | MULTPER
-               | DOUBLEPER
-               | MOD
-    """
-    p[0] = p[1]
-
-
-def p_unary_expr(p):
-    """
-    unary-expr  :  postfix-expr
-                 | minus-or-excl postfix-expr
-    """
-    if len(p) == 3:
-        p[0] = (p[1], p[2])
+        p[0] = nodes.BinaryOp(p.lexpos(1), p[2], p[1], p[3])
+    elif len(p) == 3:
+        p[0] = nodes.UnaryOp(p.lexpos(1), p[1], p[2])
     else:
         p[0] = p[1]
 
 
-def p_minus_or_excl(p):
-    """
-    minus-or-excl   : MINUS
-                   | EXCLAMATION
-    """
-    p[0] = p[1]
-
-
 def p_postfix_expr(p):
     """
     postfix-expr  :  base-expr
                  | postfix-expr array-or-struct
     """
     if len(p) == 3:
-        p[0] = (p[1], p[2])
+        p[0] = nodes.Postfix(p.lexpos(1), p[1], p[2])
     else:
         p[0] = p[1]
 
@@ -729,13 +704,13 @@ def p_array_subscript(p):
     """
     array-subscript  :  LBRACKET expr RBRACKET
     """
-    p[0] = p[2]
+    p[0] = nodes.Index(p.lexpos(1), p[2])
 
 def p_struct_subscript(p):
     """
     struct-subscript  :  DOT ID
     """
-    p[0] = (p[1], p[2])
+    p[0] = nodes.Member(p.lexpos(1), p[2])
 
 def p_base_expr(p):
     """
@@ -755,24 +730,28 @@ def p_func_call(p):
     """
     func-call  :   ID LPAREN func-call-arg-list RPAREN
     """
-    p[0] = (p[2], p[4], p[1])
+    p[0] = nodes.FuncCall(p.lexpos(1), p[1], p[3])
 
 
 def p_func_call_arg_list(p):
     """
     func-call-arg-list  :  expr-or-kw func-call-arg-star
     """
-    p[0] = ('ARGS_CALL_LIST', p[0], (p[2]))
+    if p[1] is None and not p[2]:  # No arguments
+        p[0] = []
+    else:
+        p[0] = [p[1]] + p[2]
 
 def p_def_expr_star(p):
     """
-    func-call-arg-star  : COMMA expr-or-kw func-call-arg-star
-	| empty
+    func-call-arg-star : func-call-arg-star COMMA expr-or-kw
+                        | empty
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_expr_or_kw(p):
     """
@@ -780,26 +759,24 @@ def p_expr_or_kw(p):
                |   kw-expr
                | empty
     """
-    try:
-        p[0] = p[1]
-    except:
-        p[0] = None
+    p[0] = p[1]
 
 def p__constructor(p):
     """
     -constructor  :  LPAREN expr COMMA expr comma-expr-star RPAREN
     """
-    p[0] = ('EXPRESSION_LIST', p[2], p[4], (p[5]))
+    p[0] = nodes.Tuple(p.lexpos(1), [p[2], p[4]] + p[5])
 
 def p_comma_expr_star(p):
     """
-    comma-expr-star : COMMA expr comma-expr-star
-	| empty
+    comma-expr-star : comma-expr-star COMMA expr
+                     | empty
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_array_constructor(p):
     """
@@ -813,7 +790,7 @@ def p_array_list_constructor(p):
     """
     array-list-constructor  :  LBRACKET opt-expr-list RBRACKET
     """
-    p[0] = ('ARRAY_CONSTRUCTOR', p[2])
+    p[0] = nodes.ArrayList(p.lexpos(1), [] if p[2] is None else [p[2]])
 
 def p_opt_expr_list(p):
     """
@@ -826,7 +803,7 @@ def p_array_range_constructor(p):
     """
     array-range-constructor  :  LBRACKET expr COLON expr opt-coloned-expr RBRACKET
     """
-    p[0] = ('ARRAY_RANGE_CONSTR', p[2], p[4], p[5])
+    p[0] = nodes.ArrayRange(p.lexpos(1), p[2], p[4], p[5])
 
 def p_opt_coloned_expr(p):
     """
@@ -841,39 +818,41 @@ def p_array_kv_constructor(p):
     """
     array-kv-constructor  :  LBRACE opt-array-constructor RBRACE
     """
-    p[0] = ('ARRAY_KV_CONSTRUCTOR', p[2])
+    p[0] = nodes.ArrayKV(p.lexpos(1), p[2])
 
 def p_opt_array_constructor(p):
     """
     opt-array-constructor   : array-kv-elem comma-array-kv-elem-star
 	| empty
     """
-    try:p[0]=(p[1], (p[2]))
-    except:
-        p[0] = None
+    if p[1] is not None:
+        p[0] = [p[1]] + p[2]
+    else:
+        p[0] = []
 
 def p_comma_array_kv_elem_star(p):
     """
-    comma-array-kv-elem-star    : COMMA array-kv-elem comma-array-kv-elem-star
-	| empty
+    comma-array-kv-elem-star : comma-array-kv-elem-star COMMA array-kv-elem
+                              | empty
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_array_kv_elem(p):
     """
     array-kv-elem  :  expr COLON expr
     """
-    p[0] = (p[2], p[1], p[3])
+    p[0] = nodes.KeyValue(p.lexpos(1), p[1], p[3])
 
 
 def p_kw_expr(p):
     """
     kw-expr  :  ID ASSIGN expr
     """
-    p[0] = (p[2], p[1], p[3])
+    p[0] = nodes.KeywordArg(p.lexpos(1), p[1], p[3])
 
 def p_literal(p):
     """
@@ -910,7 +889,14 @@ def p_expr_list(p):
 
 def p_type_name(p):
     """
-    type-name  :  class_INT
+    type-name  :  builtin-type-name
+              | ID
+    """
+    p[0] = p[1]
+
+def p_builtin_type_name(p):
+    """
+    builtin-type-name  :  class_INT
               | class_DOUBLE
               | class_FLOAT
               | class_VOID
@@ -921,7 +907,6 @@ def p_type_name(p):
               | collection_SET
               | collection_ARRAY
               | collection_DICT
-              | ID
     """
     p[0] = p[1]
 
@@ -929,7 +914,7 @@ def p_const_name(p):
     """
     const-name  :   ID
     """
-    p[0] = (p[1], p[2])
+    p[0] = p[1]
 
 def p_var_name(p):
     """
@@ -941,34 +926,36 @@ def p_lval_list(p):
     """
     lval-list  :  lval-expr lval-expr-star
     """
-    p[0] = ('LVAL_LIST', p[1], (p[2]))
+    p[0] = [p[1]] + p[2]
 
 def p_lval_expr_star(p):
     """
-    lval-expr-star  : COMMA lval-expr lval-expr-star
-	|
+    lval-expr-star : lval-expr-star COMMA lval-expr
+                    |
     """
-    try:
-        p[0] = (p[2], (p[3]))
-    except:
-        p[0] = None
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_lval_expr(p):
     """
     lval-expr  :  var-name subscript-star
     """
-    p[0] = ('LVAL_EXPR', p[1], (p[2]))
+    p[0] = nodes.Lval(p.lexpos(1), p[1], p[2])
 
 def p_subscript_star(p):
     """
-    subscript-star   : array-subscript  subscript-star
-                    | struct-subscript subscript-star
+    subscript-star   : subscript-star array-subscript
+                    | subscript-star struct-subscript
                     | empty
     """
-    try:
-        p[0] = ('SUBSCRIPT', p[1], (p[2]))
-    except:
-        p[0] = None
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 def p_app_arg_expr(p):
     """
@@ -978,9 +965,9 @@ def p_app_arg_expr(p):
                    | LPAREN expr RPAREN
     """
     if len(p) == 3:
-        p[0] = ('APP_ARG', p[2], p[1])
+        p[0] = nodes.AppArg(p.lexpos(1) if p[1] else p.lexpos(2), p[2], p[1])
     elif len(p) == 4:
-        p[0] = ('APP_ARG', p[2])
+        p[0] = nodes.AppArg(p.lexpos(1), p[2], None)
     else:
         p[0] = p[1]
 
@@ -992,11 +979,243 @@ def p_opt_at(p):
     p[0] = p[1]
 
 
-def parse():
-    print('POEHALI')
+def p_error(token):
+    """
+    Method reports a syntax error, the error productions of statement-star and block then recover from it.
+    PLY does not call it again until three tokens have been shifted, so one error is not reported many times
+    :param token: unexpected token, None at the end of the input
+    """
+    if token is None:
+        sys.stderr.write('Syntax error at the end of the input\n')
+    else:
+        sys.stderr.write('Syntax error at line %d, token=%s\n' % (token.lineno, token.type))
+
+
+_parser = None
+
+
+def build_parser():
+    """
+    Method creates the LALR parser from the committed parsetab.py, once per process.
+    Tables are neither checked against the grammar nor written, run build_tables.py after changing the grammar
+    :return: parser
+    """
+    global _parser
+    if _parser is None:
+        _parser = yacc.yacc(write_tables=False, debug=False, optimize=True)
+        _parser.__class__ = RecoveringParser
+    return _parser
+
+
+# Replacements of the four "#--! TRACKING" blocks of LRParser.parseopt, in order: reduction, empty reduction,
+# end of an empty reduction and error recovery. Only the offset of the first token is kept
+_OFFSET_TRACKING = (
+    'sym.lexpos = targ[1].lexpos',
+    'sym.lexpos = lexer.lexpos',
+    'pass',
+    'lookahead.lexpos = sym.lexpos',
+)
+# Inserted after the lookahead is read when the parser has an expression sub-parser, see pratt.py.
+# Error recovery counts shifted tokens, so expressions are not handed off while it is going on
+_EXPRESSION_HANDOFF = """
+if state in expression_entries and ltype in expression_entries[state] and not errorcount:
+    result = expressions.parse(lookahead, get_token, lookaheadstack)
+    if result is not None:
+        sym = YaccSymbol()
+        sym.type = 'expr'
+        sym.value, sym.lexpos, lookahead = result
+        symstack.append(sym)
+        state = goto[state]['expr']
+        statestack.append(state)
+        continue
+"""
+# Replaces the end of the input case of PLY error recovery, which gives up and returns None, throwing away every
+# statement parsed so far. The stack is unwound to the top-level statement-star instead, where
+# "translation-unit : statement-star error" lets an error end the input
+_END_RECOVERY = """
+if lookahead.type == '$end':
+    while len(statestack) > 1 and '$end' not in actions.get(actions[statestack[-1]].get('error', -1), ()):
+        symstack.pop()
+        statestack.pop()
+    if len(statestack) <= 1:
+        return
+    state = statestack[-1]
+    lookaheadstack.append(lookahead)
+    lookahead = YaccSymbol()
+    lookahead.type = 'error'
+    lookahead.value = None
+    lookahead.lineno = lookahead.endlineno = lexer.lineno
+    lookahead.lexpos = lookahead.endlexpos = lexer.lexpos
+    continue
+"""
+_END_OF_INPUT = r'\n( *)if lookahead\.type == .\$end.:\n *# Whoa\. We.re really hosed here\. Bail out\n *return\n'
+_parse_offsets = {}
+
+
+def _source(method):
+    """
+    Method reads the source of a method up to the next line that is not indented deeper than its def,
+    inspect.getsource tokenizes the whole method and takes about as long as compiling it
+    :param method: function
+    :return: dedented source
+    """
+    code = method.__code__
+    lines = linecache.getlines(code.co_filename)[code.co_firstlineno - 1:]
+    indent = len(lines[0]) - len(lines[0].lstrip())
+    for end, line in enumerate(lines[1:], 1):
+        if line.strip() and len(line) - len(line.lstrip()) <= indent:
+            break
+    else:
+        end = len(lines)
+    return textwrap.dedent(''.join(lines[:end]).rstrip() + '\n')
+
+
+def _recover_at_end(source):
+    """
+    Method replaces the end of the input case of the error recovery in the source of a PLY parse method
+    :param source: source of the method
+    :return: new source, None if this PLY version has no such case
+    """
+    source, found = re.subn(_END_OF_INPUT, lambda match: '\n' + textwrap.indent(
+        _END_RECOVERY.lstrip(), match.group(1)), source, count=1)
+    return source if found else None
+
+
+def _method(method, name):
+    """
+    Method compiles a PLY parse method with the error recovery of _recover_at_end
+    :param method: method of yacc.LRParser
+    :param name: name of the new function
+    :return: function, the method itself if this PLY version differs
+    """
+    source = _recover_at_end(_source(method))
+    if source is None:
+        return method
+    namespace = dict(vars(yacc))
+    exec(source.replace('def %s(' % method.__name__, 'def %s(' % name, 1), namespace)
+    return namespace[name]
+
+
+def _lazy_method(name):
+    """
+    Method creates a stand-in that compiles a parse method with _method the first time it is called,
+    so a process pays only for the parse methods it uses
+    :param name: name of the method of yacc.LRParser
+    :return: function
+    """
+    def method(self, *args, **kwargs):
+        compiled = _method(getattr(yacc.LRParser, name), name)
+        setattr(RecoveringParser, name, compiled)
+        return compiled(self, *args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+class RecoveringParser(yacc.LRParser):
+    """
+    LRParser that recovers from a syntax error at the end of the input, class of the parser of build_parser()
+    """
+    parsedebug = _lazy_method('parsedebug')
+    parseopt = _lazy_method('parseopt')
+    parseopt_notrack = _lazy_method('parseopt_notrack')
+
+
+def _build_parse_offsets(handoff=False):
+    """
+    Method generates a parse method that tracks only the start offsets of the symbols, the way PLY generates
+    parseopt_notrack from parseopt: tracking=True also sets lineno, endlineno and endlexpos on every reduced symbol,
+    which costs about a third of the parse time, while the nodes only store offsets
+    :param handoff: let self.expressions parse the expressions, the parser must have that attribute
+    :return: function with the signature of LRParser.parse, or None if this PLY version has no tracking markers
+    """
+    source = _recover_at_end(_source(yacc.LRParser.parseopt))
+    if source is None:
+        return None
+    blocks = re.findall(r'( *)#--! TRACKING\n.*?#--! TRACKING', source, re.S)
+    if len(blocks) != len(_OFFSET_TRACKING):
+        return None
+    replacements = iter(_OFFSET_TRACKING)
+    source = re.sub(r'( *)#--! TRACKING\n.*?#--! TRACKING',
+                    lambda match: match.group(1) + next(replacements), source, flags=re.S)
+    if handoff:
+        source, found = re.subn(r'\n( *)ltype = lookahead\.type\n', lambda match: match.group(0) + textwrap.indent(
+            _EXPRESSION_HANDOFF.lstrip(), match.group(1)), source, count=1)
+        source, started = re.subn(r'\n( *)(defaulted_states = self\.defaulted_states.*\n)', lambda match: (
+            match.group(0) + match.group(1) + 'expressions = self.expressions\n' + match.group(1) +
+            'expression_entries = expressions.entries\n'), source, count=1)
+        if not found or not started:
+            return None
+    namespace = dict(vars(yacc))
+    exec(source.replace('def parseopt(', 'def parse_offsets(', 1), namespace)
+    return namespace['parse_offsets']
+
+
+def build_offset_parser(expressions=None):
+    """
+    Method creates a parser sharing the LALR tables of build_parser() that propagates token offsets to the nodes
+    at a fraction of the cost of tracking=True. Lines and columns are not tracked, see line_index.LineIndex
+    :param expressions: pratt.ExpressionParser the expressions are handed off to, the LALR tables parse them by default
+    :return: parser
+    """
+    handoff = expressions is not None
+    parser = copy.copy(build_parser())
+    if handoff not in _parse_offsets:
+        _parse_offsets[handoff] = _build_parse_offsets(handoff) or yacc.LRParser.parseopt
+    parser.parse = types.MethodType(_parse_offsets[handoff], parser)
+    parser.expressions = expressions
+    return parser
+
+
+STATEMENT_STAR = 'statement-star -> statement-star statement'
+
+
+def _after_top_level(action, callback):
+    def reduce(p):
+        action(p)
+        if p.stack[-1].type == '$end':  # Only top-level statements have nothing but $end below them
+            callback(p)
+    return reduce
+
+
+def on_top_level_statement(parser, callback):
+    """
+    Method makes a parser call back every time a top-level statement is appended to the statement list.
+    The productions are copied, so other parsers sharing the LALR tables are not affected
+    :param parser: copy of the parser of build_parser() or build_offset_parser()
+    :param callback: function called with the YaccProduction of "statement-star statement" after its action,
+                     p[0] is the list of statements and p[0][-1] the new one
+    :return: parser
+    """
+    parser.productions = list(parser.productions)
+    for index, production in enumerate(parser.productions):
+        if production.str == STATEMENT_STAR:
+            production = copy.copy(production)
+            production.callable = _after_top_level(production.callable, callback)
+            parser.productions[index] = production
+    return parser
+
+
+def build_tables():
+    """
+    Method regenerates parsetab.py and the parser.out debug file from the grammar
+    """
+    yacc.yacc(write_tables=True, debug=True)
+
+
+def parse(out='out.txt', indent=4, compress=None, stdout=False):
+    """
+    Method parses in.txt and streams the JSON AST to a file
+    :param out: path to the output file, gzipped when it ends with .gz
+    :param indent: number of spaces per level, None for compact output
+    :param compress: force gzip on or off
+    :param stdout: also write the JSON AST to stdout
+    :return: AST
+    """
     lex = lexer.tokenize()
-    parser = yacc.yacc()
-    ast = parser.parse(lexer=lex, debug=1)
-    file = open('out.txt', 'w')
-    file.write(json.dumps(ast, indent=4))
-    print(json.dumps(ast, indent=4))
\ No newline at end of file
+    parser = build_parser()
+    ast = parser.parse(lexer=lex, tracking=True)
+    ast_json.dump(ast, out, indent, compress)
+    if stdout:
+        ast_json.write_json(ast, sys.stdout, indent)
+        print()
+    return ast